@@ -0,0 +1,44 @@
+"""Demo showing how to send logging output to a Text widget with TextHandler"""
+
+import logging
+import threading
+import time
+
+import guitk as ui
+
+logger = logging.getLogger(__name__)
+
+
+def worker():
+    """Log from a background thread"""
+    for i in range(1, 101):
+        if i % 25 == 0:
+            logger.warning("worker reached %s", i)
+        else:
+            logger.info("worker step %s", i)
+        time.sleep(0.05)
+    logger.error("worker done")
+
+
+class LogWindow(ui.Window):
+    def config(self):
+        self.title = "TextHandler"
+        with ui.VLayout():
+            ui.Text(key="log", width=60, height=20, disabled=True, vscrollbar=True)
+            ui.Button("Start worker", key="START")
+
+    def setup(self):
+        handler = ui.TextHandler(self["log"])
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(threadName)s %(levelname)s %(message)s")
+        )
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+    @ui.on(key="START")
+    def on_start(self):
+        threading.Thread(target=worker, daemon=True).start()
+
+
+if __name__ == "__main__":
+    LogWindow().run()
@@ -0,0 +1,37 @@
+"""Demo showing how to run a command and display its output with ProcessOutput"""
+
+import guitk as ui
+
+
+class RunCommand(ui.Window):
+    def config(self):
+        self.title = "ProcessOutput"
+        with ui.VLayout():
+            with ui.HStack():
+                ui.LabelEntry("Command", key="COMMAND", default="ls -l /", width=40)
+                ui.Button("Run", key="RUN")
+                ui.Button("Stop", key="STOP")
+            ui.ProcessOutput(key="OUTPUT", width=100, height=30)
+            ui.Label("", key="STATUS")
+
+    @ui.on(key="RUN")
+    def on_run(self):
+        if not self["OUTPUT"].running:
+            self["OUTPUT"].run(self["COMMAND"].value, shell=True)
+            self["STATUS"].value = "Running..."
+
+    @ui.on(key="STOP")
+    def on_stop(self):
+        self["OUTPUT"].terminate()
+
+    @ui.on(key="OUTPUT", event_type=ui.EventType.ProcessProgress)
+    def on_progress(self, event):
+        self["STATUS"].value = f"Running... {event.payload:,} bytes"
+
+    @ui.on(key="OUTPUT", event_type=ui.EventType.ProcessExit)
+    def on_exit(self, event):
+        self["STATUS"].value = f"Exited with code {event.payload}"
+
+
+if __name__ == "__main__":
+    RunCommand().run()
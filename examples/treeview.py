@@ -16,22 +16,13 @@ class ShowMeATree(Window):
             )
 
     def list_files(self, path, tree):
-        files = pathlib.Path(path).iterdir()
-        pyfiles = []
-        for f in files:
-            if f.suffix == ".py":
-                pyfiles.append(str(f))
-                tags = ["pyfile"]
-            else:
-                tags = []
-            tree.insert(
-                "",
-                "end",
-                iid=str(f),
-                tags=tags,
-                text=str(f),
-                values=(str(f), f.stat().st_size),
-            )
+        files = list(pathlib.Path(path).iterdir())
+        pyfiles = [str(f) for f in files if f.suffix == ".py"]
+        self["TREE"].insert_rows(
+            [(str(f), f.stat().st_size) for f in files],
+            iids=[str(f) for f in files],
+            tags=lambda row: ["pyfile"] if row[0].endswith(".py") else [],
+        )
         tree.selection_set(pyfiles)
 
     def setup(self):
@@ -49,7 +40,7 @@ class ShowMeATree(Window):
             self["TREE"].sort_on_column(
                 "Size",
                 reverse=self.data["tree_sort_size_reverse"],
-                key=lambda x: int(x[0]),
+                key="numeric",
             )
             self.data["tree_sort_size_reverse"] = not self.data[
                 "tree_sort_size_reverse"
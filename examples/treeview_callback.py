@@ -60,7 +60,7 @@ class ShowMeATree(ui.Window):
         self["TREE"].sort_on_column(
             "Size",
             reverse=self.data["tree_sort_size_reverse"],
-            key=lambda x: int(x[0]),
+            key="numeric",
         )
         self.data["tree_sort_size_reverse"] = not self.data["tree_sort_size_reverse"]
 
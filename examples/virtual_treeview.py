@@ -0,0 +1,40 @@
+""" Demonstrates use of guitk.VirtualTreeview widget to display a large table """
+
+import guitk as ui
+
+
+class BigTable(ui.Window):
+    def config(self):
+        self.title = "Virtual Tree View"
+        with ui.VLayout():
+            ui.VirtualTreeview(
+                headings=["Name", "Size"],
+                rows=[(f"file{i}.txt", (i * 7919) % 100_000) for i in range(500_000)],
+                key="TREE",
+                height=20,
+            )
+
+    def setup(self):
+        self.reverse = {"Name": False, "Size": False}
+        self["TREE"].bind_heading("Name", "TREE_NAME")
+        self["TREE"].bind_heading("Size", "TREE_SIZE")
+
+    @ui.on(key="TREE_NAME")
+    def on_sort_name(self):
+        self.sort("Name")
+
+    @ui.on(key="TREE_SIZE")
+    def on_sort_size(self):
+        self.sort("Size")
+
+    def sort(self, column):
+        self["TREE"].sort_on_column(column, reverse=self.reverse[column])
+        self.reverse[column] = not self.reverse[column]
+
+    @ui.on(key="TREE", event_type=ui.EventType.TreeviewSelect)
+    def on_select(self):
+        print(f"You selected row(s): {self['TREE'].value}")
+
+
+if __name__ == "__main__":
+    BigTable().run()
@@ -0,0 +1,47 @@
+"""Demo showing how to use VirtualVStack to display a large list of items"""
+
+import guitk as ui
+
+
+def make_row():
+    """Create a row widget to display an item"""
+    with ui.HStack() as row:
+        ui.Label("", width=8)
+        ui.Label("")
+    return row
+
+
+def update_row(row, item):
+    """Display item in row"""
+    index, text = item
+    row[0].value = str(index)
+    row[1].value = text
+
+
+class VirtualList(ui.Window):
+    def config(self):
+        self.title = "VirtualVStack"
+        self.size = (400, 400)
+        with ui.VLayout():
+            ui.Label("50,000 rows but only the visible rows are created")
+            self.items = ui.VirtualVStack(
+                data=[(i, f"This is line {i}") for i in range(50_000)],
+                row_factory=make_row,
+                row_update=update_row,
+                key="items",
+            )
+            with ui.HStack():
+                ui.Button("Top", key="top")
+                ui.Button("Bottom", key="bottom")
+
+    @ui.on(key="top")
+    def on_top(self):
+        self.items.scroll_to(0)
+
+    @ui.on(key="bottom")
+    def on_bottom(self):
+        self.items.scroll_to(-1)
+
+
+if __name__ == "__main__":
+    VirtualList().run()
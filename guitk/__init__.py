@@ -8,18 +8,20 @@
 # TODO: add style to all controls
 # TODO: standardize value_type
 
+from ._busy import busy
 from ._debug import debug, debug_watch, is_debug, set_debug
 from ._on import on
 from .basewidget import BaseWidget
-from .containers import HGrid, HStack, VGrid, VStack
+from .containers import HGrid, HStack, VGrid, VirtualVStack, VStack
 from .debugwindow import DebugWindow
 from .events import Event, EventCommand, EventType
 from .frame import Frame, LabelFrame
 from .image import Image
 from .layout import HLayout, VLayout
+from .loghandler import TextHandler
 from .menu import Command, Menu, MenuBar, MenuSeparator
 from .spacer import HSpacer, VSpacer
-from .tk_text import Output, Text
+from .tk_text import Output, ProcessOutput, Text
 from .tkroot import *
 from .ttk_button import BrowseDirectoryButton, BrowseFileButton, Button
 from .ttk_checkbutton import Checkbutton, CheckButton
@@ -45,7 +47,7 @@ from .ttk_radiobutton import Radiobutton, RadioButton
 from .ttk_scale import Scale
 from .ttk_separator import HSeparator, VSeparator
 from .ttk_spinbox import Spinbox, SpinBox
-from .ttk_treeview import Listbox, ListBox, Treeview, TreeView
+from .ttk_treeview import Listbox, ListBox, Treeview, TreeView, VirtualTreeview
 from .widget import Widget, widget_class_factory
 from .window import Window
 
@@ -94,6 +96,7 @@ __all__ = [
     "PROGRESS_INDETERMINATE",
     "PanedWindow",
     "Panedwindow",
+    "ProcessOutput",
     "ProgressBar",
     "Progressbar",
     "RadioButton",
@@ -102,6 +105,7 @@ __all__ = [
     "SpinBox",
     "Spinbox",
     "Text",
+    "TextHandler",
     "TreeView",
     "Treeview",
     "VGrid",
@@ -112,8 +116,11 @@ __all__ = [
     "VSpacer",
     "VStack",
     "VTab",
+    "VirtualTreeview",
+    "VirtualVStack",
     "Widget",
     "Window",
+    "busy",
     "debug",
     "debug_watch",
     "is_debug",
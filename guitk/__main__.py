@@ -32,22 +32,13 @@ def get_docstring(name):
 
 def list_files(path: str, tree: Treeview):
     """list files in a directory and add to Treeview tree"""
-    files = pathlib.Path(path).iterdir()
-    pyfiles = []
-    for f in files:
-        if f.suffix == ".py":
-            pyfiles.append(str(f))
-            tags = ["pyfile"]
-        else:
-            tags = []
-        tree.widget.insert(
-            "",
-            "end",
-            iid=str(f),
-            tags=tags,
-            text=str(f),
-            values=(str(f), f.stat().st_size),
-        )
+    files = list(pathlib.Path(path).iterdir())
+    pyfiles = [str(f) for f in files if f.suffix == ".py"]
+    tree.insert_rows(
+        [(str(f), f.stat().st_size) for f in files],
+        iids=[str(f) for f in files],
+        tags=[["pyfile"] if f.suffix == ".py" else [] for f in files],
+    )
     tree.widget.selection_set(pyfiles)
 
 
@@ -296,7 +287,7 @@ class Demo(Window):
         self.get("treeview").sort_on_column(
             "Size",
             reverse=self.tree_sort_size_reverse,
-            key=lambda x: int(x[0]),
+            key="numeric",
         )
         self.tree_sort_size_reverse = not self.tree_sort_size_reverse
 
@@ -0,0 +1,159 @@
+"""Block input to a window and show a busy cursor with Tk's busy command """
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import tkinter as tk
+from typing import Any, Callable, TypeVar, cast
+
+BUSY_CURSOR = "watch"
+""" default cursor shown while a window is busy """
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _BusyState:
+    """Tracks how many holds a window's busy state has; the window is made busy by the
+    first hold and made available again when the last hold is released"""
+
+    def __init__(self, widget: tk.Misc, toplevel: tk.Toplevel | tk.Tk):
+        self._widget = widget
+        """ widget covered by the busy window; input to it and its children is blocked """
+
+        self._toplevel = toplevel
+        self._count = 0
+        self._previous_cursor: str | None = None
+        """ toplevel cursor to restore if Tk's busy command isn't available """
+
+        self._forget_id: str | None = None
+        """ after_idle() id of the pending _forget() once all holds are released """
+
+    @property
+    def busy(self) -> bool:
+        return self._count > 0
+
+    def hold(self, cursor: str = BUSY_CURSOR):
+        """Make the window busy, or add a hold if it's already busy"""
+        self._count += 1
+        if self._count > 1:
+            return
+        if self._forget_id is not None:
+            # released but not yet made available so it's still busy
+            self._widget.after_cancel(self._forget_id)
+            self._forget_id = None
+            return
+        try:
+            self._widget.tk.call("tk", "busy", "hold", self._widget, "-cursor", cursor)
+        except tk.TclError:
+            # Tk < 8.6 doesn't have tk busy so just show the cursor
+            self._previous_cursor = self._toplevel.cget("cursor")
+            self._toplevel.configure(cursor=cursor)
+        # show the cursor and start blocking input now rather than when next idle
+        self._widget.update_idletasks()
+
+    def release(self):
+        """Remove a hold; the window is made available when all holds are released"""
+        if self._count == 0:
+            return
+        self._count -= 1
+        if self._count > 0:
+            return
+        if self._previous_cursor is not None:
+            self._forget()
+            return
+        # Tk runs idle callbacks only once there are no pending events, so input that
+        # arrived while busy is first delivered to the busy window, which discards it,
+        # rather than replayed once the window is available
+        self._forget_id = self._widget.after_idle(self._forget)
+
+    def release_all(self):
+        """Remove all holds and make the window available now"""
+        if not self._count and self._forget_id is None:
+            return
+        self._count = 0
+        if self._forget_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._widget.after_cancel(self._forget_id)
+        self._forget()
+
+    def _forget(self):
+        """Make the window available"""
+        self._forget_id = None
+        with contextlib.suppress(tk.TclError):
+            if self._previous_cursor is not None:
+                self._toplevel.configure(cursor=self._previous_cursor)
+                self._previous_cursor = None
+                return
+            self._widget.tk.call("tk", "busy", "forget", self._widget)
+
+
+class _Busy(contextlib.ContextDecorator):
+    """Context manager and decorator returned by Window.busy()"""
+
+    def __init__(self, state: _BusyState, cursor: str):
+        self._state = state
+        self._cursor = cursor
+
+    def __enter__(self):
+        self._state.hold(self._cursor)
+        return self
+
+    def __exit__(self, *exc: Any):
+        self._state.release()
+        return False
+
+    def __call__(self, func: _F) -> _F:
+        if not inspect.iscoroutinefunction(func):
+            return super().__call__(func)
+
+        # hold the window busy until the coroutine finishes, not just until it's created
+        @functools.wraps(func)
+        async def _wrapper(*args, **kwargs):
+            with self._recreate_cm():
+                return await func(*args, **kwargs)
+
+        return cast(_F, _wrapper)
+
+
+def busy(
+    func: Callable[..., Any] | None = None, *, cursor: str = BUSY_CURSOR
+) -> Callable[..., Any]:
+    """Decorator for Window methods, such as event handlers, that holds the window busy
+    while the method runs (or, for async methods, until the coroutine finishes).
+
+    Args:
+        func (Callable | None): The method to decorate.
+        cursor (str, optional): Cursor shown while busy. Defaults to "watch".
+
+    Note:
+        Can be used as @busy or @busy(cursor="clock") and combined with @on, for example:
+
+        ```python
+        @on(key="Submit")
+        @busy
+        def on_submit(self):
+            ...
+        ```
+
+        See Window.busy() for details.
+    """
+    if func is None:
+        return functools.partial(busy, cursor=cursor)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def _async_wrapper(self, *args, **kwargs):
+            with self.busy(cursor):
+                return await func(self, *args, **kwargs)
+
+        return _async_wrapper
+
+    @functools.wraps(func)
+    def _wrapper(self, *args, **kwargs):
+        with self.busy(cursor):
+            return func(self, *args, **kwargs)
+
+    return _wrapper
@@ -12,6 +12,10 @@ from .types import CommandType, DecoratedType
 def on(
     key: Hashable | None = None,
     event_type: EventType | None = None,
+    debounce: int | None = None,
+    throttle: int | None = None,
+    leading: bool | None = None,
+    trailing: bool | None = None,
 ) -> CommandType:
     """Decorator to declare that the method is an event handler.
 
@@ -40,13 +44,32 @@ def on(
         @on(event_type=EventType.Any)
         def any_event(self) -> None:
             ...
+
+        # Run the search only once the user stops typing for 300 ms
+        @on(key="SEARCH", event_type=EventType.KeyRelease, debounce=300)
+        def search(self) -> None:
+            ...
+
+        # async def handlers are run as asyncio tasks inside the Tk mainloop
+        @on(key="FETCH")
+        async def fetch(self) -> None:
+            await asyncio.sleep(1)
         ```
 
     Args:
         key (Hashable, optional): Key of the event to handle. Defaults to None.
         event_type (EventType, optional): Type of the event to handle. Defaults to None.
+        debounce (int, optional): If set, call the method only once events have stopped
+            arriving for debounce milliseconds. Defaults to None.
+        throttle (int, optional): If set, call the method at most once every throttle
+            milliseconds. Defaults to None.
+        leading (bool, optional): Call the method for the first event of a burst.
+            Defaults to None which is False for debounce and True for throttle.
+        trailing (bool, optional): Call the method for the last event of a burst.
+            Defaults to None which is True.
 
     Note: Either `key` or `event_type` must be specified and both can be specified.
+        Only one of `debounce` or `throttle` can be specified.
     """
     # Inspired by the implementation of the `on` decorator in textual
     # https://github.com/Textualize/textual
@@ -57,15 +80,23 @@ def on(
 
     if not key and not event_type:
         raise ValueError("Either key or event_type (or both) must be specified")
+    rate_limit = {
+        "debounce": debounce,
+        "throttle": throttle,
+        "leading": leading,
+        "trailing": trailing,
+    }
 
     def decorate(method: Callable[..., DecoratedType]):
         if not hasattr(method, "_guitk_event_handlers"):
             method._guitk_event_handlers = []
-        getattr(method, "_guitk_event_handlers").append((key, event_type))
+        getattr(method, "_guitk_event_handlers").append(
+            (key, event_type, rate_limit)
+        )
 
         @wraps(method)
         def wrapper(*args, **kwargs) -> DecoratedType:
-            """Store key, event_type, return callable unaltered."""
+            """Store key, event_type, rate_limit, return callable unaltered."""
             return method(*args, **kwargs)
 
         return wrapper
@@ -0,0 +1,168 @@
+"""Read the output of a child process without blocking the Tk thread """
+
+from __future__ import annotations
+
+import codecs
+import contextlib
+import os
+import subprocess
+import threading
+import tkinter as tk
+from typing import IO, TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .tkroot import _TKRoot
+
+READ_SIZE = 65536
+""" maximum number of bytes read from a process's output at a time """
+
+EXIT_POLL_MS = 10
+""" milliseconds between checks for process exit once its output has closed """
+
+
+class _ProcessStream:
+    """Reads the stdout and stderr pipes of a process without blocking the Tk thread,
+    calling on_output(text, stream) on the Tk thread for each chunk of text read, where
+    stream is "stdout" or "stderr", and on_exit(returncode) once the process has exited
+    and all output has been read"""
+
+    def __init__(
+        self,
+        tkroot: _TKRoot,
+        process: subprocess.Popen,
+        on_output: Callable[[str, str], None],
+        on_exit: Callable[[int], None],
+        encoding: str = "utf-8",
+    ):
+        self.process = process
+        self.bytes_read = 0
+        """ total number of bytes read from the process """
+
+        self._tk = tkroot
+        self._on_output = on_output
+        self._on_exit = on_exit
+        self._pipes: dict[int, tuple[IO[bytes], str, codecs.IncrementalDecoder]] = {}
+        """ (pipe, stream name, decoder) for each pipe not yet closed, keyed by fd """
+        for pipe, stream in ((process.stdout, "stdout"), (process.stderr, "stderr")):
+            if pipe is not None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+                self._pipes[pipe.fileno()] = (pipe, stream, decoder)
+
+        self._use_filehandler = hasattr(tkroot.root.tk, "createfilehandler")
+        self._paused = False
+        self._resumed = threading.Event()
+        """ cleared while paused to stop reader threads """
+        self._resumed.set()
+        self._stopped = False
+
+    def start(self):
+        """Start reading the process's output"""
+        if not self._pipes:
+            self._wait()
+            return
+        for fd in self._pipes:
+            if self._use_filehandler:
+                # Tk calls _on_readable only when there's data so an idle process
+                # costs nothing
+                os.set_blocking(fd, False)
+                self._add_filehandler(fd)
+            else:
+                # Tk can't watch pipes on Windows so read in a thread instead
+                threading.Thread(
+                    target=self._read_thread, args=(fd,), daemon=True
+                ).start()
+
+    def pause(self):
+        """Stop reading output until resume() is called; the process blocks once the
+        pipe is full so output that can't be displayed yet doesn't use memory"""
+        if self._paused:
+            return
+        self._paused = True
+        self._resumed.clear()
+        if self._use_filehandler:
+            for fd in self._pipes:
+                self._remove_filehandler(fd)
+
+    def resume(self):
+        """Resume reading output after pause()"""
+        if not self._paused or self._stopped:
+            return
+        self._paused = False
+        self._resumed.set()
+        if self._use_filehandler:
+            for fd in self._pipes:
+                self._add_filehandler(fd)
+
+    def stop(self):
+        """Stop reading output and terminate the process if it's still running"""
+        self._stopped = True
+        self._resumed.set()
+        for fd, (pipe, _, _) in list(self._pipes.items()):
+            if self._use_filehandler:
+                self._remove_filehandler(fd)
+            with contextlib.suppress(OSError):
+                pipe.close()
+        self._pipes.clear()
+        if self.process.poll() is None:
+            with contextlib.suppress(OSError):
+                self.process.terminate()
+
+    def _add_filehandler(self, fd: int):
+        self._tk.root.tk.createfilehandler(fd, tk.READABLE, self._on_readable)
+
+    def _remove_filehandler(self, fd: int):
+        with contextlib.suppress(ValueError, tk.TclError):
+            self._tk.root.tk.deletefilehandler(fd)
+
+    def _on_readable(self, fd: int, mask: int):
+        """Called by Tk when a pipe is readable"""
+        try:
+            data = os.read(fd, READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        self._on_data(fd, data)
+
+    def _read_thread(self, fd: int):
+        """Read a pipe in a thread and hand the data to the Tk thread"""
+        call_soon = self._tk.call_soon_threadsafe
+        data = b""
+        with contextlib.suppress(OSError):
+            while not self._stopped and (data := os.read(fd, READ_SIZE)):
+                call_soon(self._on_data, fd, data)
+                self._resumed.wait()
+        if not self._stopped:
+            call_soon(self._on_data, fd, b"")
+
+    def _on_data(self, fd: int, data: bytes):
+        """Pass text read from pipe fd to on_output; empty data means the pipe closed"""
+        if fd not in self._pipes:
+            # stopped
+            return
+        pipe, stream, decoder = self._pipes[fd]
+        self.bytes_read += len(data)
+        if text := decoder.decode(data, final=not data):
+            self._on_output(text, stream)
+        if data:
+            return
+
+        # end of output
+        if self._use_filehandler:
+            self._remove_filehandler(fd)
+        del self._pipes[fd]
+        with contextlib.suppress(OSError):
+            pipe.close()
+        if not self._pipes:
+            self._wait()
+
+    def _wait(self):
+        """Call on_exit once the process has exited"""
+        if self._stopped:
+            return
+        returncode = self.process.poll()
+        if returncode is None:
+            # output closed before the process exited
+            self._tk.root.after(EXIT_POLL_MS, self._wait)
+            return
+        self._on_exit(returncode)
@@ -0,0 +1,86 @@
+"""Debounce and throttle event handlers bound with @on, bind_command, or command= """
+
+from __future__ import annotations
+
+import contextlib
+import tkinter as tk
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from .events import Event
+    from .window import Window
+
+
+class _RateLimiter:
+    """Wraps an event callback so it's called at most once per wait milliseconds.
+
+    If debouncing, the callback is called once events have stopped arriving for wait ms;
+    by default on the trailing edge only (the last event of a burst).
+
+    If throttling, the callback is called at most once every wait ms while events keep
+    arriving; by default on both the leading edge (the first event) and the trailing edge
+    (the last event received during each wait ms).
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        callback: Callable[[Event], Any],
+        wait: int,
+        throttle: bool = False,
+        leading: bool | None = None,
+        trailing: bool | None = None,
+    ):
+        self.window = window
+        self.callback = callback
+        self.wait = wait
+        self.throttle = throttle
+        self.leading = throttle if leading is None else leading
+        self.trailing = True if trailing is None else trailing
+
+        self._after_id: str | None = None
+        """ after() id of the timer that ends the current wait """
+
+        self._pending: Event | None = None
+        """ most recent event received during the current wait which hasn't been handled """
+
+    def __call__(self, event: Event):
+        if self._after_id is None:
+            # first event of a burst
+            if self.leading:
+                self.callback(event)
+            else:
+                self._pending = event
+            self._start_timer()
+            return
+
+        self._pending = event
+        if not self.throttle:
+            # debounce: wait until events stop for wait ms
+            self._cancel_timer()
+            self._start_timer()
+
+    def cancel(self):
+        """Drop any pending event and stop the timer"""
+        self._pending = None
+        self._cancel_timer()
+
+    def _start_timer(self):
+        self._after_id = self.window._tk.root.after(self.wait, self._on_timer)
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self.window._tk.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _on_timer(self):
+        """Called when wait ms have elapsed since the timer started"""
+        self._after_id = None
+        event, self._pending = self._pending, None
+        if event is None or not self.trailing or self.window._destroyed:
+            return
+        self.callback(event)
+        if self.throttle:
+            # keep calls to callback at least wait ms apart
+            self._start_timer()
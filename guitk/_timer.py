@@ -0,0 +1,153 @@
+"""Timer scheduler that runs all of a window's timers from a single Tk after() callback """
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import itertools
+import time
+import tkinter as tk
+from typing import Any, Callable, Hashable
+
+TIMER_SLACK_MS = 2
+""" timers due within this many milliseconds of each other are run together """
+
+
+class _Timer:
+    """A timer scheduled with _TimerScheduler"""
+
+    __slots__ = ("timer_id", "callback", "interval", "deadline", "cancelled")
+
+    def __init__(
+        self,
+        timer_id: Hashable,
+        callback: Callable[[], Any],
+        interval: float | None,
+        deadline: float,
+    ):
+        self.timer_id = timer_id
+        self.callback = callback
+        self.interval = interval
+        """ seconds between runs if repeating, otherwise None """
+
+        self.deadline = deadline
+        """ time.monotonic() when the timer is next due """
+
+        self.cancelled = False
+
+
+class _TimerScheduler:
+    """Runs timers from a heap ordered by deadline so that however many timers there are,
+    only one Tk after() callback is pending, for the nearest deadline.
+    Scheduling and cancelling a timer are O(log n)."""
+
+    def __init__(self, tkroot: tk.Tk):
+        self._root = tkroot
+        self._heap: list[tuple[float, int, _Timer]] = []
+        """ (deadline, sequence, timer); cancelled timers are removed lazily """
+
+        self._timers: dict[Hashable, _Timer] = {}
+        """ timers which haven't been cancelled or finished, keyed by timer id """
+
+        self._seq = itertools.count()
+        self._after_id: str | None = None
+        self._after_deadline: float | None = None
+        """ deadline the pending after() callback was scheduled for """
+
+    def schedule(
+        self,
+        timer_id: Hashable,
+        delay: int,
+        callback: Callable[[], Any],
+        repeat: bool = False,
+    ):
+        """Call callback after delay milliseconds, then every delay milliseconds if repeat"""
+        if timer_id in self._timers:
+            raise ValueError(f"Timer {timer_id} already exists")
+        interval = delay / 1000
+        timer = _Timer(
+            timer_id, callback, interval if repeat else None, time.monotonic() + interval
+        )
+        self._timers[timer_id] = timer
+        self._push(timer)
+        self._schedule_after()
+
+    def cancel(self, timer_id: Hashable):
+        """Cancel a timer; raises KeyError if timer_id is not scheduled"""
+        timer = self._timers.pop(timer_id)
+        timer.cancelled = True
+        if len(self._heap) > 2 * len(self._timers) + 16:
+            # drop cancelled timers so the heap doesn't grow with cancellations
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+        self._schedule_after()
+
+    def cancel_all(self):
+        """Cancel all timers"""
+        for timer in self._timers.values():
+            timer.cancelled = True
+        self._timers.clear()
+        self._heap.clear()
+        self._cancel_after()
+
+    def __contains__(self, timer_id: Hashable) -> bool:
+        return timer_id in self._timers
+
+    def _push(self, timer: _Timer):
+        heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer))
+
+    def _cancel_after(self):
+        if self._after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._root.after_cancel(self._after_id)
+            self._after_id = self._after_deadline = None
+
+    def _schedule_after(self):
+        """Make sure the after() callback is scheduled for the nearest deadline"""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            self._cancel_after()
+            return
+        deadline = heap[0][0]
+        if self._after_id is not None:
+            if self._after_deadline <= deadline:
+                # already scheduled in time
+                return
+            self._cancel_after()
+        delay = max(0, round((deadline - time.monotonic()) * 1000))
+        self._after_id = self._root.after(delay, self._run)
+        self._after_deadline = deadline
+
+    def _run(self):
+        """Run all timers which are due"""
+        self._after_id = self._after_deadline = None
+        now = time.monotonic()
+        due_by = now + TIMER_SLACK_MS / 1000
+        heap = self._heap
+        due: list[_Timer] = []
+        while heap and heap[0][0] <= due_by:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                continue
+            due.append(timer)
+            if timer.interval is not None:
+                # keep a steady period but don't try to catch up on missed runs
+                timer.deadline += timer.interval
+                if timer.deadline <= now:
+                    timer.deadline = now + timer.interval
+                self._push(timer)
+        for timer in due:
+            if timer.cancelled:
+                # cancelled by a timer that ran before it
+                continue
+            if timer.interval is None:
+                # one-shot timer is finished
+                del self._timers[timer.timer_id]
+                timer.cancelled = True
+            try:
+                timer.callback()
+            except Exception as e:
+                self._root.report_callback_exception(type(e), e, e.__traceback__)
+        self._schedule_after()
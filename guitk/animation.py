@@ -0,0 +1,213 @@
+""" Frame ticker and tweens to animate widget properties """
+
+from __future__ import annotations
+
+import contextlib
+import time
+import tkinter as tk
+from typing import Any, Callable, Union
+
+from .tkroot import _TKRoot
+
+__all__ = ["Animation", "EASINGS", "FrameTicker"]
+
+EasingType = Union[str, Callable[[float], float]]
+
+EASINGS: dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: t * (2 - t),
+    "ease_in_out": lambda t: 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t,
+}
+""" easing functions by name; each maps the fraction of time elapsed (0 to 1) to
+    the fraction of the change to apply (0 to 1) """
+
+
+class FrameTicker:
+    """Singleton that calls every active Animation once per frame from a single Tk after()
+    callback; it stops ticking when there are no active animations"""
+
+    def __new__(cls, *args, **kwargs):
+        """create new object or return instance of already created singleton"""
+        if not hasattr(cls, "instance") or not cls.instance:
+            cls.instance = super().__new__(cls)
+
+        return cls.instance
+
+    def __init__(self):
+        if hasattr(self, "_animations"):
+            return
+        self._animations: list[Animation] = []
+        self._fps = 60
+        self._after_id: str | None = None
+        self._next_frame: float = 0.0
+        """ time.monotonic() when the next frame is due """
+
+    @property
+    def fps(self) -> int:
+        """Maximum number of frames per second"""
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps: int):
+        if fps <= 0:
+            raise ValueError("fps must be > 0")
+        self._fps = fps
+
+    @property
+    def active(self) -> bool:
+        """Return True if any animations are running"""
+        return bool(self._animations)
+
+    def add(self, animation: Animation):
+        """Start calling animation each frame"""
+        self._animations.append(animation)
+        if self._after_id is None:
+            self._next_frame = time.monotonic()
+            self._after_id = _TKRoot().root.after_idle(self._tick)
+
+    def remove(self, animation: Animation):
+        """Stop calling animation"""
+        with contextlib.suppress(ValueError):
+            self._animations.remove(animation)
+        if not self._animations and self._after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                _TKRoot().root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        """Advance all animations to the current time then schedule the next frame"""
+        self._after_id = None
+        now = time.monotonic()
+        for animation in list(self._animations):
+            if not animation._step(now):
+                with contextlib.suppress(ValueError):
+                    self._animations.remove(animation)
+        if not self._animations:
+            return
+
+        frame = 1 / self._fps
+        self._next_frame += frame
+        if self._next_frame <= now:
+            # behind schedule: skip the missed frames rather than running them late
+            self._next_frame = now + frame
+        delay = max(1, round((self._next_frame - time.monotonic()) * 1000))
+        self._after_id = _TKRoot().root.after(delay, self._tick)
+
+
+class Animation:
+    """Tween from start to end over duration milliseconds, calling setter with the
+    value for each frame. Numbers, sequences of numbers, and colors ("#rrggbb" or
+    color names) can be animated."""
+
+    def __init__(
+        self,
+        setter: Callable[[Any], Any],
+        start: Any,
+        end: Any,
+        duration: int = 250,
+        easing: EasingType = "ease_in_out",
+        on_done: Callable[[], Any] | None = None,
+        widget: tk.Misc | None = None,
+    ):
+        """Create an Animation; call start() to run it.
+
+        Args:
+            setter (Callable): Called with the value for each frame.
+            start (Any): Value at the start of the animation.
+            end (Any): Value at the end of the animation.
+            duration (int, optional): Length of the animation in milliseconds. Defaults to 250.
+            easing (str | Callable, optional): Name of an easing function in EASINGS or a
+                function mapping time elapsed to change applied, both from 0 to 1.
+                Defaults to "ease_in_out".
+            on_done (Callable | None, optional): Called when the animation finishes (but
+                not if it is cancelled). Defaults to None.
+            widget (tk.Misc | None, optional): Tk widget used to convert color names; the
+                animation stops if the widget is destroyed. Defaults to None.
+        """
+        self.setter = setter
+        self.duration = max(duration, 0) / 1000
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.on_done = on_done
+        self.done = False
+        """ True when the animation has finished or was cancelled """
+
+        self._widget = widget
+        self._interpolate = _interpolator(start, end, widget or _TKRoot().root)
+        self._end = end
+        self._start_time: float = 0.0
+        """ time.monotonic() when start() was called """
+
+    def start(self) -> Animation:
+        """Start running the animation"""
+        self._start_time = time.monotonic()
+        FrameTicker().add(self)
+        return self
+
+    def cancel(self):
+        """Stop the animation, leaving the value where it is"""
+        self.done = True
+        FrameTicker().remove(self)
+
+    def _step(self, now: float) -> bool:
+        """Set the value for time now; returns False once the animation is done"""
+        if self.done:
+            return False
+        elapsed = now - self._start_time
+        fraction = 1.0 if elapsed >= self.duration else elapsed / self.duration
+        try:
+            if self._widget is not None and not self._widget.winfo_exists():
+                self.done = True
+                return False
+            if fraction >= 1.0:
+                self.setter(self._end)
+            else:
+                self.setter(self._interpolate(self.easing(fraction)))
+        except tk.TclError:
+            # widget was destroyed
+            self.done = True
+            return False
+        except Exception as e:
+            self.done = True
+            _TKRoot().root.report_callback_exception(type(e), e, e.__traceback__)
+            return False
+        if fraction < 1.0:
+            return True
+        self.done = True
+        if self.on_done:
+            # report any error, including a TclError, raised by the caller's callback
+            try:
+                self.on_done()
+            except Exception as e:
+                _TKRoot().root.report_callback_exception(type(e), e, e.__traceback__)
+        return False
+
+
+def _interpolator(start: Any, end: Any, widget: tk.Misc) -> Callable[[float], Any]:
+    """Return a function that returns the value a fraction of the way from start to end"""
+    if not isinstance(start, (int, float, tuple, list)):
+        # values read from Tk may be strings or Tcl objects
+        start = str(start)
+        if isinstance(end, (tuple, list)):
+            start = start.split()
+    if isinstance(end, str):
+        # color
+        start_rgb = [c / 257 for c in widget.winfo_rgb(start)]
+        end_rgb = [c / 257 for c in widget.winfo_rgb(end)]
+
+        def _color(fraction: float) -> str:
+            rgb = (round(s + (e - s) * fraction) for s, e in zip(start_rgb, end_rgb))
+            return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+        return _color
+
+    if isinstance(end, (tuple, list)):
+        if isinstance(start, (int, float)):
+            start = [start] * len(end)
+        numbers = [_interpolator(s, e, widget) for s, e in zip(start, end)]
+        return lambda fraction: type(end)(number(fraction) for number in numbers)
+
+    start = float(start)
+    if isinstance(end, int):
+        return lambda fraction: round(start + (end - start) * fraction)
+    return lambda fraction: start + (end - start) * fraction
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import tkinter as tk
 from typing import TYPE_CHECKING, Any, Callable, Hashable
 
 from guitk.tkroot import _TKRoot
 
 from ._debug import debug, debug_watch
+from .animation import Animation, EasingType
 from .events import Event, EventCommand
 from .layout import DummyParent, get_parent
 from .types import CommandType, HAlign, PadType, TooltipType, VAlign, ValueType
@@ -36,6 +38,8 @@ class BaseWidget:
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        debounce: int | None = None,
+        throttle: int | None = None,
     ):
         """Initialize a widget.
 
@@ -57,6 +61,10 @@ class BaseWidget:
             weighty (int | None, optional): Weight for vertical resizing. Defaults to None.
             focus (bool, optional): If True, widget has focus. Defaults to False.
                 Only one widget in a window can have focus.HLayout
+            debounce (int | None, optional): If set, command is called only once events have
+                stopped arriving for debounce milliseconds. Defaults to None.
+            throttle (int | None, optional): If set, command is called at most once every
+                throttle milliseconds. Defaults to None.
         """
         super().__init__()
 
@@ -75,6 +83,8 @@ class BaseWidget:
 
         self._command = command
         self._commands = {}
+        self._debounce = debounce
+        self._throttle = throttle
 
         self.widget_type = None
         self._tk = _TKRoot()
@@ -97,6 +107,9 @@ class BaseWidget:
         # set to True when _layout creates the widget
         self._has_been_created = False
 
+        # running animations started by animate(), keyed by attribute
+        self._animations: dict[str, Animation] = {}
+
     @property
     def value(self):
         return self._value.get()
@@ -213,6 +226,80 @@ class BaseWidget:
         self._configure()
         return self
 
+    def animate(
+        self,
+        attribute: str,
+        end: Any,
+        duration: int = 250,
+        start: Any = None,
+        easing: EasingType = "ease_in_out",
+        on_done: Callable[[], Any] | None = None,
+    ) -> Animation:
+        """Animate a property of the widget from its current value to end
+
+        Args:
+            attribute (str): Property to animate: "value", "padx" or "pady" for the grid
+                padding, or a style option such as "foreground" or "width".
+            end (Any): Value at the end of the animation; a number, a tuple of numbers
+                (for example, padding), or a color.
+            duration (int, optional): Length of the animation in milliseconds. Defaults to 250.
+            start (Any, optional): Value at the start of the animation. Defaults to None,
+                meaning the current value.
+            easing (str | Callable, optional): Name of an easing function ("linear",
+                "ease_in", "ease_out", "ease_in_out") or a function mapping time elapsed
+                to change applied, both from 0 to 1. Defaults to "ease_in_out".
+            on_done (Callable | None, optional): Called when the animation finishes.
+                Defaults to None.
+
+        Returns: Animation; call its cancel() method to stop the animation.
+
+        Note:
+            All running animations are driven by a single frame callback (see
+            guitk.animation.FrameTicker, which sets the maximum frames per second) so
+            running many animations at once is cheap. If the application falls behind,
+            frames are skipped rather than slowing the animation down.
+            Starting an animation of an attribute cancels any running animation of the
+            same attribute. The widget must have been created (for example, call animate()
+            from setup() or an event handler).
+        """
+        if previous := self._animations.pop(attribute, None):
+            previous.cancel()
+
+        if attribute == "value":
+            current = self.value
+            setter = functools.partial(setattr, self, "value")
+        elif attribute in ("padx", "pady"):
+            current = self.widget.grid_info()[attribute]
+
+            def setter(value):
+                setattr(self, attribute, value)
+                self.widget.grid_configure(**{attribute: value})
+
+        else:
+            current = self.widget.cget(attribute)
+
+            def setter(value):
+                # update _style_kwargs so the value is kept if the widget is reconfigured
+                self._style_kwargs[attribute] = value
+                self.widget.configure(**{attribute: value})
+
+        if start is None:
+            start = current
+            if start in ("", None):
+                raise ValueError(f"{attribute} has no current value, specify start")
+
+        def _done():
+            if self._animations.get(attribute) is animation:
+                del self._animations[attribute]
+            if on_done:
+                on_done()
+
+        animation = Animation(
+            setter, start, end, duration, easing, on_done=_done, widget=self.widget
+        )
+        self._animations[attribute] = animation
+        return animation.start()
+
     # def valign(self, valign: VAlign | None = None) -> Widget:
     #     """Set valign the widget
 
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
 import tkinter as tk
-from typing import TYPE_CHECKING, Hashable
+from typing import TYPE_CHECKING, Any, Callable, Generator, Hashable, Sequence
 
 from guitk.constants import GUITK
 
 from ._debug import debug, debug_borderwidth, debug_relief, debug_watch
 from .basewidget import BaseWidget
 from .frame import _Container
+from .layout import pop_parent, push_parent
+from .scrolledframe import VirtualScrolledFrame
 from .spacer import HSpacer, VSpacer
+from .ttk_label import Label
 from .types import HAlign, PaddingType, PadType, VAlign
+from .utils import gridded_widget
 
 if TYPE_CHECKING:
     from .window import Window
@@ -101,6 +106,10 @@ class _Stack(_Container):
         self._layout_list = []
         self._layout_lol = [[]]
 
+        # used by batch() to defer redraw() until all mutations are done
+        self._batch_depth = 0
+        self._redraw_pending = False
+
     def _create_widget(self, parent: tk.BaseWidget, window: Window, row: int, col: int):
         super()._create_widget(parent, window, row, col)
 
@@ -114,10 +123,12 @@ class _Stack(_Container):
         """Return the layout of the Stack"""
         if self.distribute:
             self._layout_lol = []
-            for widget in self._layout_list:
-                self._layout_lol.append([VSpacer()])
+            for idx, widget in enumerate(self._layout_list):
+                self._layout_lol.append([self._spacer(VSpacer, ("distribute", idx))])
                 self._layout_lol.append([widget])
-            self._layout_lol.append([VSpacer()])
+            self._layout_lol.append(
+                [self._spacer(VSpacer, ("distribute", len(self._layout_list)))]
+            )
         else:
             self._layout_lol = (
                 [[widget] for widget in self._layout_list]
@@ -144,8 +155,9 @@ class _Stack(_Container):
 
     def extend(self, widgets: list[BaseWidget]):
         """Add a list of widgets to the end of the Stack"""
-        for widget in widgets:
-            self.append(widget)
+        with self.batch():
+            for widget in widgets:
+                self.append(widget)
 
     def insert(self, index: int, widget: BaseWidget):
         """Insert a widget at the given index in the Stack.
@@ -164,13 +176,10 @@ class _Stack(_Container):
         self.redraw()
 
     def clear(self):
-        """Remove all widgets from the Stack"""
-        # copy the list so we can iterate over it while removing widgets
-        # which will change the list
-        for widget in self._layout_list.copy():
-            debug(f"{self} destroying {widget=}")
-            widget.destroy()
+        """Remove all widgets from the Stack and destroy them"""
+        widgets = self._layout_list
         self._layout_list = []
+        self._destroy_widgets(widgets)
         self.redraw()
 
     def pop(self, index: int = -1):
@@ -186,7 +195,9 @@ class _Stack(_Container):
             IndexError: If the index is out of range.
         """
         widget = self._layout_list.pop(index)
-        widget.widget.grid_forget()
+        if widget._has_been_created:
+            # widget may not have been created yet if added inside a batch() block
+            widget.widget.grid_forget()
         self.redraw()
         return widget
 
@@ -201,24 +212,58 @@ class _Stack(_Container):
         Raises:
             ValueError: If the widget is not in the Stack.
         """
-        for idx, widget in enumerate(self._layout_list):
-            if widget == key_or_widget or widget.key == key_or_widget:
-                debug(
-                    f"removing {key_or_widget} from {self} {widget.key} {widget.widget}"
-                )
-                widget = self._layout_list.pop(idx)
-                self.window._forget_widget(widget)
-                widget.widget.grid_forget()
-                widget.widget.destroy()
-                self.redraw()
-                return
-        raise ValueError(f"Widget {key_or_widget} not found in Stack")
+        widget = self._find_widget(key_or_widget, self._layout_list)
+        if widget is None:
+            raise ValueError(f"Widget {key_or_widget} not found in Stack")
+        debug(f"removing {key_or_widget} from {self} {widget.key} {widget.widget}")
+        self._layout_list.remove(widget)
+        if widget._has_been_created:
+            self.window._forget_widgets([widget])
+            widget.widget.grid_forget()
+            widget.widget.destroy()
+        self.redraw()
 
     def redraw(self):
-        """Redraw the Stack"""
+        """Redraw the Stack
+
+        Note: If called inside a batch() block, the redraw is deferred until the
+        outermost batch() block exits.
+        """
+        if self._batch_depth:
+            self._redraw_pending = True
+            return
         self._layout(self.frame, self.window)
         self.window.window.update_idletasks()
 
+    @contextlib.contextmanager
+    def batch(self) -> Generator[_Stack, None, None]:
+        """Context manager that defers redrawing the Stack until the block exits.
+
+        Each call to append(), insert(), pop(), or remove() normally lays out the entire
+        Stack again. Inside a batch() block, these mutations are collected and the Stack
+        is laid out exactly once when the block exits. Blocks may be nested; the redraw
+        happens when the outermost block exits.
+
+        Example:
+            ```python
+            with self["results"].batch() as stack:
+                for row in rows:
+                    stack.append(Label(row))
+            ```
+
+        Note:
+            Widgets added inside a batch() block are not created until the block exits
+            so their underlying tkinter widget is not available until then.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._redraw_pending:
+                self._redraw_pending = False
+                self.redraw()
+
     def _add_widget(self, widget: BaseWidget):
         """Add a widget to the frame's layout"""
         self._layout_list.append(widget)
@@ -403,10 +448,12 @@ class HStack(_Stack):
         """Return the layout of the HStack"""
         if self.distribute:
             self._layout_lol = [[]]
-            for widget in self._layout_list:
-                self._layout_lol[0].append(HSpacer())
+            for idx, widget in enumerate(self._layout_list):
+                self._layout_lol[0].append(self._spacer(HSpacer, ("distribute", idx)))
                 self._layout_lol[0].append(widget)
-            self._layout_lol[0].append(HSpacer())
+            self._layout_lol[0].append(
+                self._spacer(HSpacer, ("distribute", len(self._layout_list)))
+            )
         else:
             self._layout_lol = [self._layout_list]
         return self._layout_lol
@@ -664,3 +711,240 @@ class HGrid(_Stack):
         # the HGrid layout converts a list into a list of lists where each list is length self.cols
         # convert row, col to back to a list index
         return row * self.cols + col
+
+
+class VirtualVStack(_Container):
+    """A vertically scrolling list that only creates widgets for the visible rows"""
+
+    def __init__(
+        self,
+        data: Sequence[Any] | None = None,
+        row_factory: Callable[[], BaseWidget] | None = None,
+        row_update: Callable[[BaseWidget, Any], None] | None = None,
+        row_height: int = 24,
+        overscan: int = 5,
+        key: Hashable | None = None,
+        width: int | None = None,
+        height: int | None = None,
+        padding: PaddingType | None = None,
+        disabled: bool | None = False,
+        sticky: str | None = "nsew",
+        vexpand: bool = True,
+        hexpand: bool = True,
+        autohide_scrollbars: bool = False,
+    ):
+        """Virtualized container that displays a list of items in rows of widgets.
+
+        Unlike VStack, which creates a widget for every item, VirtualVStack only creates
+        enough rows to fill the visible area plus an overscan margin. As the list is
+        scrolled, rows that scroll out of view are recycled to display the items that
+        scroll into view so memory use and layout cost don't depend on the number of items.
+
+        Args:
+            data (Sequence, optional): The items to display. Defaults to an empty list.
+            row_factory (Callable[[], Widget], optional): Called with no arguments to create
+                a row widget. The row may be a container such as HStack holding other
+                widgets. Defaults to creating a Label.
+            row_update (Callable[[Widget, Any], None], optional): Called with a row widget and
+                an item to display the item in the row. Defaults to setting row.value to the item.
+            row_height (int): The height of each row in pixels. Defaults to 24.
+            overscan (int): The number of rows to create above and below the visible rows
+                so that scrolling doesn't expose empty space. Defaults to 5.
+            key (Hashable, optional): The key to use for the VirtualVStack. Defaults to None.
+            width (int, optional): The width of the VirtualVStack. Defaults to None.
+            height (int, optional): The height of the VirtualVStack. Defaults to 10 rows.
+            padding (PaddingType, optional): The padding around the VirtualVStack. Defaults to None.
+            disabled (bool, optional): Whether the VirtualVStack is disabled. Defaults to False.
+            sticky (str, optional): The sticky value for the VirtualVStack. Defaults to "nsew".
+            vexpand (bool, optional): Whether the VirtualVStack should expand vertically.
+                Defaults to True.
+            hexpand (bool, optional): Whether the VirtualVStack should expand horizontally.
+                Defaults to True.
+            autohide_scrollbars (bool): Whether to hide scrollbars when not needed. Defaults to False.
+
+        Note:
+            Rows are reused for different items so any state in a row widget should be set
+            by row_update. Use item_index() in an event handler to find the item displayed
+            by the row that generated the event. If the data is modified in place, call
+            refresh() to update the display.
+
+        Example:
+            ```python
+            class LogViewer(ui.Window):
+                def config(self):
+                    with ui.VLayout():
+                        ui.VirtualVStack(data=[f"Line {i}" for i in range(50_000)], key="log")
+            ```
+        """
+        super().__init__(
+            frametype=GUITK.ELEMENT_FRAME,
+            key=key,
+            width=width,
+            height=height if height is not None else row_height * 10,
+            layout=None,
+            style=None,
+            borderwidth=debug_borderwidth() or None,
+            padding=padding,
+            relief=debug_relief() or None,
+            disabled=disabled,
+            rowspan=None,
+            columnspan=None,
+            sticky=sticky,
+            tooltip=None,
+            autoframe=False,
+            padx=0,
+            pady=0,
+            vscrollbar=True,
+            autohide_scrollbars=autohide_scrollbars,
+        )
+        self.vexpand = vexpand if height is None else False
+        self.hexpand = hexpand if width is None else False
+        self._data = data if data is not None else []
+        self._row_factory = row_factory or (lambda: Label(""))
+        self._row_update = row_update or _default_row_update
+        self.row_height = max(row_height, 1)
+        self.overscan = max(overscan, 0)
+
+        self._rows_by_index: dict[int, BaseWidget] = {}
+        """ rows currently displaying an item, keyed by the item's index """
+
+        self._free_rows: list[BaseWidget] = []
+        """ rows not currently displaying an item, available for reuse """
+
+        self._row_count = 0
+        """ number of rows created """
+
+        self._creating_row = False
+        """ True while row_factory is being called """
+
+    def _create_widget(self, parent: tk.BaseWidget, window: Window, row: int, col: int):
+        self.widget = VirtualScrolledFrame(
+            parent,
+            on_scroll=self._render,
+            scroll_unit=self.row_height,
+            vscrollbar=True,
+            autohide=self.autohide,
+            padding=self.padding or 0,
+            width=self.width,
+            height=self.height,
+            borderwidth=self.borderwidth,
+            relief=self.relief,
+        )
+        self._grid(
+            row=row, column=col, rowspan=self.rowspan, columnspan=self.columnspan
+        )
+        if self.vexpand:
+            parent.grid_rowconfigure(row, weight=1)
+        if self.hexpand:
+            parent.grid_columnconfigure(col, weight=1)
+        self.widget.set_virtual_height(len(self._data) * self.row_height)
+        return self.widget
+
+    @property
+    def data(self) -> Sequence[Any]:
+        """The items displayed by the VirtualVStack"""
+        return self._data
+
+    @data.setter
+    def data(self, data: Sequence[Any]):
+        """Replace the items displayed by the VirtualVStack"""
+        self._data = data
+        self.refresh()
+
+    def refresh(self):
+        """Update the display after the data has been changed in place"""
+        self._release_rows(list(self._rows_by_index))
+        if self._has_been_created:
+            self.widget.set_virtual_height(len(self._data) * self.row_height)
+
+    def scroll_to(self, index: int):
+        """Scroll so that the item at index is at the top of the visible area"""
+        if index < 0:
+            index += len(self._data)
+        if self._has_been_created:
+            self.widget.scroll_to(index * self.row_height)
+
+    def item_index(self, row: BaseWidget) -> int | None:
+        """Return the index of the item displayed by row or None if row isn't displaying an item
+
+        Args:
+            row (Widget): A row widget or a widget contained in a row.
+        """
+        while row is not None and row.parent is not self:
+            row = row.parent if isinstance(row.parent, BaseWidget) else None
+        if row is None:
+            return None
+        for index, displayed in self._rows_by_index.items():
+            if displayed is row:
+                return index
+        return None
+
+    def _render(self, top: int):
+        """Display the items visible when the viewport starts top pixels into the list"""
+        if not self._has_been_created:
+            return
+        first_visible = top // self.row_height
+        visible_rows = -(-self.widget.viewport_height // self.row_height) + 1
+        first = max(first_visible - self.overscan, 0)
+        last = min(first_visible + visible_rows + self.overscan, len(self._data))
+        visible = range(first, last)
+
+        self._release_rows([idx for idx in self._rows_by_index if idx not in visible])
+        for idx in visible:
+            row = self._rows_by_index.get(idx)
+            if row is None:
+                row = self._free_rows.pop() if self._free_rows else self._make_row()
+                self._rows_by_index[idx] = row
+                self._row_update(row, self._data[idx])
+            gridded_widget(row.widget, self.widget).place(
+                x=0, y=idx * self.row_height - top, relwidth=1.0, height=self.row_height
+            )
+
+    def _release_rows(self, indices: list[int]):
+        """Stop displaying the items at indices and make their rows available for reuse"""
+        for idx in indices:
+            row = self._rows_by_index.pop(idx)
+            gridded_widget(row.widget, self.widget).place_forget()
+            self._free_rows.append(row)
+
+    def _make_row(self) -> BaseWidget:
+        """Create a new row widget with row_factory"""
+        push_parent(self)
+        self._creating_row = True
+        try:
+            row = self._row_factory()
+        finally:
+            self._creating_row = False
+            pop_parent()
+        self._create_and_add_widget(row, self.widget, self.window, self._row_count, 0)
+        self._row_count += 1
+        return row
+
+    def _configure_widget(
+        self,
+        widget: BaseWidget,
+        parent: tk.BaseWidget,
+        window: Window,
+        row: int,
+        col: int,
+    ):
+        """Configure the row widget; rows are placed, not gridded"""
+        super()._configure_widget(widget, parent, window, row, col)
+        gridded_widget(widget.widget, self.widget).grid_forget()
+        if widget in self._rows_by_index.values():
+            # put the row back in its place
+            self._render(self.widget.top)
+
+    def _add_widget(self, widget: BaseWidget):
+        """Rows are only created by row_factory"""
+        if not self._creating_row:
+            raise RuntimeError("VirtualVStack rows must be created by row_factory")
+
+    def __len__(self):
+        """Number of items in the VirtualVStack"""
+        return len(self._data)
+
+
+def _default_row_update(row: BaseWidget, item: Any):
+    """Display item in row by setting the row's value"""
+    row.value = item
@@ -2,20 +2,90 @@
 
 from __future__ import annotations
 
+import re
+from collections import deque
+
 from .containers import HStack
 from .layout import VLayout
-from .tk_text import Output
+from .redirect import StdErrRedirect, StdOutRedirect
+from .tk_text import Text
 from .ttk_button import Button
+from .ttk_checkbutton import Checkbutton
+from .ttk_combobox import Combobox
 from .ttk_entry import LabelEntry
 from .window import Window
 
+__all__ = ["DebugWindow"]
+
+LEVELS = ["ALL", "DEBUG", "INFO", "WARNING", "ERROR"]
+""" levels which can be selected in the level filter; each shows that level and up """
+
+_LEVEL_RANK = {
+    "DEBUG": 1,
+    "INFO": 2,
+    "WARNING": 3,
+    "WARN": 3,
+    "ERROR": 4,
+    "CRITICAL": 4,
+}
+
+_LEVEL_PATTERN = re.compile(r"\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL)\b")
+
+_STREAM_LEVEL = {"stdout": _LEVEL_RANK["INFO"], "stderr": _LEVEL_RANK["ERROR"]}
+""" level of lines which don't contain a level name """
+
+
+def _line_level(line: str, stream: str) -> int:
+    """Return the rank of the level of line written to stream"""
+    if match := _LEVEL_PATTERN.search(line):
+        return _LEVEL_RANK[match[1]]
+    return _STREAM_LEVEL.get(stream, _LEVEL_RANK["INFO"])
+
 
 class DebugWindow(Window):
     """Debug window that captures stdout/stderr"""
 
-    def __init__(self, output_width=80, output_height=20, **kwargs):
+    def __init__(
+        self, output_width=80, output_height=20, max_lines: int = 10_000, **kwargs
+    ):
+        """Initialize a DebugWindow.
+
+        Args:
+            output_width (int, optional): Width of the output text box. Defaults to 80.
+            output_height (int, optional): Height of the output text box. Defaults to 20.
+            max_lines (int, optional): Maximum number of captured lines to keep for
+                filtering; older lines are discarded. Defaults to 10,000.
+            **kwargs: Additional keyword arguments are passed to Window.
+
+        Note:
+            Captured lines are kept outside the text box so changing the filter never
+            loses history. New lines are matched against the filter as they arrive and
+            only the matching lines are added to the text box.
+        """
         self._output_width = output_width
         self._output_height = output_height
+
+        self._lines: deque[tuple[str, str, int]] = deque(maxlen=max_lines)
+        """ (line, stream, level) for each captured line """
+
+        self._partial: dict[str, str] = {}
+        """ text written to each stream since the last newline """
+
+        self._filter: re.Pattern | None = None
+        """ pattern lines must match to be shown, None to show all lines """
+
+        self._min_level = 0
+        """ minimum level of lines to be shown """
+
+        self._output: Text | None = None
+        """ text box showing the lines which match the filter; set by config() """
+
+        # register here rather than in setup() so subclasses overriding setup() and
+        # teardown() don't need to call super(); deregistered in _destroy()
+        self._redirect_id = {
+            redirect: redirect.register(self._on_output)
+            for redirect in (StdOutRedirect(), StdErrRedirect())
+        }
         super().__init__(**kwargs)
 
     def config(self):
@@ -24,17 +94,94 @@ class DebugWindow(Window):
         with VLayout():
             with HStack():
                 LabelEntry("Filter", key="FILTER_TEXT", width=40),
+                Checkbutton("Regex", key="FILTER_REGEX"),
+                Combobox(
+                    key="FILTER_LEVEL",
+                    values=LEVELS,
+                    default=LEVELS[0],
+                    readonly=True,
+                    width=8,
+                )
                 Button("Filter", key="FILTER"),
-            Output(
+            self._output = Text(
                 width=self._output_width,
                 height=self._output_height,
                 key="OUTPUT",
-                events=True,
+                disabled=True,
+                vscrollbar=True,
+                flush_interval=20,
+                max_lines=self._lines.maxlen,
             )
+        # show anything captured while the window was being created
+        self._show(self._lines)
+
+    def _destroy(self):
+        for redirect, listener_id in self._redirect_id.items():
+            redirect.deregister(listener_id)
+        self._redirect_id = {}
+        super()._destroy()
 
     def handle_event(self, event):
-        if event.key in ["FILTER", "OUTPUT"]:
-            if filter := self["FILTER_TEXT"].value:
-                lines = self["OUTPUT"].value.split("\n")
-                lines = [line for line in lines if filter in line]
-                self["OUTPUT"].value = "\n".join(lines) + "\n"
+        if event.key in ["FILTER", "FILTER_REGEX", "FILTER_LEVEL"]:
+            self.set_filter(
+                self["FILTER_TEXT"].value,
+                regex=self["FILTER_REGEX"].value,
+                level=self["FILTER_LEVEL"].value,
+            )
+
+    def set_filter(self, text: str = "", regex: bool = False, level: str = "ALL"):
+        """Show only the captured lines which match text and level.
+
+        Args:
+            text (str, optional): Text lines must contain to be shown; if empty, all
+                lines are shown. Defaults to "".
+            regex (bool, optional): If True, text is a regular expression to search
+                for in each line. Defaults to False.
+            level (str, optional): One of LEVELS; only lines of this level or above are
+                shown. Defaults to "ALL".
+
+        Note:
+            Lines which don't contain a level name are INFO if written to stdout
+            and ERROR if written to stderr. An invalid regular expression is matched
+            as plain text.
+        """
+        if text and regex:
+            try:
+                self._filter = re.compile(text)
+            except re.error:
+                self._filter = re.compile(re.escape(text))
+        elif text:
+            self._filter = re.compile(re.escape(text))
+        else:
+            self._filter = None
+        self._min_level = _LEVEL_RANK.get(level, 0)
+
+        if self._output is not None:
+            self._output.clear()
+        self._show(self._lines)
+
+    def _match(self, line: str, level: int) -> bool:
+        """Return True if line of level should be shown"""
+        if level < self._min_level:
+            return False
+        return self._filter is None or self._filter.search(line) is not None
+
+    def _show(self, lines):
+        """Write the lines which match the filter to the output text box"""
+        output = self._output
+        if output is None:
+            return
+        for line, stream, level in lines:
+            if self._match(line, level):
+                output.write(line, tag=stream)
+
+    def _on_output(self, text: str, stream: str, thread: str):
+        """Store lines redirected from stream and show those matching the filter;
+        text after the last newline is kept until the rest of the line is written"""
+        text = self._partial.pop(stream, "") + text
+        *lines, partial = text.split("\n")
+        if partial:
+            self._partial[stream] = partial
+        new_lines = [(f"{line}\n", stream, _line_level(line, stream)) for line in lines]
+        self._lines.extend(new_lines)
+        self._show(new_lines)
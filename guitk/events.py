@@ -4,9 +4,22 @@ from __future__ import annotations
 
 import tkinter
 from collections import namedtuple
-from typing import TYPE_CHECKING, Hashable
+from typing import TYPE_CHECKING, Any, Hashable
 
-EventCommand = namedtuple("EventCommand", ["widget", "key", "event_type", "command"])
+EventCommand = namedtuple(
+    "EventCommand",
+    [
+        "widget",
+        "key",
+        "event_type",
+        "command",
+        "debounce",
+        "throttle",
+        "leading",
+        "trailing",
+    ],
+    defaults=(None, None, None, None),
+)
 
 from enum import Enum
 
@@ -19,7 +32,12 @@ class Event:
     """Event that occurred and values for widgets in the window"""
 
     def __init__(
-        self, widget: BaseWidget, window: Window, key: Hashable, event_type: EventType
+        self,
+        widget: BaseWidget,
+        window: Window,
+        key: Hashable,
+        event_type: EventType,
+        payload: Any = None,
     ):
         self.id: int = id(window)
         self.widget: BaseWidget = widget
@@ -28,9 +46,14 @@ class Event:
         self.event: tkinter.Event | None = (
             None  # placeholder for Tk event, will be set in _make_callback
         )
+        self.payload: Any = payload
+        """ data sent with the event, e.g. the result of a background task """
 
     def __str__(self):
-        return f"id={self.id}, widget={self.widget}, key={self.key}, event_type={self.event_type}, event={self.event}"
+        return (
+            f"id={self.id}, widget={self.widget}, key={self.key}, "
+            f"event_type={self.event_type}, event={self.event}, payload={self.payload!r}"
+        )
 
 
 class EventType(Enum):
@@ -48,6 +71,8 @@ class EventType(Enum):
     ComboboxSelected = "<<ComboboxSelected>>"
     DeleteWindow = "WM_DELETE_WINDOW"
     EntryReturn = "<<EntryReturn>>"
+    FileReadable = "<<FileReadable>>"
+    FileWritable = "<<FileWritable>>"
     ImagePress = "<<ImagePress>>"
     KeyRelease = "<KeyRelease>"
     LinkLabel = "<<LinkLabel>>"
@@ -56,6 +81,9 @@ class EventType(Enum):
     MenuCommand = "<<MenuCommand>>"
     NotebookTabChanged = "<<NotebookTabChanged>>"
     OutputWrite = "<<OutputWrite>>"
+    ProcessExit = "<<ProcessExit>>"
+    ProcessOutput = "<<ProcessOutput>>"
+    ProcessProgress = "<<ProcessProgress>>"
     Quit = "WM_DELETE_WINDOW"
     RadioButton = "<<Radiobutton>>"
     Radiobutton = "<<Radiobutton>>"
@@ -64,6 +92,9 @@ class EventType(Enum):
     SpinboxDecrement = "<<SpinboxDecrement>>"
     SpinboxIncrement = "<<SpinboxIncrement>>"
     SpinboxUpdate = "<<SpinboxUpdate>>"
+    TaskDone = "<<TaskDone>>"
+    TaskError = "<<TaskError>>"
+    TaskProgress = "<<TaskProgress>>"
     Teardown = "<<Teardown>>"
     TreeViewHeading = "<<TreeviewHeading>>"
     TreeViewSelect = "<<TreeviewSelect>>"
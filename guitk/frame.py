@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING, Hashable
+from typing import TYPE_CHECKING, Hashable, Iterable
 
 from guitk.constants import GUITK
 
@@ -18,6 +19,7 @@ from .tooltips import Hovertip
 from .ttk_label import Label
 from .ttk_separator import HSeparator, VSeparator
 from .types import HAlign, LayoutType, PaddingType, PadType, TooltipType, VAlign
+from .utils import destroy_widgets, gridded_widget
 
 _valid_frame_attributes = {
     "cursor",
@@ -53,9 +55,27 @@ class _LayoutMixin:
     vspacing: PadType | None = None
     hspacing: PadType | None = None
 
+    def __init__(self):
+        self._grid_placement = {}
+        """ maps widget to the (row, col, rowspan, columnspan, sticky) it was gridded with by the last _layout() """
+
+        self._spacers = {}
+        """ spacers created by the layout, keyed by their slot in the layout, so they can be reused """
+
+        self._spacers_used = set()
+        """ slots of the spacers used by the current layout """
+
+        self._base_spans = {}
+        """ maps widget to its (rowspan, columnspan) before _add_spacers() adjusted them """
+
     @debug_watch
     def _layout(self, parent: tk.BaseWidget, window: Window):
-        """Create widgets from layout"""
+        """Create widgets from layout.
+
+        The grid placement of each widget is remembered so that subsequent calls only
+        grid and configure widgets that have been added or moved, forget widgets that
+        have been removed, and reuse spacers instead of creating new ones.
+        """
         # as this is a mixin, make sure class being mixed into has necessary attributes
 
         # get alignment from layout or from class attributes
@@ -81,6 +101,7 @@ class _LayoutMixin:
             # so ensure the layout has a reference to the Window
             self.layout.window = window
 
+        self._spacers_used = set()
         layout = list(self.layout)
         rows, columns = rows_columns(layout)
         debug(f"{layout=} {rows=}, {columns=}")
@@ -89,24 +110,30 @@ class _LayoutMixin:
         rows, columns = rows_columns(layout)
         debug(f"_add_spacers(): {layout=} {rows=}, {columns=}")
 
+        placement = {}
         for row_count, row in enumerate(layout):
-            # if self.autoframe and (
-            #     len(row) != 1
-            #     or row[0].widget_type not in {"ttk.Frame", "tk.Frame", "LabelFrame"}
-            # ):
-            #     row_ = [
-            #         _Container(layout=[row], autoframe=False, sticky="nsew", weightx=1)
-            #     ]
-            # else:
-            #     row_ = row
-            row_ = row
             self.row_count = row_count
-            for col_count, widget in enumerate(row_):
+            for col_count, widget in enumerate(row):
                 if widget is None:
                     # add blank label to maintain column spacing
                     # widget = Label("", disabled=True, events=False)
                     continue
                 self._stickyfy(widget, valign, halign)
+                cell = (
+                    row_count,
+                    col_count,
+                    widget.rowspan,
+                    widget.columnspan,
+                    widget.sticky,
+                )
+                placement[widget] = cell
+                if (
+                    widget._has_been_created
+                    and self._grid_placement.get(widget) == cell
+                ):
+                    # widget hasn't moved since the last layout so nothing to do
+                    self.col_count = col_count
+                    continue
                 debug(
                     f"{widget=}, {row_count=}, {col_count=}, {widget.sticky=} {widget.weightx=} {widget.weighty=}"
                 )
@@ -115,35 +142,86 @@ class _LayoutMixin:
                 )
                 self.col_count = col_count
 
+        # destroy spacers that are no longer needed
+        discarded = set()
+        if unused := self._spacers.keys() - self._spacers_used:
+            discarded = {self._spacers.pop(slot) for slot in unused}
+            if created := [s for s in discarded if s._has_been_created]:
+                window._forget_widgets(created)
+                destroy_widgets(s.widget for s in created)
+
+        # forget any other widgets that are no longer in the layout
+        # (they may already have been forgotten or destroyed by remove() or pop())
+        for widget in self._grid_placement.keys() - placement.keys() - discarded:
+            with contextlib.suppress(tk.TclError):
+                widget.widget.grid_forget()
+
+        self._grid_placement = placement
         debug(f"{self.row_count=}, {self.col_count=}")
 
+    def _spacer(
+        self,
+        spacer_class: type[HSpacer] | type[VSpacer],
+        slot: Hashable,
+        span: int = 1,
+    ) -> HSpacer | VSpacer:
+        """Return the spacer for slot in the layout, reusing the spacer from the previous layout if possible
+
+        Args:
+            spacer_class: HSpacer or VSpacer
+            slot: unique identifier for where the spacer is used in the layout
+            span: rowspan for HSpacer or columnspan for VSpacer
+        """
+        spacer = self._spacers.get(slot)
+        if type(spacer) is not spacer_class:
+            spacer = spacer_class(span)
+            self._spacers[slot] = spacer
+        if spacer_class is HSpacer:
+            spacer.rowspan = span
+        else:
+            spacer.columnspan = span
+        self._spacers_used.add(slot)
+        return spacer
+
     def _add_spacers(
         self, layout: LayoutType, valign: VAlign, halign: HAlign
     ) -> LayoutType:
         """Add spacers to layout"""
 
+        # restore any spans adjusted by the previous layout so the adjustment isn't repeated
+        base_spans = {}
+        for row in layout:
+            for widget in row:
+                if widget is not None and widget in self._base_spans:
+                    widget.rowspan, widget.columnspan = self._base_spans[widget]
+
+        def _save_spans(widget: BaseWidget):
+            base_spans.setdefault(widget, (widget.rowspan, widget.columnspan))
+
         rows, columns = rows_columns(layout)
         orientation = "vertical" if rows > 1 else "horizontal"
         new_layout = []
-        for row in layout:
+        for row_idx, row in enumerate(layout):
             new_row = row.copy()
             widget_idx = -1
-            if halign in {"right", "center"}:
+            if new_row and halign in {"right", "center"}:
                 if widget := new_row[0]:
                     # not None
                     if not widget.weightx:
-                        new_row.insert(0, HSpacer())
+                        new_row.insert(0, self._spacer(HSpacer, ("left", row_idx)))
                     else:
+                        _save_spans(widget)
                         widget.columnspan = (
                             widget.columnspan + 1 if widget.columnspan else 2
                         )
                         new_row.append(None)
                         widget_idx = 0
-            if halign == "center":
+            if new_row and halign == "center":
                 if widget := new_row[widget_idx]:
                     if not widget.weightx:
-                        new_row.append(HSpacer())
+                        new_row.append(self._spacer(HSpacer, ("right", row_idx)))
                     else:
+                        _save_spans(widget)
                         widget.columnspan = widget.columnspan + 1
                         new_row.append(None)
 
@@ -154,10 +232,13 @@ class _LayoutMixin:
                 # there's only one row so add spacers above/below as needed
                 spacer_row = []
                 for idx, widget in enumerate(new_layout[0]):
-                    if not widget.weighty:
-                        spacer_row.append(VSpacer())
+                    if widget is None:
+                        spacer_row.append(None)
+                    elif not widget.weighty:
+                        spacer_row.append(self._spacer(VSpacer, ("top", idx)))
                     else:
                         spacer_row.append(widget)
+                        _save_spans(widget)
                         rowspan = 1 if valign == "bottom" else 2
                         widget.rowspan = (
                             widget.rowspan + rowspan if widget.rowspan else rowspan + 1
@@ -166,27 +247,31 @@ class _LayoutMixin:
                 new_layout.insert(0, spacer_row)
             if valign in {"center"}:
                 spacer_row = []
-                for widget in new_layout[-1]:
+                for idx, widget in enumerate(new_layout[-1]):
                     if widget is None or widget.weighty is not None:
                         spacer_row.append(None)
                     else:
-                        spacer_row.append(VSpacer())
+                        spacer_row.append(self._spacer(VSpacer, ("bottom", idx)))
                 new_layout.append(spacer_row)
         else:
             rows, columns = rows_columns(new_layout)
             if valign in {"bottom", "center"}:
                 new_layout.insert(
                     0,
-                    [VSpacer(columnspan=columns), *[None for _ in range(columns - 1)]],
+                    [
+                        self._spacer(VSpacer, ("top",), columns),
+                        *[None for _ in range(columns - 1)],
+                    ],
                 )
             if valign in {"center"}:
                 new_layout.append(
                     [
-                        VSpacer(columnspan=columns),
+                        self._spacer(VSpacer, ("bottom",), columns),
                         *[None for _ in range(columns - 1)],
                     ]
                 )
 
+        self._base_spans = base_spans
         return new_layout
 
     def _stickyfy(self, widget: BaseWidget, valign: str, halign: str):
@@ -223,15 +308,17 @@ class _LayoutMixin:
             else:
                 widget._tooltip = None
 
-            window._widgets.append(widget)
             widget.parent = self
-            window._widget_by_key[widget.key] = widget
+            window._widgets.add(widget)
 
             widget._has_been_created = True
         else:
             # grid the widget
             widget._grid(
-                row=row, column=col, rowspan=self.rowspan, columnspan=self.columnspan
+                row=row,
+                column=col,
+                rowspan=widget.rowspan,
+                columnspan=widget.columnspan,
             )
 
         widget._set_row_col(row, col)
@@ -384,15 +471,63 @@ class _Container(BaseWidget, _LayoutMixin):
         Raises:
             ValueError: If the widget is not found in the layout.
         """
+        widget = self._find_widget(
+            key_or_widget, itertools.chain.from_iterable(self.layout)
+        )
+        if widget is None:
+            raise ValueError(f"Widget not found: {key_or_widget}")
         for row in self.layout:
-            for idx, widget in enumerate(row):
-                if widget == key_or_widget or widget.key == key_or_widget:
-                    widget = row.pop(idx)
-                    self.window._forget_widget(widget)
-                    widget.widget.grid_forget()
-                    widget.widget.destroy()
-                    return
-        raise ValueError(f"Widget not found: {key_or_widget}")
+            if widget in row:
+                row.remove(widget)
+                break
+        self.window._forget_widgets([widget])
+        widget.widget.grid_forget()
+        widget.widget.destroy()
+
+    def _find_widget(
+        self, key_or_widget: Hashable | BaseWidget, widgets: Iterable[BaseWidget]
+    ) -> BaseWidget | None:
+        """Return the widget in this container that is key_or_widget or has key key_or_widget
+
+        Args:
+            key_or_widget (Hashable | Widget): The key or widget to find.
+            widgets (Iterable[Widget]): The container's widgets in layout order; only scanned
+                if the window's widget registry can't resolve key_or_widget to a widget in this
+                container, e.g. the widget hasn't been created yet or its key is shared with a
+                widget in another container.
+
+        Returns:
+            The widget or None if not found.
+        """
+        if self.window is not None:
+            widget = self.window._widgets.find(key_or_widget)
+            if widget is not None and widget.parent is self:
+                return widget
+        for widget in widgets:
+            if widget is not None and (
+                widget is key_or_widget or widget.key == key_or_widget
+            ):
+                return widget
+        return None
+
+    def clear(self):
+        """Remove all widgets from the container and destroy them"""
+        widgets = [widget for row in self.layout for widget in row if widget]
+        self.layout = [[]]
+        self._destroy_widgets(widgets)
+        self._layout(self.frame, self.window)
+
+    def _destroy_widgets(self, widgets: list[BaseWidget]):
+        """Forget and destroy widgets (and any widgets they contain) in bulk.
+
+        The widgets are removed from the window's bookkeeping in a single pass and
+        the tkinter widgets are destroyed with a single Tcl command.
+        The caller is responsible for removing the widgets from the layout.
+        """
+        if not (widgets := [w for w in widgets if w._has_been_created]):
+            return
+        self.window._forget_widgets(widgets)
+        destroy_widgets(gridded_widget(w.widget, w._parent) for w in widgets)
 
     def _create_widget(self, parent, window: Window, row, col):
         kwargs = {
@@ -0,0 +1,122 @@
+""" Run long loops on the Tk thread in time-sliced steps so the UI stays responsive """
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import itertools
+import time
+import tkinter as tk
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable
+
+from .events import EventType
+
+if TYPE_CHECKING:
+    from .window import Window
+
+__all__ = ["IncrementalTask"]
+
+
+class IncrementalTask:
+    """Handle for a generator run by Window.run_incremental()"""
+
+    def __init__(
+        self,
+        generator: Iterable[Any],
+        budget_ms: float,
+        priority: int,
+        key: Hashable | None,
+    ):
+        self.generator = iter(generator)
+        self.budget_ms = budget_ms
+        self.priority = priority
+        self.key = key
+
+        self.done = False
+        """ True when the generator is exhausted, raised, or was cancelled """
+
+        self.cancelled = False
+        """ True if the task was cancelled """
+
+        self.result: Any = None
+        """ value returned by the generator """
+
+    def cancel(self):
+        """Stop running the generator; it is closed so any finally blocks run"""
+        if self.done:
+            return
+        self.done = self.cancelled = True
+        if hasattr(self.generator, "close"):
+            self.generator.close()
+
+
+class _IncrementalScheduler:
+    """Runs the incremental tasks of a window on the Tk thread, one task per time slice;
+    the highest priority task runs first and tasks of equal priority take turns"""
+
+    def __init__(self, window: Window):
+        self._window = window
+        self._heap: list[tuple[int, int, IncrementalTask]] = []
+        """ (-priority, sequence, task) so the highest priority, oldest task is first """
+
+        self._seq = itertools.count()
+        self._after_id: str | None = None
+
+    def add(
+        self,
+        generator: Iterable[Any],
+        budget_ms: float,
+        priority: int,
+        key: Hashable | None,
+    ) -> IncrementalTask:
+        """Schedule generator to run and return its task"""
+        task = IncrementalTask(generator, budget_ms, priority, key)
+        self._push(task)
+        self._schedule()
+        return task
+
+    def cancel_all(self):
+        """Cancel all tasks"""
+        if self._after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._window._tk.root.after_cancel(self._after_id)
+            self._after_id = None
+        while self._heap:
+            _, _, task = heapq.heappop(self._heap)
+            task.cancel()
+
+    def _push(self, task: IncrementalTask):
+        heapq.heappush(self._heap, (-task.priority, next(self._seq), task))
+
+    def _schedule(self):
+        """Run the next time slice once Tk has processed pending events"""
+        if self._after_id is None and self._heap:
+            self._after_id = self._window._tk.root.after_idle(self._run_slice)
+
+    def _run_slice(self):
+        """Advance the first task until it's done or its budget is used up"""
+        self._after_id = None
+        while self._heap:
+            _, _, task = heapq.heappop(self._heap)
+            if not task.done:
+                break
+        else:
+            return
+
+        next_step: Callable[[], Any] = task.generator.__next__
+        deadline = time.perf_counter() + task.budget_ms / 1000
+        try:
+            while time.perf_counter() < deadline:
+                next_step()
+        except StopIteration as e:
+            task.done = True
+            task.result = e.value
+            self._window._emit_event(task.key, EventType.TaskDone, e.value)
+        except Exception as e:
+            task.done = True
+            self._window._emit_event(task.key, EventType.TaskError, e)
+        else:
+            if not task.done:
+                # task may have been cancelled by the generator itself
+                self._push(task)
+        self._schedule()
@@ -89,8 +89,23 @@ class HLayout:
                 "Layout must have been created in a Window to add widgets"
             )
         self.window.col_count += 1
+        self._layout_list.append(widget)
         self.window.add_widget(widget, 0, self.window.col_count)
 
+    def extend(self, widgets: list[BaseWidget]):
+        """Add a list of widgets to the end of the HLayout"""
+        if not self.window:
+            # HLayout is not being used in a Window, can't add widget
+            raise RuntimeError(
+                "Layout must have been created in a Window to add widgets"
+            )
+        self._layout_list.extend(widgets)
+        self.window.add_widgets(
+            (widget, 0, self.window.col_count + idx)
+            for idx, widget in enumerate(widgets, start=1)
+        )
+        self.window.col_count += len(widgets)
+
     def remove(self, key_or_widget: Hashable | BaseWidget):
         """Remove widget from layout" and destroy it.
 
@@ -106,15 +121,24 @@ class HLayout:
             raise RuntimeError(
                 "Layout must have been created in a Window to remove widgets"
             )
-        for idx, widget in enumerate(self._layout_list):
-            if widget == key_or_widget or widget.key == key_or_widget:
-                widget = self._layout_list.pop(idx)
-                self.window._forget_widget(widget)
-                widget.widget.grid_forget()
-                widget.widget.destroy()
-                self.window.window.update_idletasks()
-                return
-        raise ValueError(f"Widget {key_or_widget} not found in Layout")
+        widget = self.window._widgets.find(key_or_widget)
+        if widget is None or widget not in self._layout_list:
+            # not created yet or key shared with a widget outside this layout
+            widget = next(
+                (
+                    w
+                    for w in self._layout_list
+                    if w is key_or_widget or w.key == key_or_widget
+                ),
+                None,
+            )
+        if widget is None:
+            raise ValueError(f"Widget {key_or_widget} not found in Layout")
+        self._layout_list.remove(widget)
+        self.window._forget_widgets([widget])
+        widget.widget.grid_forget()
+        widget.widget.destroy()
+        self.window.window.update_idletasks()
 
     def _add_widget(self, widget):
         """Add a widget to the end of the Layout"""
@@ -166,4 +190,19 @@ class VLayout(HLayout):
                 "VLayout must have been created in a Window to add widgets"
             )
         self.window.row_count += 1
+        self._layout_list.append(widget)
         self.window.add_widget(widget, self.window.row_count, 0)
+
+    def extend(self, widgets: list[BaseWidget]):
+        """Add a list of widgets to the bottom of the VLayout"""
+        if not self.window:
+            # HLayout is not being used in a Window, can't add widget
+            raise RuntimeError(
+                "VLayout must have been created in a Window to add widgets"
+            )
+        self._layout_list.extend(widgets)
+        self.window.add_widgets(
+            (widget, self.window.row_count + idx, 0)
+            for idx, widget in enumerate(widgets, start=1)
+        )
+        self.window.row_count += len(widgets)
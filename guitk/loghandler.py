@@ -0,0 +1,160 @@
+""" logging.Handler that writes log records to a Text or Output widget """
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import time
+import tkinter as tk
+from collections import deque
+
+from .tk_text import Text
+from .tkroot import _TKRoot
+
+__all__ = ["TextHandler"]
+
+LEVEL_TAGS = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "critical",
+}
+""" text tag applied to records of each level """
+
+TAG_STYLES = {
+    "debug": {"foreground": "gray50"},
+    "warning": {"foreground": "dark orange"},
+    "error": {"foreground": "red"},
+    "critical": {"foreground": "red", "underline": True},
+}
+""" default text tag styles; tags already configured on the widget are not changed """
+
+
+def _level_tag(levelno: int) -> str:
+    """Return the text tag for a record of level levelno"""
+    if levelno in LEVEL_TAGS:
+        return LEVEL_TAGS[levelno]
+    # custom levels use the tag of the nearest standard level below them
+    below = [level for level in LEVEL_TAGS if level <= levelno]
+    return LEVEL_TAGS[max(below)] if below else LEVEL_TAGS[logging.DEBUG]
+
+
+class TextHandler(logging.Handler):
+    """logging.Handler that writes formatted log records to a Text or Output widget"""
+
+    def __init__(
+        self,
+        widget: Text,
+        level: int = logging.NOTSET,
+        interval: int = 20,
+        budget: int = 8,
+    ):
+        """Initialize a TextHandler.
+
+        Args:
+            widget (Text): The Text or Output widget to write log records to.
+            level (int, optional): Minimum level of records to handle. Defaults to logging.NOTSET.
+            interval (int, optional): Milliseconds to wait before writing records left over
+                when the budget was used up. Defaults to 20.
+            budget (int, optional): Maximum milliseconds to spend writing records to the widget
+                at a time; records not written are written after interval. Defaults to 8.
+
+        Note:
+            Records may be logged from any thread. They are formatted in the logging thread
+            and queued, and the Tk main thread is woken to write them to the widget; records
+            logged before it runs are written together. Each record is
+            tagged with the lowercase name of its level ("debug", "info", "warning", "error",
+            "critical") which can be styled with the widget's tag_configure().
+            TextHandler must be created on the Tk main thread.
+        """
+        super().__init__(level)
+        self.widget = widget
+        self.interval = interval
+        self.budget = budget
+
+        self._records: deque[tuple[str, str]] = deque()
+        """ (formatted message, tag) for each record not yet written to the widget """
+
+        self._after_id: str | None = None
+        self._closed = False
+        self._styled = False
+
+    def emit(self, record: logging.LogRecord):
+        """Format record and queue it to be written to the widget; called by logging"""
+        if self._closed:
+            return
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._records.append((f"{msg}\n", _level_tag(record.levelno)))
+        _TKRoot().call_soon_threadsafe(self._records_queued, coalesce_key=self)
+
+    def close(self):
+        """Stop writing records to the widget and remove the handler from logging"""
+        self._closed = True
+        self._records.clear()
+        if (
+            self._after_id is not None
+            and threading.current_thread() is threading.main_thread()
+        ):
+            with contextlib.suppress(tk.TclError):
+                _TKRoot().root.after_cancel(self._after_id)
+            self._after_id = None
+        super().close()
+
+    def _records_queued(self):
+        """Called on the Tk main thread after records are queued"""
+        if self._after_id is None:
+            # otherwise records left over from the last write are written after interval
+            self._write_records()
+
+    def _write_records(self):
+        """Write queued records to the widget until the budget is used up"""
+        self._after_id = None
+        if self._closed or not self._records:
+            return
+
+        widget = self.widget
+        if widget._has_been_created:
+            try:
+                if not widget.widget.winfo_exists():
+                    # widget was destroyed
+                    self.close()
+                    return
+                if not self._styled:
+                    self._configure_tags()
+                self._write(time.perf_counter() + self.budget / 1000)
+            except tk.TclError:
+                self.close()
+                return
+        if self._records:
+            # budget used up or widget not created yet so write the rest later
+            self._after_id = _TKRoot().root.after(self.interval, self._write_records)
+
+    def _write(self, deadline: float):
+        """Write queued records to the widget until deadline"""
+        records = self._records
+        widget = self.widget
+        count = 0
+        while records:
+            msg, tag = records.popleft()
+            widget.write(msg, tag=tag)
+            count += 1
+            # checking the clock for every record is expensive for many small records
+            if count % 100 == 0 and time.perf_counter() > deadline:
+                break
+        if count:
+            # insert all the records written in a single insert
+            widget.flush()
+
+    def _configure_tags(self):
+        """Apply TAG_STYLES to tags the widget doesn't already style"""
+        text = self.widget.text
+        for tag, style in TAG_STYLES.items():
+            if not any(text.tag_cget(tag, option) for option in style):
+                text.tag_configure(tag, **style)
+        self._styled = True
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import inspect
 import sys
+import threading
+from collections import deque
+from typing import Callable
+
+from .tkroot import _TKRoot
+
+_queue: deque[tuple[_StdOutRedirectBaseClass, str, str]] = deque()
+""" (redirect, text, thread name) for each write() not yet delivered to listeners;
+    deque.append and deque.popleft are thread-safe so writers never take a lock """
 
 
 class _StdOutRedirectBaseClass:
     """Base class for StdOutRedirect and StdErrRedirect"""
 
+    stream = ""
+    """ name of the redirected stream, "stdout" or "stderr" """
+
     def __init__(self):
         self._echo = False
         self._listeners = {}
         self._listener_count = 0
+        self._detailed_listeners = set()
+        """ ids of listeners called with (text, stream, thread name) rather than (text) """
         self._redirect = False
 
         self.stdout = False
@@ -26,23 +41,35 @@ class _StdOutRedirectBaseClass:
         self._echo = val
 
     def register(self, listener):
+        """Register listener to be called with the text written to the stream;
+        listeners are always called on the Tk main thread.
+
+        If listener takes three arguments, it is called with (text, stream, thread name)
+        where stream is "stdout" or "stderr".
+        """
         if not callable(listener):
             raise ValueError("listener must be callable")
         self._listener_count += 1
         listener_id = self._listener_count
         self._listeners[listener_id] = listener
+        if _takes_stream(listener):
+            self._detailed_listeners.add(listener_id)
         self.enable_redirect()
         return listener_id
 
     def deregister(self, listener_id):
         del self._listeners[listener_id]
+        self._detailed_listeners.discard(listener_id)
         if not self._listeners:
             self.disable_redirect()
 
     def write(self, line):
+        """Queue line for delivery to the listeners; may be called from any thread"""
         if self._redirect:
-            for listener in self._listeners:
-                self._listeners[listener](line)
+            _queue.append((self, line, threading.current_thread().name))
+            # wake the Tk thread to deliver the output; writes made before it runs
+            # are delivered together
+            _TKRoot().call_soon_threadsafe(_drain, coalesce_key=_drain)
             if self.echo:
                 if self.stdout:
                     sys.__stdout__.write(line)
@@ -52,6 +79,14 @@ class _StdOutRedirectBaseClass:
     def flush(self):
         pass
 
+    def _deliver(self, text: str, thread: str):
+        """Call the listeners with text written by thread"""
+        for listener_id, listener in list(self._listeners.items()):
+            if listener_id in self._detailed_listeners:
+                listener(text, self.stream, thread)
+            else:
+                listener(text)
+
     def disable_redirect(self):
         self._redirect = False
         if self.stdout:
@@ -73,9 +108,41 @@ class _StdOutRedirectBaseClass:
             sys.stderr = sys.__stderr__
 
 
+def _takes_stream(listener: Callable) -> bool:
+    """Return True if listener can be called with (text, stream, thread name)"""
+    try:
+        parameters = inspect.signature(listener).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            positional += 1
+    return positional >= 3
+
+
+def _drain():
+    """Deliver queued output to listeners on the Tk main thread"""
+    # only deliver what has been queued so far so writers can't starve the event loop
+    # and join consecutive writes from the same stream and thread into a single chunk
+    chunks: list[tuple[_StdOutRedirectBaseClass, list[str], str]] = []
+    for _ in range(len(_queue)):
+        redirect, text, thread = _queue.popleft()
+        if chunks and chunks[-1][0] is redirect and chunks[-1][2] == thread:
+            chunks[-1][1].append(text)
+        else:
+            chunks.append((redirect, [text], thread))
+    for redirect, texts, thread in chunks:
+        redirect._deliver("".join(texts), thread)
+
+
 class StdOutRedirect(_StdOutRedirectBaseClass):
     """Singleton class that handles redirect"""
 
+    stream = "stdout"
+
     def __new__(cls, *args, **kwargs):
         """create new object or return instance of already created singleton"""
         if not hasattr(cls, "instance") or not cls.instance:
@@ -94,6 +161,8 @@ class StdOutRedirect(_StdOutRedirectBaseClass):
 class StdErrRedirect(_StdOutRedirectBaseClass):
     """Singleton class that handles redirect"""
 
+    stream = "stderr"
+
     def __new__(cls, *args, **kwargs):
         """create new object or return instance of already created singleton"""
         if not hasattr(cls, "instance") or not cls.instance:
@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import Grid, Pack, Place, ttk
-from typing import Any
+from typing import Any, Callable
 
 from ._debug import debug
 
@@ -390,3 +390,101 @@ class ScrolledFrame(ttk.Frame):
         elif event.num == 5:
             delta = 10
         self.yview_scroll(delta, tk.UNITS)
+
+
+class VirtualScrolledFrame(ScrolledFrame):
+    """A ScrolledFrame with a virtual scroll region.
+
+    The content frame always fills the container and is never moved. Instead, the
+    scrollbar tracks a virtual content height set with `set_virtual_height()` and
+    `on_scroll` is called with the offset in pixels of the top of the viewport
+    whenever the view changes so the owner can place just the visible content.
+
+    Args:
+        parent: The parent widget.
+        on_scroll: Callable called with the top offset of the viewport in pixels.
+        scroll_unit: The number of pixels to scroll per unit, e.g. the height of a row.
+        **kwargs: Passed to ScrolledFrame.
+    """
+
+    def __init__(
+        self,
+        parent: tk.BaseWidget,
+        on_scroll: Callable[[int], None],
+        scroll_unit: int = 1,
+        **kwargs: dict[str, Any],
+    ):
+        self._on_scroll = on_scroll
+        self._scroll_unit = max(scroll_unit, 1)
+        self._virtual_height = 0
+        self._top = 0
+        super().__init__(parent, **kwargs)
+        self.content_place(rely=0.0, relwidth=1.0, relheight=1.0)
+
+    @property
+    def top(self) -> int:
+        """Offset in pixels of the top of the viewport in the virtual content"""
+        return self._top
+
+    @property
+    def viewport_height(self) -> int:
+        """Height in pixels of the visible area"""
+        return self.container.winfo_height()
+
+    def set_virtual_height(self, height: int):
+        """Set the height in pixels of the virtual content and update the view"""
+        self._virtual_height = max(height, 0)
+        self.scroll_to(self._top)
+
+    def scroll_to(self, top: float):
+        """Scroll so that the viewport starts top pixels into the virtual content"""
+        outer = self.viewport_height
+        top = int(max(0, min(top, self._virtual_height - outer)))
+        self._top = top
+        if self.vscroll:
+            total = max(self._virtual_height, outer, 1)
+            self.vscroll.set(top / total, min((top + outer) / total, 1.0))
+        self._on_scroll(top)
+
+    def yview_moveto(self, fraction: float):
+        """Move the viewport to fraction of the virtual content"""
+        self.scroll_to(fraction * self._virtual_height)
+
+    def yview_scroll(self, number: int, what: str):
+        """Scroll the viewport by number units (see scroll_unit) or pages"""
+        step = self.viewport_height if what.startswith("page") else self._scroll_unit
+        self.scroll_to(self._top + number * step)
+
+    def _ymeasures(self):
+        """Measure the base size of the virtual content and the thumb size
+        for use in the yview methods"""
+        outer = max(self.viewport_height, 1)
+        inner = max(self._virtual_height, outer)
+        return inner / outer, outer / inner
+
+    def _resize_container(self, event=None):
+        """The container is sized by its parent, not by the virtual content"""
+        pass
+
+    def _on_map_child(self, event):
+        """Placing content doesn't change the view so nothing to do"""
+        pass
+
+    def _on_configure(self, event):
+        """Callback for when the widget is configured; re-render for the new size"""
+        self.scroll_to(self._top)
+
+    def _on_map(self, event):
+        self.scroll_to(self._top)
+
+    def _on_mousewheel(self, event):
+        """Callback for when the mouse wheel is scrolled; scrolls 3 units per notch."""
+        if self.winsys.lower() == "win32":
+            delta = -int(event.delta / 120) * 3
+        elif self.winsys.lower() == "aqua":
+            delta = -event.delta
+        elif event.num == 4:
+            delta = -3
+        else:
+            delta = 3
+        self.yview_scroll(delta, tk.UNITS)
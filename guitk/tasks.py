@@ -0,0 +1,69 @@
+"""Shared thread and process pools used to run background tasks for Window.run_in_thread()
+and Window.run_in_process()"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+__all__ = ["process_pool", "set_max_workers", "shutdown_pools", "thread_pool"]
+
+_lock = threading.Lock()
+_thread_pool: ThreadPoolExecutor | None = None
+_process_pool: ProcessPoolExecutor | None = None
+_max_thread_workers: int | None = None
+_max_process_workers: int | None = None
+
+
+def thread_pool() -> ThreadPoolExecutor:
+    """Return the thread pool shared by all windows, creating it if needed"""
+    global _thread_pool
+    with _lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=_max_thread_workers, thread_name_prefix="guitk"
+            )
+        return _thread_pool
+
+
+def process_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by all windows, creating it if needed"""
+    global _process_pool
+    with _lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=_max_process_workers)
+        return _process_pool
+
+
+def set_max_workers(threads: int | None = None, processes: int | None = None):
+    """Set the maximum number of workers in the shared pools.
+
+    Args:
+        threads (int | None, optional): Maximum number of worker threads.
+            Defaults to None which uses the ThreadPoolExecutor default.
+        processes (int | None, optional): Maximum number of worker processes.
+            Defaults to None which uses the ProcessPoolExecutor default.
+
+    Note:
+        Takes effect the next time a pool is created so must be called before the first
+        task is run or after shutdown_pools().
+    """
+    global _max_thread_workers, _max_process_workers
+    _max_thread_workers = threads
+    _max_process_workers = processes
+
+
+def shutdown_pools(wait: bool = True):
+    """Shut down the shared pools, cancelling tasks which haven't started.
+
+    Args:
+        wait (bool, optional): If True, wait for running tasks to finish. Defaults to True.
+    """
+    global _thread_pool, _process_pool
+    with _lock:
+        pools = [pool for pool in (_thread_pool, _process_pool) if pool is not None]
+        _thread_pool = _process_pool = None
+    for pool in pools:
+        with contextlib.suppress(RuntimeError):
+            pool.shutdown(wait=wait, cancel_futures=True)
@@ -4,17 +4,21 @@
 from __future__ import annotations
 
 import contextlib
+import os
+import subprocess
 import tkinter as tk
-from typing import Hashable, TypeVar
+from collections import deque
+from typing import IO, Hashable, TypeVar
 
 from guitk.redirect import StdErrRedirect, StdOutRedirect
 
+from ._process import _ProcessStream
 from .basewidget import BaseWidget
 from .events import Event, EventCommand, EventType
-from .types import CommandType, PadType, TooltipType
+from .types import CommandType, PadType, TagType, TooltipType
 from .utils import scrolled_widget_factory
 
-__all__ = ["Text", "Output"]
+__all__ = ["Text", "Output", "ProcessOutput"]
 
 
 _valid_standard_attributes = {
@@ -83,6 +87,12 @@ class Text(BaseWidget):
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        flush_interval: int | None = None,
+        max_lines: int | None = None,
+        max_bytes: int | None = None,
+        history_file: str | os.PathLike | None = None,
+        debounce: int | None = None,
+        throttle: int | None = None,
         **kwargs,
     ):
         """
@@ -108,10 +118,28 @@ class Text(BaseWidget):
             weighty (int | None, optional): Weight of the widget in the y direction. Defaults to None.
             focus (bool, optional): If True, widget has focus. Defaults to False.
                 Only one widget in a window can have focus.HLayout
+            flush_interval (int | None, optional): Milliseconds to buffer text written with
+                write() before inserting it into the text box. Defaults to None which inserts
+                buffered text as soon as the event loop is idle.
+            max_lines (int | None, optional): Maximum number of lines to keep; when exceeded,
+                the oldest lines are removed. Defaults to None (no limit).
+            max_bytes (int | None, optional): Maximum size in bytes (UTF-8) of the text to keep;
+                when exceeded, the oldest lines are removed. Defaults to None (no limit).
+            history_file (str | os.PathLike | None, optional): If set, all text written with
+                write() is also appended to this file so the full history is kept even when
+                old lines are removed by max_lines or max_bytes. Defaults to None.
+            debounce (int | None, optional): If set, command is called only once events have
+                stopped arriving for debounce milliseconds. Defaults to None.
+            throttle (int | None, optional): If set, command is called at most once every
+                throttle milliseconds. Defaults to None.
             **kwargs: Additional keyword arguments are passed to tk Text.
 
         Note:
             Emits EventType.KeyRelease events when the text is changed and events is True.
+            max_lines and max_bytes only account for text set with value or written with
+            write(), not for text typed into the text box. When a limit is exceeded, lines are
+            removed in a batch so the text is 10% under the limit, rather than one line
+            at a time.
         """
         super().__init__(
             key=key,
@@ -127,6 +155,8 @@ class Text(BaseWidget):
             weightx=weightx,
             weighty=weighty,
             focus=focus,
+            debounce=debounce,
+            throttle=throttle,
         )
         self.widget_type = "tk.Text"
         self.key = key or "Text"
@@ -138,6 +168,27 @@ class Text(BaseWidget):
         self.vscrollbar = vscrollbar
         self.hscrollbar = hscrollbar
         self.kwargs = kwargs
+        self.flush_interval = flush_interval
+
+        self._pending_writes: list[tuple[str, TagType]] = []
+        """ (text, tag) written with write() but not yet inserted into the text box """
+
+        self._flush_id: str | None = None
+        """ after() id of the scheduled flush """
+
+        self._scrollback = (
+            _Scrollback(max_lines, max_bytes)
+            if max_lines is not None or max_bytes is not None
+            else None
+        )
+        """ tracks line sizes to enforce max_lines and max_bytes """
+
+        self.history_file = history_file
+        self._history: IO[str] | None = None
+        """ history_file opened for appending """
+
+        self._closed = False
+        """ set to True when the tk widget is destroyed """
 
     def _create_widget(self, parent, window: "Window", row, col):
         kwargs_text = {
@@ -169,14 +220,143 @@ class Text(BaseWidget):
                     key=self.key,
                     event_type=EventType.KeyRelease,
                     command=self._command,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
         if self._disabled:
             self.widget["state"] = "disabled"
 
+        if self._pending_writes:
+            self._schedule_flush()
+
+        self.widget.bind("<Destroy>", self._on_destroy, "+")
+
         return self.widget
 
+    def write(self, text: str, tag: TagType = None):
+        """Append text to the end of the text box and scroll to the end.
+
+        Writes are buffered and inserted together, with a single insert and a single scroll,
+        once flush_interval milliseconds have elapsed (or when the event loop is idle if
+        flush_interval is None) so that many small writes don't block the event loop.
+
+        Args:
+            text (str): The text to append.
+            tag (str | tuple[str, ...] | None, optional): Text tag(s) to apply to the text.
+        """
+        if self._closed:
+            return
+        self._pending_writes.append((text, tag))
+        if self._flush_id is None and self._has_been_created:
+            self._schedule_flush()
+
+    def flush(self):
+        """Insert any text buffered by write() into the text box now"""
+        if self._flush_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self.widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._pending_writes or not self._has_been_created or self._closed:
+            return
+
+        if self.history_file is not None:
+            self._write_history("".join(text for text, _ in self._pending_writes))
+        if self._scrollback:
+            self._pending_writes = self._scrollback.trim_pending(self._pending_writes)
+
+        # coalesce consecutive writes with the same tag into a single run
+        runs: list[list] = []
+        for text, tag in self._pending_writes:
+            if runs and runs[-1][1] == tag:
+                runs[-1][0].append(text)
+            else:
+                runs.append([[text], tag])
+        self._pending_writes = []
+        args = []
+        for texts, tag in runs:
+            args.extend(("".join(texts), tag or ""))
+
+        with contextlib.suppress(tk.TclError):
+            # ignore TclError if widget has been destroyed while trying to write
+            self._insert_end(args)
+            if self._scrollback:
+                self._scrollback.add(args[::2])
+                self._trim_head()
+            self.text.yview(tk.END)
+        self._flushed()
+
+    def clear(self):
+        """Delete all text from the text box, including text buffered by write()"""
+        if self._flush_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self.widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._pending_writes = []
+        if not self._has_been_created:
+            return
+
+        disabled = self.text["state"] == tk.DISABLED
+        if disabled:
+            self.text["state"] = tk.NORMAL
+        self.text.delete("1.0", tk.END)
+        if disabled:
+            self.text["state"] = tk.DISABLED
+        if self._scrollback:
+            self._scrollback.reset([])
+
+    def _trim_head(self):
+        """Remove the oldest lines if the text exceeds max_lines or max_bytes"""
+        if count := self._scrollback.excess():
+            disabled = self.text["state"] == tk.DISABLED
+            if disabled:
+                self.text["state"] = tk.NORMAL
+            self.text.delete("1.0", f"{count + 1}.0")
+            if disabled:
+                self.text["state"] = tk.DISABLED
+            self._scrollback.remove_head(count)
+
+    def _write_history(self, text: str):
+        """Append text to history_file"""
+        if self._history is None:
+            self._history = open(self.history_file, "a", encoding="utf-8")
+        self._history.write(text)
+        self._history.flush()
+
+    def _on_destroy(self, event=None):
+        """Cancel any pending flush and close history_file when the widget is destroyed"""
+        self._closed = True
+        if self._flush_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self.widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._pending_writes = []
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+
+    def _insert_end(self, args: list[str | TagType]):
+        """Insert text, tag pairs at the end of the text box with a single insert"""
+        disabled = self.text["state"] == tk.DISABLED
+        if disabled:
+            # a disabled text box ignores insert
+            self.text["state"] = tk.NORMAL
+        self.text.insert(tk.END, *args)
+        if disabled:
+            self.text["state"] = tk.DISABLED
+
+    def _schedule_flush(self):
+        """Schedule flush() for flush_interval milliseconds from now or when idle"""
+        if self.flush_interval:
+            self._flush_id = self.widget.after(self.flush_interval, self.flush)
+        else:
+            self._flush_id = self.widget.after_idle(self.flush)
+
+    def _flushed(self):
+        """Called after buffered text has been inserted by flush()"""
+        pass
+
     @property
     def value(self):
         return self.widget.get("1.0", tk.END).rstrip()
@@ -185,6 +365,9 @@ class Text(BaseWidget):
     def value(self, text):
         self.widget.delete("1.0", tk.END)
         self.widget.insert("1.0", text)
+        if self._scrollback:
+            self._scrollback.reset([text])
+            self._trim_head()
 
     @property
     def text(self):
@@ -192,6 +375,76 @@ class Text(BaseWidget):
         return self.widget
 
 
+class _Scrollback:
+    """Tracks the size of each line in a text box to enforce a maximum number of lines
+    and/or bytes"""
+
+    def __init__(self, max_lines: int | None, max_bytes: int | None):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self._line_bytes: deque[int] = deque([0])
+        """ size in bytes of each line, including the newline; the last line is partial """
+        self._bytes = 0
+
+    def reset(self, texts: list[str]):
+        """Start tracking a text box that contains texts"""
+        self._line_bytes = deque([0])
+        self._bytes = 0
+        self.add(texts)
+
+    def add(self, texts: list[str]):
+        """Track texts appended to the end of the text box"""
+        line_bytes = self._line_bytes
+        for text in texts:
+            lines = text.split("\n")
+            sizes = [len(line.encode("utf-8")) + 1 for line in lines]
+            # the last line doesn't end in a newline
+            sizes[-1] -= 1
+            line_bytes[-1] += sizes[0]
+            line_bytes.extend(sizes[1:])
+            self._bytes += sum(sizes)
+
+    def excess(self) -> int:
+        """Return the number of lines to remove from the head to satisfy the limits"""
+        line_bytes = self._line_bytes
+        lines = len(line_bytes) - (line_bytes[-1] == 0)
+        count = 0
+        if self.max_lines is not None and lines > self.max_lines:
+            count = lines - (self.max_lines - self.max_lines // 10)
+        if self.max_bytes is not None and self._bytes > self.max_bytes:
+            excess_bytes = self._bytes - (self.max_bytes - self.max_bytes // 10)
+            byte_count = 0
+            for size in line_bytes:
+                if excess_bytes <= 0:
+                    break
+                excess_bytes -= size
+                byte_count += 1
+            count = max(count, byte_count)
+        # never remove the last (partial) line
+        return min(count, len(line_bytes) - 1)
+
+    def remove_head(self, count: int):
+        """Stop tracking the first count lines"""
+        for _ in range(count):
+            self._bytes -= self._line_bytes.popleft()
+
+    def trim_pending(
+        self, writes: list[tuple[str, TagType]]
+    ) -> list[tuple[str, TagType]]:
+        """Drop the oldest of writes that would be removed as soon as they are inserted"""
+        lines = 0
+        size = 0
+        for idx in range(len(writes) - 1, 0, -1):
+            text = writes[idx][0]
+            lines += text.count("\n")
+            size += len(text.encode("utf-8"))
+            if (self.max_lines is not None and lines > self.max_lines) or (
+                self.max_bytes is not None and size > self.max_bytes
+            ):
+                return writes[idx:]
+        return writes
+
+
 # TODO: how to make Output read-only?
 class Output(Text):
     """Text box that redirects stderr and/or stdout to the text box."""
@@ -218,6 +471,10 @@ class Output(Text):
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        flush_interval: int | None = 20,
+        max_lines: int | None = None,
+        max_bytes: int | None = None,
+        history_file: str | os.PathLike | None = None,
         **kwargs,
     ):
         """
@@ -246,7 +503,20 @@ class Output(Text):
             weighty (int | None, optional): Weight of the widget in the y direction. Defaults to None.
             focus (bool, optional): If True, widget has focus. Defaults to False.
                 Only one widget in a window can have focus.HLayout
+            flush_interval (int | None, optional): Milliseconds to buffer output before
+                inserting it into the text box. Higher values trade latency for throughput.
+                Defaults to 20. If None, output is inserted as soon as the event loop is idle.
+            max_lines (int | None, optional): Maximum number of lines of output to keep; when
+                exceeded, the oldest lines are removed. Defaults to None (no limit).
+            max_bytes (int | None, optional): Maximum size in bytes (UTF-8) of output to keep;
+                when exceeded, the oldest lines are removed. Defaults to None (no limit).
+            history_file (str | os.PathLike | None, optional): If set, all output is also
+                appended to this file so the full history can be searched. Defaults to None.
             **kwargs: Additional keyword arguments are passed to tk Text.
+
+        Note:
+            If events is True, emits a single EventType.OutputWrite event each time
+            buffered output is inserted into the text box.
         """
         super().__init__(
             text=text,
@@ -266,6 +536,10 @@ class Output(Text):
             weightx=weightx,
             weighty=weighty,
             focus=focus,
+            flush_interval=flush_interval,
+            max_lines=max_lines,
+            max_bytes=max_bytes,
+            history_file=history_file,
             **kwargs,
         )
 
@@ -305,11 +579,11 @@ class Output(Text):
             r.echo = self._echo
             self._redirect_id[r] = r.register(self._write)
 
-    def _write(self, line):
-        with contextlib.suppress(tk.TclError):
-            # ignore TclError if widget has been destroyed while trying to write
-            self.text.insert(tk.END, line)
-            self.text.yview(tk.END)
+    def _write(self, text: str, stream: str, thread: str):
+        """Called on the Tk main thread with output redirected from stream by thread"""
+        self.write(text, tag=stream)
+
+    def _flushed(self):
         self.window.root.event_generate(EventType.OutputWrite.value)
 
     @property
@@ -334,6 +608,196 @@ class Output(Text):
         for r in self._redirect:
             r.enable_redirect()
 
-    def __del__(self):
+    def _deregister_redirect(self):
+        """Stop receiving redirected output"""
         for r, id_ in self._redirect_id.items():
-            r.deregister(id_)
+            with contextlib.suppress(KeyError):
+                r.deregister(id_)
+        self._redirect_id = {}
+
+    def __del__(self):
+        self._deregister_redirect()
+
+
+class ProcessOutput(Text):
+    """Text box that runs a process and displays its output as it is produced."""
+
+    def __init__(
+        self,
+        key: Hashable | None = None,
+        width: int = 80,
+        height: int = 20,
+        columnspan: int | None = None,
+        rowspan: int | None = None,
+        padx: PadType | None = None,
+        pady: PadType | None = None,
+        events: bool = True,
+        sticky: str | None = None,
+        tooltip: TooltipType = None,
+        vscrollbar: bool = True,
+        hscrollbar: bool = False,
+        stderr: bool = True,
+        encoding: str = "utf-8",
+        weightx: int | None = None,
+        weighty: int | None = None,
+        flush_interval: int | None = 50,
+        max_lines: int | None = 10_000,
+        max_bytes: int | None = None,
+        history_file: str | os.PathLike | None = None,
+        read_budget: int = 1_048_576,
+        **kwargs,
+    ):
+        """
+        Initialize a ProcessOutput widget.
+
+        Args:
+            key (Hashable, optional): Unique key for this widget. Defaults to None.
+            width (int, optional): Width of the text box. Defaults to 80.
+            height (int, optional): Height of the text box. Defaults to 20.
+            columnspan (int | None, optional): Number of columns to span. Defaults to None.
+            rowspan (int | None, optional): Number of rows to span. Defaults to None.
+            padx (PadType | None, optional): X padding. Defaults to None.
+            pady (PadType | None, optional): Y padding. Defaults to None.
+            events (bool, optional): Enable events for this widget. Defaults to True.
+            sticky (str | None, optional): Sticky direction for widget layout. Defaults to None.
+            tooltip (TooltipType | None, optional): Tooltip text or callback to generate tooltip text. Defaults to None.
+            vscrollbar (bool, optional): Show vertical scrollbar. Defaults to True.
+            hscrollbar (bool, optional): Show horizontal scrollbar. Defaults to False.
+            stderr (bool, optional): Also capture the process's stderr. Defaults to True.
+            encoding (str, optional): Encoding used to decode the output. Defaults to "utf-8".
+            weightx (int | None, optional): Weight of the widget in the x direction. Defaults to None.
+            weighty (int | None, optional): Weight of the widget in the y direction. Defaults to None.
+            flush_interval (int | None, optional): Milliseconds to buffer output before inserting
+                it into the text box. Defaults to 50.
+            max_lines (int | None, optional): Maximum number of lines to keep; when exceeded,
+                the oldest lines are removed. Defaults to 10,000.
+            max_bytes (int | None, optional): Maximum size in bytes (UTF-8) of the text to keep;
+                when exceeded, the oldest lines are removed. Defaults to None (no limit).
+            history_file (str | os.PathLike | None, optional): If set, all output is also
+                appended to this file. Defaults to None.
+            read_budget (int, optional): Maximum number of bytes to read from the process
+                between flushes; once reached, reading pauses until the buffered output has
+                been inserted so a process producing output faster than it can be displayed
+                is blocked rather than using memory. Defaults to 1 MiB.
+            **kwargs: Additional keyword arguments are passed to tk Text.
+
+        Note:
+            If events is True, emits EventType.ProcessProgress, with the number of bytes read
+            so far as payload, each time output is inserted into the text box, and
+            EventType.ProcessExit, with the exit code as payload, when the process exits.
+            Output written to stdout is tagged "stdout" and output written to stderr is
+            tagged "stderr". The process is terminated if the widget is destroyed while it
+            is running.
+        """
+        super().__init__(
+            key=key,
+            width=width,
+            height=height,
+            disabled=True,
+            rowspan=rowspan,
+            columnspan=columnspan,
+            padx=padx,
+            pady=pady,
+            events=events,
+            sticky=sticky,
+            tooltip=tooltip,
+            vscrollbar=vscrollbar,
+            hscrollbar=hscrollbar,
+            weightx=weightx,
+            weighty=weighty,
+            flush_interval=flush_interval,
+            max_lines=max_lines,
+            max_bytes=max_bytes,
+            history_file=history_file,
+            **kwargs,
+        )
+        self.key = key or "ProcessOutput"
+        self._stderr = stderr
+        self.encoding = encoding
+        self.read_budget = read_budget
+
+        self._stream: _ProcessStream | None = None
+        """ reads the output of the running process """
+
+        self._flushed_bytes = 0
+        """ bytes read from the process when output was last flushed """
+
+    def _create_widget(self, parent, window: "Window", row, col):
+        self.widget = super()._create_widget(parent, window, row, col)
+
+        # Unbind <KeyRelease> since this isn't for user input
+        self.widget.unbind("<KeyRelease>")
+        self.widget.bind("<Destroy>", lambda event: self.terminate(), "+")
+
+        return self.widget
+
+    @property
+    def process(self) -> subprocess.Popen | None:
+        """Return the process most recently started with run() or None"""
+        return self._stream.process if self._stream else None
+
+    @property
+    def running(self) -> bool:
+        """Return True if a process started with run() is still running"""
+        return self._stream is not None and self._stream.process.poll() is None
+
+    def run(self, args: str | list[str], **kwargs) -> subprocess.Popen:
+        """Clear the text box, then run a process and display its output.
+
+        Args:
+            args (str | list[str]): Program and arguments, as for subprocess.Popen.
+            **kwargs: Additional keyword arguments are passed to subprocess.Popen.
+
+        Returns:
+            subprocess.Popen: The process.
+
+        Raises:
+            RuntimeError: If a process started with run() is still running.
+        """
+        if self.running:
+            raise RuntimeError("A process is already running")
+        self.clear()
+        self._flushed_bytes = 0
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if self._stderr else None,
+            **kwargs,
+        )
+        self._stream = _ProcessStream(
+            self._tk,
+            process,
+            on_output=self._on_output,
+            on_exit=self._on_exit,
+            encoding=self.encoding,
+        )
+        self._stream.start()
+        return process
+
+    def terminate(self):
+        """Terminate the running process and stop reading its output"""
+        if self._stream is not None:
+            self._stream.stop()
+
+    def _on_output(self, text: str, stream: str):
+        """Called on the Tk thread with text read from the process's stream"""
+        self.write(text, tag=stream)
+        if self._stream.bytes_read - self._flushed_bytes >= self.read_budget:
+            # let the text box catch up before reading more
+            self._stream.pause()
+
+    def _on_exit(self, returncode: int):
+        """Called on the Tk thread when the process has exited"""
+        self.flush()
+        self._emit(EventType.ProcessExit, returncode)
+
+    def _flushed(self):
+        if self._stream is not None:
+            self._flushed_bytes = self._stream.bytes_read
+            self._stream.resume()
+            self._emit(EventType.ProcessProgress, self._stream.bytes_read)
+
+    def _emit(self, event_type: EventType, payload):
+        """Send event_type with payload to the window"""
+        if self.window is not None:
+            self.window._emit_event(self.key, event_type, payload, widget=self)
@@ -2,16 +2,78 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import math
+import os
+import selectors
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
-from typing import TypeVar
+from typing import Any, Callable, Coroutine, Hashable, TypeVar
 
 # create a custom type for type hinting a Window object which is defined later in this module
 Window = TypeVar("Window")
 
 __all__ = ["_TKRoot"]
 
+ASYNCIO_INTERVAL_MS = 5
+""" milliseconds between iterations of the asyncio event loop while the Tk mainloop runs,
+    used only if Tk can't watch the asyncio event loop's selector (e.g. on Windows),
+    and before retrying an iteration skipped because the loop was already running """
+
+CALLBACK_POLL_MS = 10
+""" milliseconds between checks for callbacks from other threads if Tk can't watch a pipe """
+
+
+class _TkSelector(selectors.BaseSelector):
+    """Selector for the asyncio event loop run inside the Tk mainloop.
+
+    Tk waits for I/O instead of the event loop: while stepping, select() doesn't block
+    but stops the loop after the current iteration and records the timeout the loop
+    asked for, which is how long until it next has work to do."""
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.stepping = False
+        """ True while _TKRoot runs an iteration of the event loop """
+
+        self.timeout: float | None = None
+        """ timeout passed to the last select(): 0 if callbacks were ready, otherwise
+            seconds until the next timer is due or None if no timers are scheduled """
+
+        self.had_events = False
+        """ True if the last select() returned I/O events """
+
+    def fileno(self) -> int:
+        return self._selector.fileno()
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def get_map(self):
+        return self._selector.get_map()
+
+    def close(self):
+        self._selector.close()
+
+    def select(self, timeout=None):
+        if not self.stepping:
+            return self._selector.select(timeout)
+        self.timeout = timeout
+        events = self._selector.select(0)
+        self.had_events = bool(events)
+        self.loop.stop()
+        return events
+
 
 class _TKRoot:
     """Singleton that returns a tkinter.TK() object; there can be only one in an app"""
@@ -39,6 +101,38 @@ class _TKRoot:
         self.windows: dict = {}
         self.mainloop_is_running: bool = False
 
+        self._asyncio_loop: asyncio.AbstractEventLoop | None = None
+        """ asyncio event loop run inside the Tk mainloop, created when first needed """
+
+        self._asyncio_after_id: str | None = None
+        """ after() id of the next iteration of the asyncio event loop """
+
+        self._asyncio_running = False
+        """ True while the asyncio event loop is run inside the Tk mainloop """
+
+        self._asyncio_selector: _TkSelector | None = None
+        """ selector of the asyncio event loop, None if the loop is polled """
+
+        self._asyncio_fd: int | None = None
+        """ file descriptor of the asyncio selector watched by Tk, None if polling """
+
+        self._callbacks: deque[tuple[Callable[..., Any] | None, tuple, Hashable]] = deque()
+        """ (callback, args, coalesce_key) queued by call_soon_threadsafe() to run on the
+            Tk thread; callback is None for a coalesced callback stored in _coalesced """
+
+        self._coalesced: dict[Hashable, tuple[Callable[..., Any], tuple]] = {}
+        """ most recent (callback, args) queued for each coalesce_key """
+
+        self._coalesce_lock = threading.Lock()
+
+        self._wakeup_fds: tuple[int, int] | None = None
+        """ (read, write) ends of the pipe written to wake Tk when a callback is queued """
+
+        self._wakeup_pending = False
+        """ True if Tk has been woken but hasn't yet run the queued callbacks """
+
+        self._start_callbacks()
+
     def register(self, window: Window):
         """Register a new child window"""
         if not self.first_window:
@@ -61,9 +155,213 @@ class _TKRoot:
         """Return child windows of parent window"""
         return [w for w in self.windows if w._parent == window.window]
 
-    def run_mainloop(self):
-        if not self.mainloop_is_running:
-            self.root.mainloop()
+    def run_mainloop(self, use_asyncio: bool = False):
+        """Run the Tk mainloop; if use_asyncio is True, also run the asyncio event loop"""
+        if self.mainloop_is_running:
+            return
+        if use_asyncio:
+            self.start_asyncio()
+        self.root.mainloop()
+        if self._asyncio_running:
+            self._stop_asyncio()
+            # let any tasks cancelled while closing the windows finish
+            self._step_asyncio_loop()
+
+    def call_soon_threadsafe(
+        self,
+        callback: Callable[..., Any],
+        *args: Any,
+        coalesce_key: Hashable | None = None,
+    ):
+        """Run callback(*args) on the Tk main thread as soon as possible;
+        may be called from any thread.
+
+        If coalesce_key is not None and a callback queued with the same coalesce_key
+        hasn't run yet, it is replaced by this one so only the most recent runs.
+        """
+        if coalesce_key is None:
+            # deque.append is thread-safe and the Tk thread only pops from the left
+            self._callbacks.append((callback, args, None))
+        else:
+            with self._coalesce_lock:
+                queued = coalesce_key in self._coalesced
+                self._coalesced[coalesce_key] = (callback, args)
+            if queued:
+                return
+            self._callbacks.append((None, (), coalesce_key))
+
+        # wake Tk once per batch of callbacks rather than for every callback
+        if self._wakeup_pending:
+            return
+        self._wakeup_pending = True
+        if self._wakeup_fds is not None:
+            with contextlib.suppress(OSError):
+                os.write(self._wakeup_fds[1], b"\0")
+
+    def _start_callbacks(self):
+        """Start running callbacks queued by call_soon_threadsafe() on the Tk thread"""
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        try:
+            # wake Tk as soon as a callback is queued
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_wakeup)
+        except (AttributeError, tk.TclError):
+            # createfilehandler is not available on Windows so poll instead
+            os.close(read_fd)
+            os.close(write_fd)
+            self.root.after(CALLBACK_POLL_MS, self._poll_callbacks)
+            return
+        self._wakeup_fds = (read_fd, write_fd)
+
+    def _on_wakeup(self, fd: int, mask: int):
+        """Called by Tk when the wakeup pipe is readable"""
+        with contextlib.suppress(BlockingIOError):
+            while os.read(fd, 4096):
+                pass
+        self._run_callbacks()
+
+    def _poll_callbacks(self):
+        """Run queued callbacks then check again in CALLBACK_POLL_MS"""
+        self._run_callbacks()
+        self.root.after(CALLBACK_POLL_MS, self._poll_callbacks)
+
+    def _run_callbacks(self):
+        """Run the callbacks queued by call_soon_threadsafe()"""
+        self._wakeup_pending = False
+        # only run what has been queued so far so other threads can't starve the event loop
+        for _ in range(len(self._callbacks)):
+            callback, args, coalesce_key = self._callbacks.popleft()
+            if callback is None:
+                with self._coalesce_lock:
+                    callback, args = self._coalesced.pop(coalesce_key)
+            try:
+                callback(*args)
+            except Exception as e:
+                self.root.report_callback_exception(type(e), e, e.__traceback__)
+
+    @property
+    def asyncio_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the asyncio event loop run inside the Tk mainloop"""
+        if self._asyncio_loop is None:
+            if hasattr(self.root.tk, "createfilehandler"):
+                # Tk can wait on the loop's selector so give the loop one Tk can watch
+                self._asyncio_selector = _TkSelector()
+                self._asyncio_loop = asyncio.SelectorEventLoop(self._asyncio_selector)
+                self._asyncio_selector.loop = self._asyncio_loop
+            else:
+                self._asyncio_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._asyncio_loop)
+        return self._asyncio_loop
+
+    def create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Schedule coro to run as an asyncio Task inside the Tk mainloop"""
+        task = self.asyncio_loop.create_task(coro)
+        self.start_asyncio()
+        return task
+
+    def start_asyncio(self):
+        """Start running the asyncio event loop inside the Tk mainloop, or run an
+        iteration soon if it's already running, e.g. because a task was created"""
+        if not self._asyncio_running:
+            self._asyncio_running = True
+            self._watch_asyncio_selector()
+        self._schedule_asyncio(0)
+
+    def _watch_asyncio_selector(self):
+        """Have Tk run the asyncio event loop when its selector is ready, that is when
+        asyncio I/O is ready or a callback is added from another thread, so an idle
+        loop costs nothing"""
+        selector = self._asyncio_selector
+        if selector is None:
+            return
+        try:
+            fd = selector.fileno()
+            self.root.tk.createfilehandler(
+                fd, tk.READABLE, lambda fd, mask: self._schedule_asyncio(0)
+            )
+        except (AttributeError, OSError, tk.TclError):
+            # no pollable selector (e.g. select()): poll instead
+            return
+        self._asyncio_fd = fd
+
+    def _stop_asyncio(self):
+        """Stop running the asyncio event loop inside the Tk mainloop"""
+        self._asyncio_running = False
+        if self._asyncio_after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self.root.after_cancel(self._asyncio_after_id)
+            self._asyncio_after_id = None
+        if self._asyncio_fd is not None:
+            with contextlib.suppress(tk.TclError):
+                self.root.tk.deletefilehandler(self._asyncio_fd)
+            self._asyncio_fd = None
+
+    def _schedule_asyncio(self, delay: int):
+        """Run an iteration of the asyncio event loop in delay milliseconds"""
+        if self._asyncio_after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self.root.after_cancel(self._asyncio_after_id)
+        if delay:
+            self._asyncio_after_id = self.root.after(delay, self._run_asyncio)
+        else:
+            self._asyncio_after_id = self.root.after_idle(self._run_asyncio)
+
+    def _wake_asyncio(self):
+        """Run an iteration of the asyncio event loop soon in case callbacks were added to
+        it from outside the loop, e.g. by a Tk event handler setting a future's result"""
+        if self._asyncio_running and not self._asyncio_loop.is_running():
+            self._schedule_asyncio(0)
+
+    def _run_asyncio(self):
+        """Run one iteration of the asyncio event loop, which runs only the callbacks that
+        are ready so Tk events are never delayed by more than one iteration, then schedule
+        the next iteration for when the loop next has work"""
+        self._asyncio_after_id = None
+        if not self._asyncio_running:
+            return
+        if not self._step_asyncio_loop():
+            # Tk was re-entered from inside the loop, e.g. by update() or a modal dialog
+            self._schedule_asyncio(ASYNCIO_INTERVAL_MS)
+            return
+        if (delay := self._asyncio_delay()) is not None:
+            self._schedule_asyncio(delay)
+
+    def _asyncio_delay(self) -> int | None:
+        """Return milliseconds until the asyncio event loop next has work to do, or None
+        if it has nothing to do until Tk reports its selector is ready"""
+        selector = self._asyncio_selector
+        if selector is None or self._asyncio_fd is None:
+            # the loop's state can't be inspected and I/O is only noticed by polling
+            return ASYNCIO_INTERVAL_MS
+        if selector.timeout == 0 or selector.had_events:
+            # callbacks ran and may have added more work so check again when idle
+            return 0
+        if selector.timeout is None:
+            return None
+        # nothing ran so the next timer is still due when the loop said it was
+        return math.ceil(selector.timeout * 1000)
+
+    def _step_asyncio_loop(self) -> bool:
+        """Run the callbacks that are ready in the asyncio event loop without blocking;
+        returns False if the loop is already running"""
+        loop = self.asyncio_loop
+        if loop.is_running():
+            return False
+        selector = self._asyncio_selector
+        if selector is None:
+            # stop() is run after the callbacks already scheduled so run_forever() polls
+            # for I/O without waiting, runs the ready callbacks once, then returns
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+            return True
+        # the selector stops the loop after one iteration
+        selector.stepping = True
+        try:
+            loop.run_forever()
+        finally:
+            selector.stepping = False
+        return True
 
     @property
     def theme(self) -> str:
@@ -58,6 +58,8 @@ class Entry(BaseWidget):
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        debounce: int | None = None,
+        throttle: int | None = None,
         **kwargs,
     ):
         """Initialize an Entry widget.
@@ -80,6 +82,10 @@ class Entry(BaseWidget):
             weighty (int | None, optional): Weight for vertical resizing. Defaults to None.
             focus (bool, optional): If True, widget has focus. Defaults to False.
                 Only one widget in a window can have focus.HLayout
+            debounce (int | None, optional): If set, command is called only once events have
+                stopped arriving for debounce milliseconds. Defaults to None.
+            throttle (int | None, optional): If set, command is called at most once every
+                throttle milliseconds. Defaults to None.
             **kwargs: Additional keyword arguments are passed to ttk.Entry.
 
         Note:
@@ -100,6 +106,8 @@ class Entry(BaseWidget):
             weightx=weightx,
             weighty=weighty,
             focus=focus,
+            debounce=debounce,
+            throttle=throttle,
         )
         self.widget_type = "ttk.Entry"
         default = default or ""
@@ -144,6 +152,8 @@ class Entry(BaseWidget):
                     key=self.key,
                     event_type=EventType.KeyRelease,
                     command=self._command,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
@@ -213,6 +223,8 @@ class LabelEntry(Entry):
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        debounce: int | None = None,
+        throttle: int | None = None,
         **kwargs,
     ):
         """Initialize an Entry widget.
@@ -235,6 +247,10 @@ class LabelEntry(Entry):
             weightx (int | None, optional): Weight for horizontal resizing. Defaults to None.
             weighty (int | None, optional): Weight for vertical resizing. Defaults to None.
             focus (bool, optional): If True, widget will have focus. Defaults to False. Only one widget can have focus.
+            debounce (int | None, optional): If set, command is called only once events have
+                stopped arriving for debounce milliseconds. Defaults to None.
+            throttle (int | None, optional): If set, command is called at most once every
+                throttle milliseconds. Defaults to None.
             **kwargs: Additional keyword arguments are passed to ttk.Entry.
 
         Note:
@@ -258,6 +274,8 @@ class LabelEntry(Entry):
             focus=focus,
             weightx=weightx,
             weighty=weighty,
+            debounce=debounce,
+            throttle=throttle,
         )
         self.widget_type = "guitk.LabelEntry"
         self.text = text
@@ -291,6 +309,8 @@ class LabelEntry(Entry):
                     key=self.key,
                     event_type=EventType.KeyRelease,
                     command=self._command,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
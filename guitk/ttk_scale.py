@@ -83,6 +83,8 @@ class Scale(BaseWidget):
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        debounce: int | None = None,
+        throttle: int | None = None,
         **kwargs,
     ):
         """Initialize a ttk.Scale widget
@@ -111,6 +113,11 @@ class Scale(BaseWidget):
             weighty (int | None, optional): Weight for vertical resizing. Defaults to None.
             focus (bool, optional): If True, widget has focus. Defaults to False.
                 Only one widget in a window can have focus.HLayout
+            debounce (int | None, optional): If set, command and target_key updates happen
+                only once events have stopped arriving for debounce milliseconds.
+                Defaults to None.
+            throttle (int | None, optional): If set, command and target_key updates happen
+                at most once every throttle milliseconds. Defaults to None.
             **kwargs: Additional keyword arguments are passed to ttk.Entry.
 
         Note:
@@ -131,6 +138,8 @@ class Scale(BaseWidget):
             weightx=weightx,
             weighty=weighty,
             focus=focus,
+            debounce=debounce,
+            throttle=throttle,
         )
         self.widget_type = "ttk.Scale"
         self.key = key or "Scale"
@@ -188,6 +197,8 @@ class Scale(BaseWidget):
                     key=self.key,
                     event_type=EventType.ScaleUpdate,
                     command=self._command,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
@@ -203,6 +214,8 @@ class Scale(BaseWidget):
                     key=self.key,
                     event_type=EventType.ScaleUpdate,
                     command=update_target,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
@@ -69,6 +69,8 @@ class Spinbox(BaseWidget):
         weightx: int | None = None,
         weighty: int | None = None,
         focus: bool = False,
+        debounce: int | None = None,
+        throttle: int | None = None,
         **kwargs,
     ):
         """Initialize a ttk.Spinbox widget
@@ -96,6 +98,11 @@ class Spinbox(BaseWidget):
             weighty (int | None, optional): Weight for vertical resizing. Defaults to None.
             focus (bool, optional): If True, widget has focus. Defaults to False.
                 Only one widget in a window can have focus.HLayout
+            debounce (int | None, optional): If set, command and target_key updates happen
+                only once events have stopped arriving for debounce milliseconds.
+                Defaults to None.
+            throttle (int | None, optional): If set, command and target_key updates happen
+                at most once every throttle milliseconds. Defaults to None.
             **kwargs: Additional keyword arguments are passed to ttk.Entry.
 
         Note:
@@ -130,6 +137,8 @@ class Spinbox(BaseWidget):
             weightx=weightx,
             weighty=weighty,
             focus=focus,
+            debounce=debounce,
+            throttle=throttle,
         )
         self.widget_type = "ttk.Spinbox"
         self.key = key or "Spinbox"
@@ -189,6 +198,8 @@ class Spinbox(BaseWidget):
                     key=self.key,
                     event_type=EventType.SpinboxUpdate,
                     command=self._command,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
@@ -204,6 +215,8 @@ class Spinbox(BaseWidget):
                     key=self.key,
                     event_type=EventType.SpinboxUpdate,
                     command=update_target,
+                    debounce=self._debounce,
+                    throttle=self._throttle,
                 )
             )
 
@@ -3,18 +3,21 @@
 
 from __future__ import annotations
 
+import datetime
+import itertools
+import re
 import tkinter.ttk as ttk
-from typing import TYPE_CHECKING, Hashable
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Iterator, Sequence
 
 from .basewidget import BaseWidget
 from .events import Event, EventCommand, EventType
-from .types import CommandType, PadType, TooltipType
+from .types import CommandType, PadType, SortKeyType, TagsType, TooltipType
 from .utils import scrolled_widget_factory
 
 if TYPE_CHECKING:
     from .window import Window
 
-__all__ = ["ListBox", "Listbox", "TreeView", "Treeview"]
+__all__ = ["ListBox", "Listbox", "TreeView", "Treeview", "VirtualTreeview"]
 
 _valid_standard_attributes = {
     "class",
@@ -31,6 +34,38 @@ _valid_standard_attributes = {
 
 _valid_ttk_treeview_attributes = _valid_standard_attributes
 
+# Tcl procedures used by insert_rows() to insert many rows with a single Tcl evaluation;
+# each item in items is a list of {values tags} or {id values tags}
+_INSERT_ROWS = """{w parent items} {
+    set ids {}
+    foreach item $items {
+        lassign $item values tags
+        lappend ids [$w insert $parent end -values $values -tags $tags]
+    }
+    return $ids
+}"""
+
+_INSERT_ROWS_WITH_IDS = """{w parent items} {
+    set ids {}
+    foreach item $items {
+        lassign $item id values tags
+        lappend ids [$w insert $parent end -id $id -values $values -tags $tags]
+    }
+    return $ids
+}"""
+
+# Tcl procedure used to fetch the ID and value in a column of every top-level row
+# with a single Tcl evaluation
+_GET_COLUMN = """{w column} {
+    set values {}
+    foreach id [$w children {}] {
+        lappend values $id [$w set $id $column]
+    }
+    return $values
+}"""
+
+_DIGITS = re.compile(r"(\d+)")
+
 
 class Treeview(BaseWidget):
     """ttk.Treeview widget"""
@@ -199,16 +234,102 @@ class Treeview(BaseWidget):
                 key=event.key, event_type=event.event_type, command=command
             )
 
-    def sort_on_column(self, column_name, key=None, reverse=False):
-        """sort the tree view contents based on column_name
-        optional key same as sort(key=)
+    def insert_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        tags: TagsType = None,
+        iids: Iterable[str] | None = None,
+        parent: str = "",
+        chunk_size: int | None = None,
+        callback: Callable[[list[str]], None] | None = None,
+    ) -> list[str] | None:
+        """Insert many rows at the end of the tree with one Tcl evaluation per chunk
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to insert; each row is a sequence of
+                column values.
+            tags (Sequence[Iterable[str]] | Callable, optional): Tags for the rows; either a
+                sequence with the tags for each row or a callable that is called with a row's
+                values and returns the tags for that row. Defaults to None (no tags).
+            iids (Iterable[str], optional): Unique IDs for the rows. Defaults to None which
+                lets the Treeview generate the IDs.
+            parent (str, optional): ID of the parent item. Defaults to "" (top level).
+            chunk_size (int, optional): If set, insert chunk_size rows at a time, returning to
+                the event loop between chunks so the UI stays responsive while loading
+                many rows. Defaults to None (insert all rows at once).
+            callback (Callable[[list[str]], None], optional): Called with the list of IDs of
+                the inserted rows once all rows have been inserted.
+
+        Returns:
+            List of the IDs of the inserted rows or None if chunk_size is set.
+        """
+        items = _tree_items(rows, tags, iids)
+        with_ids = iids is not None
+        if not chunk_size:
+            inserted = self._insert_items(parent, list(items), with_ids)
+            if callback:
+                callback(inserted)
+            return inserted
+
+        inserted = []
+
+        def _insert_chunk():
+            if not self.tree.winfo_exists():
+                # widget was destroyed while loading
+                return
+            chunk = list(itertools.islice(items, chunk_size))
+            inserted.extend(self._insert_items(parent, chunk, with_ids))
+            if len(chunk) == chunk_size:
+                self.tree.after(1, _insert_chunk)
+            elif callback:
+                callback(inserted)
+
+        _insert_chunk()
+        return None
+
+    def _insert_items(
+        self, parent: str, items: list[tuple[Any, ...]], with_ids: bool
+    ) -> list[str]:
+        """Insert items produced by _tree_items() into the tree and return their IDs"""
+        if not items:
+            return []
+        body = _INSERT_ROWS_WITH_IDS if with_ids else _INSERT_ROWS
+        tree = self.tree
+        inserted = tree.tk.call("apply", body, tree, parent, items)
+        return list(tree.tk.splitlist(inserted))
+
+    def sort_on_column(
+        self,
+        column_name: str,
+        key: SortKeyType = None,
+        reverse: bool = False,
+    ):
+        """Sort the top-level rows of the tree view based on column_name
+
+        Args:
+            column_name (str): The column to sort on.
+            key (str | Callable, optional): How to compare values: "numeric", "date" (ISO 8601
+                strings or date/datetime objects), "natural" (e.g. "file2" before "file10"),
+                "str", or a callable called with (value, item ID) tuples like sort(key=).
+                Defaults to None which sorts by value then item ID.
+            reverse (bool, optional): Sort in descending order. Defaults to False.
+
+        Note:
+            The values are fetched from the tree with a single Tcl evaluation, sorted in
+            Python as the strings stored in the tree, and the new order is applied with
+            a single call to the tree.
         """
+        tree = self.tree
+        ids_values = tree.tk.splitlist(
+            tree.tk.call("apply", _GET_COLUMN, tree, column_name)
+        )
+        # values stored as Tcl numbers are returned as Python numbers so convert them back
         values = [
-            (self.tree.set(k, column_name), k) for k in self.tree.get_children("")
+            (value if isinstance(value, str) else str(value), iid)
+            for iid, value in zip(ids_values[::2], ids_values[1::2])
         ]
-        values.sort(key=key, reverse=reverse)
-        for index, (val, k) in enumerate(values):
-            self.tree.move(k, "", index)
+        _sort_values(values, key, reverse)
+        tree.tk.call(tree, "children", "", [iid for _, iid in values])
 
     @property
     def tree(self):
@@ -216,6 +337,527 @@ class Treeview(BaseWidget):
         return self.widget
 
 
+class VirtualTreeview(Treeview):
+    """ttk.Treeview widget that keeps its rows in a Python data model"""
+
+    def __init__(
+        self,
+        headings: list[str],
+        rows: Sequence[Sequence[Any]] | None = None,
+        ids: Sequence[str] | None = None,
+        key: Hashable | None = None,
+        columns: list[str] | None = None,
+        height: int = 10,
+        disabled: bool = False,
+        columnspan: int | None = None,
+        rowspan: int | None = None,
+        padx: PadType | None = None,
+        pady: PadType | None = None,
+        events: bool = True,
+        sticky: str | None = None,
+        tooltip: TooltipType = None,
+        command: CommandType | None = None,
+        hscrollbar: bool = False,
+        vscrollbar: bool = True,
+        weightx: int | None = None,
+        weighty: int | None = None,
+        focus: bool = False,
+        **kwargs,
+    ):
+        """Initialize a virtual ttk.Treeview widget
+
+        The rows live in a Python data model and only the rows that are visible are
+        inserted into the ttk.Treeview so loading and scrolling cost depend on the
+        height of the widget, not on the number of rows.
+
+        Args:
+            headings (list[str]): List of column headings, required.
+            rows (Sequence[Sequence[Any]], optional): The rows to display; each row is a
+                sequence of column values. Any sequence may be used, for example a tuple of
+                tuples or a sequence view of a columnar store. The rows are not copied and
+                are never modified: rows appended or deleted later are tracked separately.
+                Defaults to an empty list.
+            ids (Sequence[str], optional): Unique row IDs, one for each row. Defaults to
+                the string index of each row, e.g. "0", "1", ...
+            key (Hashable, optional): Key to use for this widget. Defaults to None.
+            columns (list[str], optional): List of column names. Defaults to None.
+            height (int, optional): Number of rows to display. Defaults to 10.
+            disabled (bool, optional): Whether the widget is disabled. Defaults to False.
+            columnspan (int, optional): Number of columns to span. Defaults to None.
+            rowspan (int, optional): Number of rows to span. Defaults to None.
+            padx (int, optional): Padding in x direction. Defaults to None.
+            pady (int, optional): Padding in y direction. Defaults to None.
+            events (bool, optional): Whether to bind events. Defaults to True.
+            sticky (str, optional): Sticky direction. Defaults to None.
+            tooltip (TooltipType, optional): Tooltip to display. Defaults to None.
+            command (CommandType, optional): Command to run when selection changes. Defaults to None.
+            hscrollbar (bool, optional): Whether to display a horizontal scrollbar. Defaults to False.
+            vscrollbar (bool, optional): Whether to display a vertical scrollbar. Defaults to True.
+            weightx (int, optional): Horizontal weight. Defaults to None.
+            weighty (int, optional): Vertical weight. Defaults to None.
+            focus (bool, optional): If True, widget will have focus. Defaults to False.
+            **kwargs: Additional keyword arguments to pass to ttk.Treeview.
+
+        Note:
+            Selection (value), sort_on_column(), and bind_tag() work with model row IDs.
+            Only visible rows exist in the ttk.Treeview so methods of the underlying
+            tree widget (e.g. tree.get_children()) only see the visible rows.
+            Emits EventType.TreeviewSelect event when the selection changes.
+        """
+        super().__init__(
+            headings=headings,
+            key=key,
+            columns=columns,
+            disabled=disabled,
+            columnspan=columnspan,
+            rowspan=rowspan,
+            padx=padx,
+            pady=pady,
+            events=events,
+            sticky=sticky,
+            tooltip=tooltip,
+            command=command,
+            hscrollbar=hscrollbar,
+            vscrollbar=vscrollbar,
+            weightx=weightx,
+            weighty=weighty,
+            focus=focus,
+            **kwargs,
+        )
+        self.key = key or "VirtualTreeview"
+        self.height = height
+
+        self._rows: Sequence[Sequence[Any]] = []
+        """ the data model passed to set_rows(); row values by row index """
+
+        self._appended: list[Sequence[Any]] = []
+        """ values of rows appended after set_rows(), which follow the rows of _rows """
+
+        self._ids: list[str] = []
+        """ row ID for each row index, including deleted rows """
+
+        self._index: dict[str, int] = {}
+        """ row index for each row ID that hasn't been deleted """
+
+        self._order: list[int] = []
+        """ indexes of rows that haven't been deleted in display order """
+
+        self._next_id = 0
+        """ used to generate default row IDs """
+
+        self._tags: dict[str, tuple[str, ...]] = {}
+        """ tags for each row ID that has tags """
+
+        self._selection: set[str] = set()
+        """ IDs of selected rows, including rows that aren't visible """
+
+        self._first = 0
+        """ position in display order of the first visible row """
+
+        self._visible_ids: list[str] = []
+        """ IDs of the rows currently inserted in the tree """
+
+        self._visible_count = height
+        """ number of rows that fit in the tree """
+
+        self.set_rows(rows if rows is not None else [], ids=ids)
+
+    def _create_widget(self, parent, window: Window, row, col):
+        super()._create_widget(parent, window, row, col)
+        self.tree.configure(height=self.height, yscrollcommand="")
+
+        # replace the <<TreeviewSelect>> binding so the model selection is kept in sync
+        # and the event is only emitted when the selection really changes
+        event = Event(self, window, self.key, EventType.TreeviewSelect)
+        self._select_callback = window._make_callback(event)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        if self.tree.vbar:
+            self.tree.vbar["command"] = self._yview
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_mousewheel)
+        self.tree.bind("<Up>", lambda event: self._on_arrow(-1))
+        self.tree.bind("<Down>", lambda event: self._on_arrow(1))
+        self.tree.bind("<Configure>", self._on_configure, "+")
+
+        self._materialize()
+        return self.widget
+
+    @property
+    def value(self) -> tuple[str, ...]:
+        """IDs of the selected rows in display order"""
+        if len(self._selection) * 8 < len(self._order):
+            # sort just the selection instead of scanning all rows
+            position = {idx: pos for pos, idx in enumerate(self._order)}
+            return tuple(
+                sorted(self._selection, key=lambda i: position[self._index[i]])
+            )
+        return tuple(
+            self._ids[idx] for idx in self._order if self._ids[idx] in self._selection
+        )
+
+    @value.setter
+    def value(self, *values):
+        """Set the selection to the rows with the given IDs"""
+        if len(values) == 1 and not isinstance(values[0], str):
+            values = values[0]
+        self._selection = {iid for iid in values if iid in self._index}
+        self._materialize()
+
+    @property
+    def row_ids(self) -> list[str]:
+        """IDs of all rows in display order"""
+        return [self._ids[idx] for idx in self._order]
+
+    def set_rows(
+        self,
+        rows: Sequence[Sequence[Any]],
+        ids: Sequence[str] | None = None,
+        tags: dict[str, Iterable[str]] | None = None,
+    ):
+        """Replace the rows in the model
+
+        Args:
+            rows (Sequence[Sequence[Any]]): The rows to display.
+            ids (Sequence[str], optional): Unique row IDs, one for each row. Defaults to
+                the string index of each row.
+            tags (dict[str, Iterable[str]], optional): Tags for rows, keyed by row ID.
+
+        Raises:
+            ValueError: If ids is not the same length as rows or the ids are not unique.
+        """
+        ids = [str(i) for i in range(len(rows))] if ids is None else list(ids)
+        if len(ids) != len(rows):
+            raise ValueError("rows and ids must be the same length")
+        index = {iid: idx for idx, iid in enumerate(ids)}
+        if len(index) != len(ids):
+            raise ValueError("row ids must be unique")
+        self._rows = rows
+        self._appended = []
+        self._ids = ids
+        self._index = index
+        self._order = list(range(len(rows)))
+        self._next_id = len(rows)
+        self._tags = {iid: tuple(t) for iid, t in (tags or {}).items()}
+        self._selection = set()
+        self._first = 0
+        self._materialize()
+
+    def append(
+        self, values: Sequence[Any], iid: str | None = None, tags: Iterable[str] = ()
+    ) -> str:
+        """Append a row to the model and return its ID
+
+        Args:
+            values (Sequence[Any]): The column values for the row.
+            iid (str, optional): Unique ID for the row. Defaults to a generated ID.
+            tags (Iterable[str], optional): Tags for the row.
+
+        Raises:
+            ValueError: If a row with ID iid already exists.
+        """
+        iids = None if iid is None else [iid]
+        return self.insert_rows([values], tags=[tags], iids=iids)[0]
+
+    def delete(self, *iids: str):
+        """Delete rows with the given IDs from the model
+
+        Note:
+            The sequence of rows passed to set_rows() is not modified; deleted rows are
+            just removed from the display order.
+        """
+        doomed = {self._index.pop(iid) for iid in iids}
+        self._order = [idx for idx in self._order if idx not in doomed]
+        for iid in iids:
+            self._tags.pop(iid, None)
+            self._selection.discard(iid)
+        self._materialize()
+
+    def get_row(self, iid: str) -> Sequence[Any]:
+        """Return the column values of the row with ID iid"""
+        return self._row(self._index[iid])
+
+    def _row(self, idx: int) -> Sequence[Any]:
+        """Return the column values of the row at index idx"""
+        if idx < len(self._rows):
+            return self._rows[idx]
+        return self._appended[idx - len(self._rows)]
+
+    def _new_id(self) -> str:
+        """Return a row ID that hasn't been used"""
+        while (iid := str(self._next_id)) in self._index:
+            self._next_id += 1
+        self._next_id += 1
+        return iid
+
+    def insert_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        tags: TagsType = None,
+        iids: Iterable[str] | None = None,
+        parent: str = "",
+        chunk_size: int | None = None,
+        callback: Callable[[list[str]], None] | None = None,
+    ) -> list[str]:
+        """Append many rows to the model
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to append.
+            tags (Sequence[Iterable[str]] | Callable, optional): Tags for the rows; either a
+                sequence with the tags for each row or a callable that is called with a row's
+                values and returns the tags for that row. Defaults to None (no tags).
+            iids (Iterable[str], optional): Unique IDs for the rows. Defaults to generated IDs.
+            parent (str, optional): Must be "" as VirtualTreeview rows are not nested.
+            chunk_size (int, optional): Ignored; only the visible rows are inserted into the
+                tree so appending rows to the model never blocks the UI for long.
+            callback (Callable[[list[str]], None], optional): Called with the list of IDs of
+                the appended rows.
+
+        Returns:
+            List of the IDs of the appended rows.
+
+        Raises:
+            ValueError: If parent is not "" or a row ID already exists.
+        """
+        if parent:
+            raise ValueError("VirtualTreeview rows can't have a parent")
+        inserted = []
+        for item in _tree_items(rows, tags, iids):
+            iid, values, row_tags = item if iids is not None else (None, *item)
+            iid = self._new_id() if iid is None else iid
+            if iid in self._index:
+                raise ValueError(f"Row with id {iid} already exists")
+            self._appended.append(values)
+            self._index[iid] = len(self._ids)
+            self._order.append(len(self._ids))
+            self._ids.append(iid)
+            if row_tags:
+                self._tags[iid] = row_tags
+            inserted.append(iid)
+        self._materialize()
+        if callback:
+            callback(inserted)
+        return inserted
+
+    def see(self, iid: str):
+        """Scroll so the row with ID iid is visible"""
+        position = self._order.index(self._index[iid])
+        if position < self._first:
+            self._first = position
+        elif position >= self._first + self._visible_count:
+            self._first = position - self._visible_count + 1
+        self._materialize()
+
+    def sort_on_column(
+        self,
+        column_name: str,
+        key: SortKeyType = None,
+        reverse: bool = False,
+    ):
+        """Sort the model rows based on column_name
+
+        Args:
+            column_name (str): The column to sort on.
+            key (str | Callable, optional): "numeric", "date", "natural", "str", or a callable
+                that is called with (value, row ID) tuples like sort(key=). See Treeview.
+            reverse (bool, optional): Sort in descending order. Defaults to False.
+        """
+        column = self._columns.index(column_name)
+        values = [
+            (_column_value(self._row(idx), column), self._ids[idx])
+            for idx in self._order
+        ]
+        _sort_values(values, key, reverse)
+        self._order = [self._index[iid] for _, iid in values]
+        self._materialize()
+
+    def _materialize(self):
+        """Insert the visible rows into the tree, replacing those already there"""
+        if not self._has_been_created:
+            return
+        total = len(self._order)
+        self._first = max(0, min(self._first, total - self._visible_count))
+        window = self._order[self._first : self._first + self._visible_count]
+
+        tree = self.tree
+        focus = tree.focus()
+        if self._visible_ids:
+            tree.delete(*self._visible_ids)
+        self._visible_ids = [self._ids[idx] for idx in window]
+        for idx, iid in zip(window, self._visible_ids):
+            tree.insert(
+                "",
+                "end",
+                iid=iid,
+                values=tuple(self._row(idx)),
+                tags=self._tags.get(iid, ()),
+            )
+        tree.selection_set(
+            [iid for iid in self._visible_ids if iid in self._selection]
+        )
+        if focus in self._visible_ids:
+            tree.focus(focus)
+
+        if tree.vbar and total:
+            tree.vbar.set(self._first / total, (self._first + len(window)) / total)
+        elif tree.vbar:
+            tree.vbar.set(0.0, 1.0)
+
+    def _scroll_to(self, first: int):
+        """Scroll so the row at position first in display order is the first visible row"""
+        if first != self._first:
+            self._first = first
+            self._materialize()
+
+    def _yview(self, *args):
+        """Scrollbar command"""
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._order)))
+        elif args[0] == "scroll":
+            step = self._visible_count if args[2].startswith("page") else 1
+            self._scroll_to(self._first + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the model with the mouse wheel instead of scrolling the tree"""
+        if event.num == 4:
+            delta = -3
+        elif event.num == 5:
+            delta = 3
+        elif abs(event.delta) >= 120:
+            delta = -int(event.delta / 120) * 3
+        else:
+            delta = -event.delta
+        self._scroll_to(self._first + delta)
+        return "break"
+
+    def _on_arrow(self, delta: int):
+        """Scroll when the keyboard focus moves past the first or last visible row"""
+        focus = self.tree.focus()
+        if not self._visible_ids or focus not in self._visible_ids:
+            return None
+        position = self._visible_ids.index(focus) + delta
+        if 0 <= position < len(self._visible_ids):
+            # let the tree move the focus
+            return None
+        self._scroll_to(self._first + delta)
+        if self._visible_ids:
+            iid = self._visible_ids[0 if delta < 0 else -1]
+            self.tree.focus(iid)
+            self.tree.selection_set(iid)
+        return "break"
+
+    def _on_configure(self, event):
+        """Recompute how many rows fit in the tree when it is resized"""
+        if not self._visible_ids:
+            return
+        bbox = self.tree.bbox(self._visible_ids[0])
+        if not bbox:
+            return
+        _, y, _, row_height = bbox
+        count = max(1, (self.tree.winfo_height() - y) // max(row_height, 1))
+        if count != self._visible_count:
+            self._visible_count = count
+            self._materialize()
+
+    def _on_select(self, event):
+        """Sync the model selection with the tree selection"""
+        visible = set(self._visible_ids)
+        selection = (self._selection - visible) | set(self.tree.selection())
+        if selection != self._selection:
+            self._selection = selection
+            self._select_callback(event)
+
+    def __len__(self):
+        """Number of rows in the model"""
+        return len(self._order)
+
+
+def _column_value(row: Sequence[Any], column: int) -> Any:
+    """Return the value in column of row or "" if the row is too short"""
+    return row[column] if column < len(row) else ""
+
+
+def _numeric_key(value: Any) -> tuple[int, Any]:
+    """Sort key for numbers; values that aren't numbers sort after numbers"""
+    try:
+        return (0, float(value))
+    except (TypeError, ValueError):
+        return (1, str(value))
+
+
+def _date_key(value: Any) -> tuple[int, Any]:
+    """Sort key for dates; values that aren't dates sort after dates"""
+    if not isinstance(value, datetime.date):
+        try:
+            value = datetime.datetime.fromisoformat(str(value))
+        except ValueError:
+            return (1, str(value))
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time())
+    if value.tzinfo is not None:
+        # compare aware datetimes as naive UTC so they can be compared with naive ones
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return (0, value)
+
+
+def _natural_key(value: Any) -> tuple[str | int, ...]:
+    """Sort key that sorts runs of digits by their numeric value, e.g. file2 < file10"""
+    parts = _DIGITS.split(str(value).casefold())
+    # odd indexes are the runs of digits
+    return tuple(int(part) if idx % 2 else part for idx, part in enumerate(parts))
+
+
+_SORT_KEYS: dict[str, Callable[[Any], Any]] = {
+    "numeric": _numeric_key,
+    "date": _date_key,
+    "natural": _natural_key,
+    "str": str,
+}
+
+
+def _sort_values(values: list[tuple[Any, str]], key: SortKeyType, reverse: bool):
+    """Sort a list of (value, item ID) tuples in place for sort_on_column()
+
+    Raises:
+        ValueError: If key is a string that isn't a valid sort key name.
+    """
+    if key is None:
+        try:
+            values.sort(reverse=reverse)
+        except TypeError:
+            # values of different types can't be compared so compare them as strings
+            values.sort(key=lambda v: (str(v[0]), v[1]), reverse=reverse)
+    elif isinstance(key, str):
+        try:
+            typed_key = _SORT_KEYS[key]
+        except KeyError as e:
+            raise ValueError(
+                f"Invalid sort key {key!r}; must be one of {', '.join(_SORT_KEYS)}"
+            ) from e
+        values.sort(key=lambda v: typed_key(v[0]), reverse=reverse)
+    else:
+        values.sort(key=key, reverse=reverse)
+
+
+def _tree_items(
+    rows: Iterable[Sequence[Any]], tags: TagsType, iids: Iterable[str] | None
+) -> Iterator[tuple[Any, ...]]:
+    """Yield (values, tags) or (iid, values, tags) for each row for use with _INSERT_ROWS"""
+    if callable(tags):
+        rows_tags = ((row, tags(row)) for row in rows)
+    else:
+        rows_tags = zip(rows, itertools.repeat(()) if tags is None else tags)
+    rows_tags = (
+        (row, row_tags if isinstance(row_tags, str) else tuple(row_tags))
+        for row, row_tags in rows_tags
+    )
+    if iids is None:
+        yield from rows_tags
+    else:
+        for iid, (row, row_tags) in zip(iids, rows_tags):
+            yield iid, row, row_tags
+
+
 class Listbox(Treeview):
     """Listbox widget (which is a Treeview widget with only one column)"""
 
@@ -324,8 +966,7 @@ class Listbox(Treeview):
 
         self.listbox = self.tree
         if self._text:
-            for line in self._text:
-                self.append(line)
+            self.extend(self._text)
 
         event = Event(self, window, self.key, EventType.ListboxSelect)
         self.widget.bind("<<TreeviewSelect>>", window._make_callback(event))
@@ -351,6 +992,25 @@ class Listbox(Treeview):
         """Append a line to end of Listbox"""
         self.widget.insert("", "end", iid=line, values=(line))
 
+    def extend(
+        self,
+        lines: Iterable[str],
+        chunk_size: int | None = None,
+        callback: Callable[[list[str]], None] | None = None,
+    ):
+        """Append lines to end of Listbox with one Tcl evaluation per chunk
+
+        Args:
+            lines (Iterable[str]): The lines to append.
+            chunk_size (int, optional): If set, append chunk_size lines at a time, returning to
+                the event loop between chunks so the UI stays responsive. Defaults to None.
+            callback (Callable[[list[str]], None], optional): Called with the list of lines
+                once all lines have been appended.
+        """
+        # like append(), each line is both the item ID and its value
+        lines = list(lines)
+        self.insert_rows(lines, iids=lines, chunk_size=chunk_size, callback=callback)
+
     def delete(self, line):
         """Delete a line from Listbox"""
         self.widget.delete(line)
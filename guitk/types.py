@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Any, Callable, Literal, TypeVar
+from typing import Any, Callable, Iterable, Literal, Sequence, TypeVar
 
 Widget = TypeVar("Widget")
 TooltipType = Callable[[str], str | None]
@@ -17,6 +17,9 @@ DecoratedType = TypeVar("DecoratedType")
 SizeType = tuple[int, int] | str | None
 PaddingType = tuple[int, int, int, int] | tuple[int, int] | int | str
 PadType = tuple[int, int] | int
+TagType = str | tuple[str, ...] | None
+SortKeyType = str | Callable[[tuple[Any, str]], Any] | None
+TagsType = Sequence[Iterable[str]] | Callable[[Sequence[Any]], Iterable[str]] | None
 CompoundType = (
     Literal["image", "text", "top", "bottom", "left", "right", "center"] | None
 )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tkinter as tk
 import tkinter.ttk as ttk
+from typing import Iterable
 
 
 def scrolled_widget_factory(
@@ -63,6 +64,49 @@ def scrolled_widget_factory(
     return widget
 
 
+def destroy_widgets(widgets: Iterable[tk.Misc]):
+    """Destroy tkinter widgets and their descendants with a single Tcl destroy command.
+
+    tkinter's destroy() issues a separate Tcl command for the widget and every one of its
+    descendants. This destroys all the widgets at once then does the same Python-side
+    cleanup as tkinter's destroy() without any further calls to Tk, except that widgets
+    whose class overrides destroy() have their own destroy() called so the override's
+    cleanup still runs (Tcl's destroy ignores windows that no longer exist).
+    """
+    widgets = list(widgets)
+    if not widgets:
+        return
+    widgets[0].tk.call("destroy", *[widget._w for widget in widgets])
+    for widget in widgets:
+        _forget_destroyed_widget(widget)
+
+
+def _forget_destroyed_widget(widget: tk.Misc):
+    """Clean up the Python side of a tkinter widget that has already been destroyed in Tk"""
+    if type(widget).destroy not in (tk.BaseWidget.destroy, tk.Misc.destroy):
+        # e.g. ttk.LabeledScale; destroy() also cleans up the widget's descendants
+        widget.destroy()
+        return
+    for child in list(widget.children.values()):
+        _forget_destroyed_widget(child)
+    if widget.master is not None and widget.master.children.get(widget._name) is widget:
+        del widget.master.children[widget._name]
+    # tkinter.Misc.destroy() only deletes the Tcl commands created for callbacks
+    tk.Misc.destroy(widget)
+
+
+def gridded_widget(widget: tk.Misc, parent: tk.Misc) -> tk.Misc:
+    """Return the ancestor of widget (or widget itself) that was gridded into parent.
+
+    Some guitk widgets wrap the tkinter widget in a frame (for example widgets with scrollbars
+    created with scrolled_widget_factory) and it's the frame that must be destroyed.
+    """
+    ancestor = widget
+    while ancestor.master is not None and ancestor.master is not parent:
+        ancestor = ancestor.master
+    return widget if ancestor.master is None else ancestor
+
+
 def load_image(file: str) -> tk.PhotoImage:
     """Load a photo image from a file and return it.
 
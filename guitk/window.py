@@ -2,26 +2,147 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import inspect
-import time
+import itertools
+import subprocess
 import tkinter as tk
+from concurrent.futures import Executor, Future
+from operator import itemgetter
 from tkinter import ttk
-from typing import TYPE_CHECKING, Any, Hashable
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Iterator,
+)
 
 from guitk.tkroot import _TKRoot
 
+from ._busy import BUSY_CURSOR, _Busy, _BusyState
 from ._debug import debug, debug_watch
+from ._process import _ProcessStream
+from ._ratelimit import _RateLimiter
+from ._timer import _TimerScheduler
 from .basewidget import BaseWidget
 from .constants import DEFAULT_PADX, DEFAULT_PADY, MENU_MARKER
 from .events import Event, EventCommand, EventType
 from .frame import _LayoutMixin
+from .incremental import IncrementalTask, _IncrementalScheduler
 from .layout import push_parent
 from .menu import Command, Menu, MenuBar
+from .tasks import process_pool, thread_pool
+from .tk_text import Output
 from .ttk_label import Label
 from .types import PadType, SizeType, TooltipType
 
 
+class _WidgetRegistry:
+    """Insertion-ordered registry of the widgets belonging to a Window
+
+    Widgets are indexed by identity, key, type, and parent so that lookups and removals
+    don't need to scan every widget in the window.
+    """
+
+    def __init__(self):
+        self._widgets: dict[int, BaseWidget] = {}
+        """ widgets in the order they were registered, keyed by id(widget) """
+
+        self._by_key: dict[Hashable, BaseWidget] = {}
+        """ most recently registered widget for each key """
+
+        self._by_type: dict[type, dict[int, BaseWidget]] = {}
+        """ widgets grouped by their exact type """
+
+        self._by_parent: dict[int, dict[int, BaseWidget]] = {}
+        """ widgets grouped by id of the parent they were registered with """
+
+        self._parent_id: dict[int, int] = {}
+        """ id of the parent each widget was registered with """
+
+    def add(self, widget: BaseWidget):
+        """Register widget; widget.parent must already be set"""
+        widget_id = id(widget)
+        if widget_id in self._widgets:
+            self.remove(widget)
+        self._widgets[widget_id] = widget
+        self._by_key[widget.key] = widget
+        self._by_type.setdefault(type(widget), {})[widget_id] = widget
+        parent_id = id(widget.parent)
+        self._parent_id[widget_id] = parent_id
+        self._by_parent.setdefault(parent_id, {})[widget_id] = widget
+
+    def remove(self, widget: BaseWidget):
+        """Remove widget from the registry or raise ValueError if not registered"""
+        widget_id = id(widget)
+        if self._widgets.get(widget_id) is not widget:
+            raise ValueError(f"Widget {widget} not registered")
+        del self._widgets[widget_id]
+        if self._by_key.get(widget.key) is widget:
+            del self._by_key[widget.key]
+        _discard(self._by_type, type(widget), widget_id)
+        _discard(self._by_parent, self._parent_id.pop(widget_id), widget_id)
+
+    def discard(self, widget: BaseWidget):
+        """Remove widget from the registry if it is registered"""
+        with contextlib.suppress(ValueError):
+            self.remove(widget)
+
+    def get(self, key: Hashable) -> BaseWidget:
+        """Return widget with key or raise KeyError if not found"""
+        return self._by_key[key]
+
+    def find(self, key_or_widget: Hashable | BaseWidget) -> BaseWidget | None:
+        """Return the registered widget that is key_or_widget or has key key_or_widget, else None"""
+        if self._widgets.get(id(key_or_widget)) is key_or_widget:
+            return key_or_widget
+        try:
+            return self._by_key.get(key_or_widget)
+        except TypeError:
+            # unhashable key
+            return None
+
+    def children(self, parent: Any) -> list[BaseWidget]:
+        """Return widgets registered with parent as their parent"""
+        return list(self._by_parent.get(id(parent), {}).values())
+
+    def of_type(self, widget_type: type) -> list[BaseWidget]:
+        """Return widgets that are instances of widget_type in the order they were registered"""
+        widgets = [
+            widget
+            for cls, by_id in self._by_type.items()
+            if issubclass(cls, widget_type)
+            for widget in by_id.values()
+        ]
+        if len(self._by_type) > 1:
+            order = {widget_id: idx for idx, widget_id in enumerate(self._widgets)}
+            widgets.sort(key=lambda widget: order[id(widget)])
+        return widgets
+
+    def __contains__(self, widget: object) -> bool:
+        return self._widgets.get(id(widget)) is widget
+
+    def __iter__(self) -> Iterator[BaseWidget]:
+        return iter(list(self._widgets.values()))
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+
+def _discard(index: dict[Any, dict[int, BaseWidget]], index_key: Any, widget_id: int):
+    """Remove widget_id from the group index_key of index, dropping the group if empty"""
+    group = index.get(index_key)
+    if group is not None:
+        group.pop(widget_id, None)
+        if not group:
+            del index[index_key]
+
+
 class _WindowBaseClass:
     # only needed to keep typing happy
     pass
@@ -47,6 +168,8 @@ class Window(_LayoutMixin, _WindowBaseClass):
         modal: bool | None = None,
         size: SizeType = None,
     ):
+        _LayoutMixin.__init__(self)
+
         # call _config then subclass's config to initialize
         # layout, title, menu, etc.
 
@@ -73,14 +196,20 @@ class Window(_LayoutMixin, _WindowBaseClass):
 
         self.window: tk.TopLevel = tk.Toplevel(self._parent)
         self.window.title(self.title)
-        self._widgets = []
-        self._widget_by_key = {}
+        self._widgets = _WidgetRegistry()
+        """ all widgets in the window indexed by key, type, and parent """
 
-        self._timer_events = {}
-        """ timer events that have been set by bind_timer_event, stores most recent after() id for event"""
+        self._timers = _TimerScheduler(self._tk.root)
+        """ runs timer events set by bind_timer_event """
 
-        self._timer_events_cancelled = {}
-        """ timer events that have been set by bind_timer_event but then cancelled """
+        self._timer_seq = itertools.count()
+        """ used to create unique timer ids """
+
+        self._timer_commands: dict[str, Callable[[Event], Any]] = {}
+        """ command passed to bind_timer_event for each timer, keyed by timer id """
+
+        self._fired_timers: set[str] = set()
+        """ ids of one-shot timers which have fired """
 
         self._return_value = None
         """ value returned from run() if set in quit() """
@@ -94,8 +223,26 @@ class Window(_LayoutMixin, _WindowBaseClass):
         self._destroyed = False
         """ set to True when window is destroyed """
 
+        self._tasks: set[asyncio.Task] = set()
+        """ asyncio tasks created by the window which are cancelled when it is destroyed """
+
+        self._futures: set[Future] = set()
+        """ background tasks started by run_in_thread and run_in_process not yet done """
+
+        self._incremental = _IncrementalScheduler(self)
+        """ runs generators passed to run_incremental """
+
+        self._fds: dict[int, IO | int] = {}
+        """ file objects bound with bind_fd, keyed by file descriptor """
+
+        self._processes: dict[subprocess.Popen, _ProcessStream] = {}
+        """ processes started by stream_process which haven't exited """
+
         self._mainframe = ttk.Frame(self.window, padding="3 3 12 12")
         self._mainframe.grid(column=0, row=0, sticky="nsew")
+        self._busy = _BusyState(self._mainframe, self.window)
+        """ holds set by busy() and by background tasks started with busy=True """
+
         self.window.columnconfigure(0, weight=1)
         self.window.rowconfigure(0, weight=1)
 
@@ -115,6 +262,23 @@ class Window(_LayoutMixin, _WindowBaseClass):
             ]
 
         self._commands = []
+        """ all EventCommands bound to the window, in the order they were bound """
+
+        self._command_index = {}
+        """ dispatch index of (seq, callback) lists keyed by (widget, key, event_type) """
+
+        self._any_commands = []
+        """ (seq, callback) for commands bound to EventType.Any which receive every event """
+
+        self._widget_index_keys: dict[BaseWidget, set[tuple]] = {}
+        """ _command_index keys of the commands bound to each widget, used to unbind them
+            when the widget is removed """
+
+        self._command_seq = itertools.count()
+        """ used to dispatch commands in the order they were bound """
+
+        self._rate_limiters = []
+        """ _RateLimiters wrapping commands bound with debounce or throttle """
 
         self._layout(self._mainframe, self)
 
@@ -250,42 +414,193 @@ class Window(_LayoutMixin, _WindowBaseClass):
     def geometry(self, value):
         self.size = value
 
-    def bind_command(self, key=None, event_type=None, command=None):
+    def bind_command(
+        self,
+        key=None,
+        event_type=None,
+        command=None,
+        debounce: int | None = None,
+        throttle: int | None = None,
+        leading: bool | None = None,
+        trailing: bool | None = None,
+    ):
+        """Bind command to be called for events matching key and/or event_type.
+
+        Args:
+            key (Hashable, optional): Key of the events to handle. Defaults to None.
+            event_type (EventType, optional): Type of the events to handle. Defaults to None.
+            command (CommandType, optional): The command to call. Defaults to None.
+            debounce (int | None, optional): If set, call command only once events have
+                stopped arriving for debounce milliseconds. Defaults to None.
+            throttle (int | None, optional): If set, call command at most once every
+                throttle milliseconds. Defaults to None.
+            leading (bool | None, optional): Call command for the first event of a burst.
+                Defaults to None which is False for debounce and True for throttle.
+            trailing (bool | None, optional): Call command for the last event of a burst.
+                Defaults to None which is True.
+
+        Note:
+            At least one of key or event_type must be specified; only one of debounce
+            or throttle may be specified.
+        """
         if not any([key, event_type]):
             raise ValueError("At least one of key, event_type must be specified")
         self._bind_command(
-            EventCommand(widget=None, key=key, event_type=event_type, command=command)
+            EventCommand(
+                widget=None,
+                key=key,
+                event_type=event_type,
+                command=command,
+                debounce=debounce,
+                throttle=throttle,
+                leading=leading,
+                trailing=trailing,
+            )
         )
 
     def _bind_command(self, event_command: EventCommand):
         self._commands.append(event_command)
+        bound = (next(self._command_seq), self._make_command_callback(event_command))
+        if event_command.event_type == EventType.Any:
+            self._any_commands.append(bound)
+        else:
+            index_key = (
+                event_command.widget,
+                event_command.key,
+                event_command.event_type,
+            )
+            self._command_index.setdefault(index_key, []).append(bound)
+            if event_command.widget is not None:
+                self._widget_index_keys.setdefault(event_command.widget, set()).add(
+                    index_key
+                )
+
+    def _unbind_widget_commands(self, widget: BaseWidget):
+        """Unbind the commands bound to widget"""
+        index_keys = self._widget_index_keys.pop(widget, None)
+        if not index_keys:
+            return
+        for index_key in index_keys:
+            for _, callback in self._command_index.pop(index_key, []):
+                if isinstance(callback, _RateLimiter):
+                    callback.cancel()
+                    self._rate_limiters.remove(callback)
+        self._commands = [
+            command for command in self._commands if command.widget is not widget
+        ]
+
+    def _make_command_callback(self, event_command: EventCommand):
+        """Return a callable that takes an Event and calls the command with the right arguments;
+        the command's signature is inspected once here rather than on every event"""
+        command = event_command.command
+        # commands that are async def return a coroutine which is run as a task
+        run = self._create_task_if_awaitable
+        if not hasattr(command, "_guitk_event_handlers"):
+
+            def callback(event):
+                run(command())
+
+        elif len(inspect.signature(command).parameters) == 2:
+            # command was decorated with @on, so it's a method of this class, and has
+            # a second argument, assume it's the event
+            def callback(event):
+                run(command(self, event))
+
+        else:
+
+            def callback(event):
+                run(command(self))
+
+        debounce, throttle = event_command.debounce, event_command.throttle
+        if debounce is None and throttle is None:
+            return callback
+        if debounce is not None and throttle is not None:
+            raise ValueError("Only one of debounce, throttle may be specified")
+        limiter = _RateLimiter(
+            self,
+            callback,
+            wait=throttle if debounce is None else debounce,
+            throttle=debounce is None,
+            leading=event_command.leading,
+            trailing=event_command.trailing,
+        )
+        self._rate_limiters.append(limiter)
+        return limiter
+
+    def _create_task_if_awaitable(self, result: Any):
+        """If result of an event handler is awaitable (e.g. handler is async def),
+        run it as an asyncio task"""
+        if inspect.isawaitable(result):
+            self.create_task(result)
+
+    def create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run coroutine coro as an asyncio task inside the Tk mainloop.
+
+        Args:
+            coro (Coroutine): The coroutine to run.
+
+        Returns:
+            asyncio.Task: The task running coro.
+
+        Note:
+            The task is cancelled if it is still running when the window is destroyed.
+            Exceptions raised by the task are reported like exceptions raised by
+            any other Tk callback.
+        """
+        if not asyncio.iscoroutine(coro):
+            coro = _await(coro)
+        task = self._tk.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task):
+        """Called when a task created by create_task is done"""
+        self._tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            self._tk.root.report_callback_exception(type(exc), exc, exc.__traceback__)
 
     def bind_timer_event(self, delay, event_name, repeat=False, command=None):
         """Create a new virtual event `event_name` that fires after `delay` ms,
-        repeats every `delay` ms if repeat=True, otherwise fires once"""
+        repeats every `delay` ms if repeat=True, otherwise fires once.
+
+        Each time the timer fires, handlers bound to `event_name` are called followed
+        by `command`, if given; `command` is only called for this timer, not for other
+        timers with the same `event_name`."""
+        timer_id = self._bind_timer_event(
+            delay, event_name, EventType.VirtualEvent, repeat
+        )
         if command:
-            self.bind_command(
-                key=event_name, event_type=EventType.VirtualEvent, command=command
+            self._timer_commands[timer_id] = self._make_command_callback(
+                EventCommand(
+                    widget=None,
+                    key=event_name,
+                    event_type=EventType.VirtualEvent,
+                    command=command,
+                )
             )
-        return self._bind_timer_event(delay, event_name, EventType.VirtualEvent, repeat)
+        return timer_id
 
     def _bind_timer_event(self, delay, event_name, event_type, repeat=False):
         # create a unique name for the timer
-        timer_id = f"{event_name}_{time.time_ns()}"
-
-        # callback that generates event and respawns the timer if repeat=True
-        # when cancelling with cancel_timer_event, sometimes the call to after_cancel doesn't apparently work so check
-        # if timer_id is in _timer_events_cancelled before respawning
-        def _generate_event():
-            self.root.event_generate(event_name)
-            if repeat and timer_id not in self._timer_events_cancelled:
-                self._timer_events[timer_id] = self._tk.root.after(
-                    delay, _generate_event
-                )
+        timer_id = f"{event_name}_{next(self._timer_seq)}"
+
+        def _fire():
+            # dispatch directly rather than with event_generate so a tick costs a
+            # single Tk callback however many timers are due
+            if not repeat:
+                self._fired_timers.add(timer_id)
+            event = Event(self, self, event_name, event_type)
+            self._handle_event(event)
+            command = (
+                self._timer_commands.get(timer_id)
+                if repeat
+                else self._timer_commands.pop(timer_id, None)
+            )
+            if command is not None and not self._destroyed:
+                command(event)
 
-        event = Event(self, self, event_name, event_type)
-        self.root.bind(event_name, self._make_callback(event))
-        self._timer_events[timer_id] = self._tk.root.after(delay, _generate_event)
+        self._timers.schedule(timer_id, delay, _fire, repeat=repeat)
         return timer_id
 
     def _create_setup_teardown_events(self):
@@ -297,50 +612,428 @@ class Window(_LayoutMixin, _WindowBaseClass):
         self.root.bind(EventType.Teardown.value, self._make_callback(teardown_event))
 
     def cancel_timer_event(self, timer_id):
-        """Cancel a timer event created with bind_timer_event"""
+        """Cancel a timer event created with bind_timer_event.
+
+        Cancelling a one-shot timer which has already fired does nothing.
+
+        Raises:
+            ValueError: if timer_id is not a timer of this window or was already cancelled.
+        """
+        if timer_id in self._fired_timers:
+            return
         try:
-            after_id = self._timer_events[timer_id]
-            self.root.after_cancel(after_id)
-            self._timer_events.pop(timer_id)
-            self._timer_events_cancelled[timer_id] = after_id
+            self._timers.cancel(timer_id)
         except KeyError as e:
             raise ValueError(f"Timer event {timer_id} not found") from e
-        except Exception as e:
-            raise e
+        self._timer_commands.pop(timer_id, None)
+
+    def call_soon_threadsafe(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        coalesce_key: Hashable | None = None,
+    ):
+        """Call fn(*args) on the Tk main thread; may be called from any thread.
+
+        Tkinter is not thread-safe so worker threads must use this to update widgets.
+
+        Args:
+            fn (Callable): The function to call.
+            *args: Arguments passed to fn.
+            coalesce_key (Hashable | None, optional): If not None and a call queued with
+                the same coalesce_key hasn't run yet, it is replaced by this one so only
+                the most recent call runs. Defaults to None.
+
+        Example:
+            ```python
+            # update a label from a worker thread, skipping stale values if the
+            # worker updates faster than the UI
+            window.call_soon_threadsafe(
+                setattr, label, "value", text, coalesce_key=label
+            )
+            ```
+
+        Note:
+            Calls queued from any number of threads are run in batches, waking the Tk
+            event loop once per batch. Calls still queued when the window is
+            destroyed are discarded.
+        """
+        if coalesce_key is not None:
+            # don't coalesce with calls queued for other windows
+            coalesce_key = (self._id, coalesce_key)
+        self._tk.call_soon_threadsafe(
+            self._call_if_not_destroyed, fn, args, coalesce_key=coalesce_key
+        )
+
+    def _call_if_not_destroyed(self, fn: Callable[..., Any], args: tuple[Any, ...]):
+        """Call fn(*args) unless the window has been destroyed"""
+        if not self._destroyed:
+            fn(*args)
+
+    def post_event(self, key: Hashable, payload: Any = None, coalesce: bool = False):
+        """Emit an EventType.VirtualEvent event with key and payload on the Tk main thread;
+        may be called from any thread.
+
+        Args:
+            key (Hashable): Key of the event.
+            payload (Any, optional): Data sent with the event. Defaults to None.
+            coalesce (bool, optional): If True and an event with the same key posted with
+                coalesce=True hasn't been emitted yet, it is replaced by this one so only
+                the most recent payload is emitted. Defaults to False.
+        """
+        self.call_soon_threadsafe(
+            self._emit_event,
+            key,
+            EventType.VirtualEvent,
+            payload,
+            coalesce_key=("post_event", key) if coalesce else None,
+        )
+
+    def run_incremental(
+        self,
+        generator: Iterable[Any],
+        budget_ms: float = 8,
+        priority: int = 0,
+        key: Hashable | None = None,
+    ) -> IncrementalTask:
+        """Run generator on the Tk thread in time-sliced steps so the window stays responsive.
+
+        Args:
+            generator (Iterable): Generator (or other iterable) to advance; each step
+                should do a small amount of work then yield.
+            budget_ms (float, optional): Milliseconds to advance the generator before
+                yielding to Tk to process events. Defaults to 8.
+            priority (int, optional): Generators with a higher priority run first; those
+                with equal priority take turns. Defaults to 0.
+            key (Hashable | None, optional): Key of the events emitted for the task.
+                Defaults to None.
+
+        Returns:
+            IncrementalTask: Handle for the task which can be used to cancel it.
+
+        Example:
+            ```python
+            def populate(self, rows):
+                for row in rows:
+                    self["TABLE"].append(row)
+                    yield
+
+            self.run_incremental(self.populate(rows), key="POPULATE")
+            ```
+
+        Note:
+            Because the generator runs on the Tk thread, it can safely update widgets.
+            When the generator is exhausted, an EventType.TaskDone event is emitted with
+            the generator's return value as payload; if it raises, an EventType.TaskError
+            event is emitted with the exception as payload. Tasks still running when the
+            window is destroyed are cancelled.
+        """
+        return self._incremental.add(generator, budget_ms, priority, key)
+
+    def bind_fd(self, fileobj: IO | int, key: Hashable, mode: str = "r"):
+        """Emit events when a file, pipe, or socket is ready to read or write.
+
+        Args:
+            fileobj (IO | int): File object (anything with a fileno() method) or file descriptor.
+            key (Hashable): Key of the events emitted.
+            mode (str, optional): "r" to emit EventType.FileReadable when fileobj is ready to
+                read, "w" to emit EventType.FileWritable when it is ready to write, or "rw"
+                for both. Defaults to "r".
+
+        Raises:
+            ValueError: If mode is not valid or the file descriptor is already bound.
+            RuntimeError: If Tk can't watch file descriptors on this platform (Windows).
+
+        Note:
+            The events have fileobj as payload. Tk watches the file descriptor so no CPU is
+            used while it's idle. Readiness is level-triggered: events keep being emitted
+            while the file descriptor is ready, so the handler must read (or write) or
+            call unbind_fd(). A file descriptor can only be bound once.
+        """
+        mask = 0
+        if "r" in mode:
+            mask |= tk.READABLE
+        if "w" in mode:
+            mask |= tk.WRITABLE
+        if not mask or set(mode) - {"r", "w"}:
+            raise ValueError(f"Invalid mode {mode!r}: must be 'r', 'w', or 'rw'")
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        if any(fd in window._fds for window in self._tk.windows):
+            # Tk has one handler per file descriptor so binding again would replace it
+            raise ValueError(f"File descriptor {fd} is already bound")
+
+        def _callback(fd: int, ready: int):
+            if ready & tk.READABLE:
+                self._emit_event(key, EventType.FileReadable, fileobj)
+            if ready & tk.WRITABLE and fd in self._fds:
+                self._emit_event(key, EventType.FileWritable, fileobj)
+
+        tkapp = self._tk.root.tk
+        if not hasattr(tkapp, "createfilehandler"):
+            raise RuntimeError("bind_fd is not supported on this platform")
+        tkapp.createfilehandler(fd, mask, _callback)
+        self._fds[fd] = fileobj
+
+    def unbind_fd(self, fileobj: IO | int):
+        """Stop emitting events for a file object bound with bind_fd.
+
+        Args:
+            fileobj (IO | int): File object or file descriptor passed to bind_fd.
+
+        Raises:
+            ValueError: If fileobj is not bound.
+        """
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        try:
+            del self._fds[fd]
+        except KeyError as e:
+            raise ValueError(f"File {fileobj} is not bound") from e
+        self._tk.root.tk.deletefilehandler(fd)
+
+    def stream_process(
+        self,
+        args: str | list[str],
+        key: Hashable,
+        stderr: bool = True,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> subprocess.Popen:
+        """Run a process and emit its output as events as it is produced.
+
+        Args:
+            args (str | list[str]): Program and arguments, as for subprocess.Popen.
+            key (Hashable): Key of the events emitted.
+            stderr (bool, optional): If True, stderr is also streamed, interleaved with
+                stdout. Defaults to True.
+            encoding (str, optional): Encoding used to decode the output. Defaults to "utf-8".
+            **kwargs: Additional keyword arguments are passed to subprocess.Popen.
+
+        Returns:
+            subprocess.Popen: The process.
+
+        Note:
+            Emits EventType.ProcessOutput with the text read as payload each time the
+            process writes output (not necessarily whole lines) and EventType.ProcessExit
+            with the exit code as payload when the process exits. Output is read only
+            when Tk reports it is available so an idle process uses no CPU; where Tk can't
+            watch pipes (Windows), output is read in a background thread instead.
+            Processes still running when the window is destroyed are terminated.
+        """
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if stderr else None,
+            **kwargs,
+        )
+
+        def _on_exit(returncode: int):
+            self._processes.pop(process, None)
+            self._emit_event(key, EventType.ProcessExit, returncode)
+
+        stream = _ProcessStream(
+            self._tk,
+            process,
+            on_output=lambda text, _: self._emit_event(
+                key, EventType.ProcessOutput, text
+            ),
+            on_exit=_on_exit,
+            encoding=encoding,
+        )
+        self._processes[process] = stream
+        stream.start()
+        return process
+
+    def run_in_thread(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Hashable | None = None,
+        progress: bool = False,
+        busy: bool = False,
+        **kwargs: Any,
+    ) -> Future:
+        """Run fn(*args, **kwargs) in the shared thread pool.
+
+        Args:
+            fn (Callable): The function to run.
+            *args: Positional arguments passed to fn.
+            key (Hashable | None, optional): Key of the events emitted for the task.
+                Defaults to None.
+            progress (bool, optional): If True, fn is passed a progress keyword argument,
+                a callable which may be called from fn with any value to emit a
+                EventType.TaskProgress event with that value as payload. Defaults to False.
+            busy (bool, optional): If True, the window is held busy (see busy()) until
+                the task is done. Defaults to False.
+            **kwargs: Keyword arguments passed to fn.
+
+        Returns:
+            Future: The future for the task.
+
+        Note:
+            When fn returns, an EventType.TaskDone event is emitted with the return value
+            as payload; if fn raises, an EventType.TaskError event is emitted with the
+            exception as payload. Events are emitted on the Tk main thread and dispatched
+            to handlers bound with @on or bind_command like any other event.
+            Tasks not yet started are cancelled when the window is destroyed and the
+            results of tasks that were running are discarded.
+        """
+        if progress:
+            kwargs["progress"] = lambda value: self.call_soon_threadsafe(
+                self._emit_event, key, EventType.TaskProgress, value
+            )
+        return self._submit_task(thread_pool(), fn, args, kwargs, key, busy)
+
+    def run_in_process(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Hashable | None = None,
+        busy: bool = False,
+        **kwargs: Any,
+    ) -> Future:
+        """Run fn(*args, **kwargs) in the shared process pool.
+
+        Args:
+            fn (Callable): The function to run; must be picklable, e.g. a module level function.
+            *args: Positional arguments passed to fn; must be picklable.
+            key (Hashable | None, optional): Key of the events emitted for the task.
+                Defaults to None.
+            busy (bool, optional): If True, the window is held busy (see busy()) until
+                the task is done. Defaults to False.
+            **kwargs: Keyword arguments passed to fn; must be picklable.
+
+        Returns:
+            Future: The future for the task.
+
+        Note:
+            Emits EventType.TaskDone or EventType.TaskError like run_in_thread().
+            Progress reporting is not supported for tasks run in a process.
+        """
+        return self._submit_task(process_pool(), fn, args, kwargs, key, busy)
+
+    def busy(self, cursor: str = BUSY_CURSOR) -> _Busy:
+        """Block input to the window and show a busy cursor.
+
+        Args:
+            cursor (str, optional): Cursor shown while busy. Defaults to "watch".
+
+        Returns:
+            A context manager which can also be used as a decorator.
+
+        Note:
+            Uses Tk's busy command to cover the window's contents so clicks and key
+            presses made while busy are discarded rather than queued and replayed once
+            the window is available again. On Tk versions without the busy command only
+            the cursor is changed. Holds nest: the window stays busy until the outermost
+            hold is released and holds from background tasks started with busy=True are
+            released when the task is done.
+
+            ```python
+            with self.busy():
+                self.load_data()
+
+            @self.busy()
+            async def fetch():
+                ...
+            ```
+
+            To decorate a Window method such as an event handler use @guitk.busy.
+        """
+        return _Busy(self._busy, cursor)
+
+    def _submit_task(
+        self,
+        executor: Executor,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        key: Hashable | None,
+        busy: bool = False,
+    ) -> Future:
+        """Submit fn to executor and emit an event on the Tk thread when it's done"""
+        future = executor.submit(fn, *args, **kwargs)
+        self._futures.add(future)
+        if busy:
+            self._busy.hold()
+        # done callbacks run in the worker thread so hand the result to the Tk thread
+        future.add_done_callback(
+            lambda f: self._tk.call_soon_threadsafe(
+                self._task_done_event, f, key, busy
+            )
+        )
+        return future
+
+    def _task_done_event(self, future: Future, key: Hashable | None, busy: bool):
+        """Emit TaskDone or TaskError for a background task"""
+        self._futures.discard(future)
+        if busy and not self._destroyed:
+            self._busy.release()
+        if future.cancelled():
+            return
+        if (exc := future.exception()) is not None:
+            self._emit_event(key, EventType.TaskError, exc)
+        else:
+            self._emit_event(key, EventType.TaskDone, future.result())
+
+    def _emit_event(
+        self,
+        key: Hashable | None,
+        event_type: EventType,
+        payload: Any,
+        widget: BaseWidget | None = None,
+    ):
+        """Dispatch an event with payload to the window's event handlers; widget is the
+        widget the event comes from, or None if it comes from the window"""
+        if self._destroyed:
+            return
+        self._handle_event(
+            Event(self if widget is None else widget, self, key, event_type, payload=payload)
+        )
 
     def _bind_event_handlers(self):
         """Bind any event handlers decorated with @on"""
         for method in self.__class__.__dict__.values():
             if hasattr(method, "_guitk_event_handlers"):
-                for key, event_type in getattr(method, "_guitk_event_handlers"):
-                    self.bind_command(key=key, event_type=event_type, command=method)
+                for key, event_type, rate_limit in getattr(
+                    method, "_guitk_event_handlers"
+                ):
+                    self.bind_command(
+                        key=key, event_type=event_type, command=method, **rate_limit
+                    )
 
     def add_widget(self, widget: BaseWidget, row: int, col: int):
         """Add a widget to the window's mainframe"""
-        widget._create_widget(self._mainframe, self, row, col)
-        self._widgets.append(widget)
-        self._widget_by_key[widget.key] = widget
-        self._grid_configure_widgets()
+        self._create_and_add_widget(widget, self._mainframe, self, row, col)
+
+    def add_widgets(self, widgets: Iterable[tuple[BaseWidget, int, int]]):
+        """Add widgets to the window's mainframe
+
+        Args:
+            widgets: iterable of (widget, row, col) tuples
+
+        Note:
+            Only the new widgets are created and configured so adding widgets one at a
+            time or in bulk doesn't slow down as the window grows.
+        """
+        for widget, row, col in widgets:
+            self._create_and_add_widget(widget, self._mainframe, self, row, col)
 
     def remove(self, key_or_widget: Hashable | BaseWidget):
         """Remove widget from window and destroy it."""
-        for idx, widget in enumerate(self._widgets):
-            debug(f"{idx=} {widget=} {key_or_widget=}")
-            if widget == key_or_widget or widget.key == key_or_widget:
-                widget = self._widgets[idx]
-                if widget.parent == self:
-                    self._remove(widget)
-                else:
-                    widget.parent.remove(widget)
-                return
-        raise ValueError(f"Widget {key_or_widget} not found in Window")
+        widget = self._widgets.find(key_or_widget)
+        debug(f"{widget=} {key_or_widget=}")
+        if widget is None:
+            raise ValueError(f"Widget {key_or_widget} not found in Window")
+        if widget.parent == self:
+            self._remove(widget)
+        else:
+            widget.parent.remove(widget)
 
     def _remove(self, widget: BaseWidget):
         """Remove widget from window and destroy it."""
         widget.widget.grid_forget()
         widget.widget.destroy()
-        self._widget_by_key.pop(widget.key, None)
-        self._widgets.remove(widget)
+        self._forget_widgets([widget])
         self.window.update_idletasks()
 
     def _insert_widget_row_col(self, widget: BaseWidget, row: int, col: int):
@@ -360,8 +1053,16 @@ class Window(_LayoutMixin, _WindowBaseClass):
         # TODO: fix this so it actually inserts instead of replaces
         self.add_widget(widget, row, col)
 
-    def run(self):
-        self._tk.run_mainloop()
+    def run(self, use_asyncio: bool = False):
+        """Run the window's event loop and return the value passed to quit().
+
+        Args:
+            use_asyncio (bool, optional): If True, also run an asyncio event loop inside
+                the Tk mainloop so coroutines can be run with create_task() or as
+                async def event handlers. Defaults to False; the asyncio event loop is
+                started anyway when the first task is created.
+        """
+        self._tk.run_mainloop(use_asyncio=use_asyncio)
         return self._return_value
 
     @property
@@ -372,7 +1073,7 @@ class Window(_LayoutMixin, _WindowBaseClass):
     @property
     def widgets(self) -> list[BaseWidget]:
         """ "Return list of all widgets belonging to the window"""
-        return self._widgets
+        return list(self._widgets)
 
     def children(self):
         """Return child windows"""
@@ -381,7 +1082,7 @@ class Window(_LayoutMixin, _WindowBaseClass):
     def get(self, key: Hashable) -> BaseWidget:
         """Get widget with key or raise KeyError if not found"""
         try:
-            return self._widget_by_key[key]
+            return self._widgets.get(key)
         except KeyError as e:
             raise KeyError(f"Widget with key {key} not found") from e
 
@@ -389,10 +1090,15 @@ class Window(_LayoutMixin, _WindowBaseClass):
         """Dummy method to allow widgets to be added with VLayout()/HLayout()"""
         pass
 
-    def _forget_widget(self, widget: BaseWidget):
-        """Remove widget from the window's bookkeeping but don't destroy it"""
-        self._widget_by_key.pop(widget.key, None)
-        self._widgets.remove(widget)
+    def _forget_widgets(self, widgets: Iterable[BaseWidget]):
+        """Remove widgets and any widgets they contain from the window's bookkeeping
+        but don't destroy them"""
+        stack = list(widgets)
+        while stack:
+            widget = stack.pop()
+            stack.extend(self._widgets.children(widget))
+            self._widgets.discard(widget)
+            self._unbind_widget_commands(widget)
 
     def _add_menus(self, menu: Menu, path: str | None = None):
         """Add menus to the window recursively
@@ -405,8 +1111,7 @@ class Window(_LayoutMixin, _WindowBaseClass):
         for m in menu:
             subpath = f"{path}|{m._label}"
             m._create_widget(menu._menu, self, subpath)
-            self._widgets.append(m)
-            self._widget_by_key[m.key] = m
+            self._widgets.add(m)
             if isinstance(m, Menu):
                 self._add_menus(m, subpath)
 
@@ -423,8 +1128,7 @@ class Window(_LayoutMixin, _WindowBaseClass):
                 raise ValueError("self.menu items must be Menu objects")
             path = f"{MENU_MARKER}{m._label}"
             m._create_widget(self._root_menu, self, path)
-            self._widgets.append(m)
-            self._widget_by_key[m.key] = m
+            self._widgets.add(m)
             self._add_menus(m, path)
 
     @debug_watch
@@ -456,17 +1160,32 @@ class Window(_LayoutMixin, _WindowBaseClass):
         for widget in self._widgets:
             widget.events = False
 
-            if "guitk.widgets.tk_text.Output" in str(type(widget)):
-                widget.disable_redirect()
+        for widget in self._widgets.of_type(Output):
+            widget._deregister_redirect()
 
         if self.modal:
             self.window.grab_release()
 
+        self._busy.release_all()
+
+        # cancel any asyncio tasks still running
+        for task in list(self._tasks):
+            task.cancel()
+
+        # cancel any background tasks not yet started
+        for future in list(self._futures):
+            future.cancel()
+        self._incremental.cancel_all()
+        for fd in list(self._fds):
+            self.unbind_fd(fd)
+        for stream in list(self._processes.values()):
+            stream.stop()
+        self._processes.clear()
+        for limiter in self._rate_limiters:
+            limiter.cancel()
+
         # cancel any timer events
-        for timer_id in self._timer_events:
-            with contextlib.suppress(Exception):
-                after_id = self._timer_events[timer_id]
-                self._tk.root.after_cancel(after_id)
+        self._timers.cancel_all()
         self._parent.focus_set()
         self.window.destroy()
         self._tk.deregister(self)
@@ -498,7 +1217,10 @@ class Window(_LayoutMixin, _WindowBaseClass):
         self._handle_commands(event)
 
         # call subclass handle_event
-        self.handle_event(event)
+        self._create_task_if_awaitable(self.handle_event(event))
+
+        # handlers may have resolved futures that asyncio tasks are waiting on
+        self._tk._wake_asyncio()
 
         # if deleting the window, call _destroy after handle_event has had a chance to handle it
         if event.event_type == EventType.Quit:
@@ -507,26 +1229,34 @@ class Window(_LayoutMixin, _WindowBaseClass):
     @debug_watch
     def _handle_commands(self, event):
         """Handle commands bound to widgets in the window"""
-        for command in self._commands:
-            if (
-                (command.widget is None or command.widget == event.widget)
-                and (command.key is None or command.key == event.key)
-                and (
-                    command.event_type is None or command.event_type == event.event_type
-                )
-            ) or command.event_type == EventType.Any:
-                if hasattr(command.command, "_guitk_event_handlers"):
-                    # command was decorated with @on, so it's a method of this class
-                    if len(inspect.signature(command.command).parameters) == 2:
-                        # command has a second argument, assume it's the event
-                        command.command(self, event)
-                    else:
-                        command.command(self)
-                else:
-                    command.command()
+        # a command matches if each of widget, key, event_type is None or equals the event's
+        # value so look up the (at most 8) matching combinations in the index
+        commands = list(self._any_commands)
+        for index_key in itertools.product(
+            _match_values(event.widget),
+            _match_values(event.key),
+            _match_values(event.event_type),
+        ):
+            if bound := self._command_index.get(index_key):
+                commands.extend(bound)
+        if len(commands) > 1:
+            # preserve the order in which commands were bound
+            commands.sort(key=itemgetter(0))
+        for _, callback in commands:
+            callback(event)
 
     def __getitem__(self, key) -> BaseWidget:
         try:
-            return self._widget_by_key[key]
+            return self._widgets.get(key)
         except KeyError as e:
             raise KeyError(f"Invalid key: no widget with key {key}") from e
+
+
+async def _await(awaitable):
+    """Return result of awaitable; wraps awaitables that aren't coroutines for create_task"""
+    return await awaitable
+
+
+def _match_values(value: Hashable) -> tuple[Hashable, ...]:
+    """Return the values a bound command could have to match an event attribute with value"""
+    return (None,) if value is None else (value, None)
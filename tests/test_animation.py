@@ -0,0 +1,64 @@
+"""Test animating widget properties with animate()"""
+
+import tkinter as tk
+
+import guitk as ui
+from guitk.animation import Animation, FrameTicker
+from guitk.tkroot import _TKRoot
+
+
+class Animate(ui.Window):
+    def config(self):
+        self.title = "Animate"
+        with ui.VLayout():
+            self.label = ui.Label("Animated", key="label")
+            self.scale = ui.Scale(0, 100, key="scale", orient="horizontal")
+
+    def setup(self):
+        self.done = []
+        self.label.style(foreground="#000000")
+        self.label.animate(
+            "foreground", "#ff0000", duration=100, on_done=lambda: self.done.append(1)
+        )
+        self.scale.animate(
+            "value", 100.0, duration=150, easing="linear", on_done=self.on_scale_done
+        )
+        self.label.animate("padx", 20, start=0, duration=100, easing="ease_out")
+        self.cancelled = self.label.animate("pady", 50, start=0, duration=1000)
+        self.cancelled.cancel()
+        self.frames = []
+        Animation(self.frames.append, 0, 1, duration=50, on_done=self.on_done_error).start()
+
+    def on_done_error(self):
+        raise tk.TclError("raised by on_done")
+
+    def on_scale_done(self):
+        self.done.append(2)
+        self.bind_timer_event(50, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self.foreground = str(self.label.widget.cget("foreground"))
+        self.label_padx = self.label.widget.grid_info()["padx"]
+        self.label_pady = self.label.widget.grid_info()["pady"]
+        self.scale_value = self.scale.value
+        self.ticker_active = FrameTicker().active
+        self.quit()
+
+
+def test_animate(monkeypatch):
+    """Animations should end at the end value, call on_done once unless cancelled,
+    report errors raised by on_done, and stop the frame ticker when all are done"""
+    errors = []
+    monkeypatch.setattr(
+        _TKRoot().root, "report_callback_exception", lambda *exc: errors.append(exc[1])
+    )
+    window = Animate()
+    window.run()
+    assert window.foreground == "#ff0000"
+    assert window.scale_value == 100.0
+    assert window.label_padx == 20
+    assert window.cancelled.done
+    assert window.label_pady != 50
+    assert sorted(window.done) == [1, 2]
+    assert [str(error) for error in errors] == ["raised by on_done"]
+    assert not window.ticker_active
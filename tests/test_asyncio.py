@@ -0,0 +1,100 @@
+"""Test running async def event handlers inside the Tk mainloop"""
+
+import asyncio
+import time
+
+import guitk as ui
+from guitk.tkroot import _TKRoot
+
+
+class AsyncHandlers(ui.Window):
+    def config(self):
+        self.title = "asyncio"
+        with ui.VLayout():
+            ui.Button("Fetch", key="FETCH")
+
+    def setup(self):
+        self.results = []
+        self.forever = self.create_task(asyncio.sleep(3600))
+        self.bind_timer_event(100, "<<fetch>>", command=self.on_fetch)
+
+    def on_fetch(self):
+        self["FETCH"].widget.invoke()
+
+    @ui.on(key="FETCH")
+    async def fetch(self):
+        for i in range(3):
+            await asyncio.sleep(0.01)
+            self.results.append(i)
+        self.quit(self.results)
+
+
+def test_async_handlers():
+    """async def handlers should run as tasks inside the Tk mainloop and tasks still
+    running when the window is destroyed should be cancelled"""
+    window = AsyncHandlers()
+    assert window.run(use_asyncio=True) == [0, 1, 2]
+    assert window.forever.cancelled()
+
+
+class IdleLoop(ui.Window):
+    def config(self):
+        self.title = "asyncio idle"
+        with ui.VLayout():
+            ui.Label("asyncio")
+
+    def setup(self):
+        self.create_task(self.sleep())
+        # long enough that polling every ASYNCIO_INTERVAL_MS would step the loop many times
+        self.bind_timer_event(150, "<<quit>>", command=self.quit)
+
+    async def sleep(self):
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        self.slept = time.monotonic() - start
+        await asyncio.sleep(3600)
+
+
+def test_asyncio_idle_loop(monkeypatch):
+    """The asyncio loop should only be run when it has work, not polled while idle,
+    and asyncio timers should run when due rather than on the next poll"""
+    steps = []
+    step = _TKRoot._step_asyncio_loop
+    monkeypatch.setattr(
+        _TKRoot, "_step_asyncio_loop", lambda self: steps.append(1) or step(self)
+    )
+    window = IdleLoop()
+    window.run(use_asyncio=True)
+    assert len(steps) < 10
+    assert 0.045 <= window.slept < 0.065
+
+
+class ReenterTk(ui.Window):
+    def config(self):
+        self.title = "asyncio re-entering Tk"
+        with ui.VLayout():
+            ui.Label("asyncio")
+
+    def setup(self):
+        self.updated = False
+        self.create_task(self.update_tk())
+        self.bind_timer_event(100, "<<quit>>", command=self.quit)
+
+    async def update_tk(self):
+        # a coroutine processing Tk events, e.g. with update() or a modal dialog, may
+        # run Tk callbacks which try to run the asyncio loop
+        self._tk._schedule_asyncio(0)
+        self.window.update()
+        self.updated = True
+
+
+def test_asyncio_reentrant_update(monkeypatch):
+    """Re-entering Tk from a coroutine should not try to run the running asyncio loop"""
+    errors = []
+    monkeypatch.setattr(
+        _TKRoot().root, "report_callback_exception", lambda *exc: errors.append(exc[1])
+    )
+    window = ReenterTk()
+    window.run(use_asyncio=True)
+    assert window.updated
+    assert errors == []
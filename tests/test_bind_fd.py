@@ -0,0 +1,78 @@
+"""Test file descriptor and child process event sources"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+import guitk as ui
+
+
+class BindFd(ui.Window):
+    def config(self):
+        self.title = "bind_fd"
+        with ui.VLayout():
+            ui.Label("bind_fd")
+
+    def setup(self):
+        self.received = b""
+        self.read_fd, self.write_fd = os.pipe()
+        self.bind_fd(self.read_fd, "pipe")
+        with pytest.raises(ValueError):
+            self.bind_fd(self.read_fd, "again")
+        threading.Thread(target=self.writer).start()
+
+    def writer(self):
+        for i in range(3):
+            os.write(self.write_fd, f"message {i};".encode())
+        os.close(self.write_fd)
+
+    @ui.on(key="pipe", event_type=ui.EventType.FileReadable)
+    def on_readable(self, event):
+        if data := os.read(event.payload, 1024):
+            self.received += data
+        else:
+            self.unbind_fd(event.payload)
+            os.close(event.payload)
+            self.quit()
+
+
+class StreamProcess(ui.Window):
+    def config(self):
+        self.title = "stream_process"
+        with ui.VLayout():
+            ui.Label("stream_process")
+
+    def setup(self):
+        self.output = ""
+        self.stream_process(
+            [sys.executable, "-c", "for i in range(3): print(f'line {i}')"], "process"
+        )
+
+    @ui.on(key="process", event_type=ui.EventType.ProcessOutput)
+    def on_output(self, event):
+        self.output += event.payload
+
+    @ui.on(key="process", event_type=ui.EventType.ProcessExit)
+    def on_exit(self, event):
+        self.exit_code = event.payload
+        self.quit()
+
+
+def test_bind_fd():
+    """Data written to a bound pipe should be emitted as FileReadable events and
+    unbind_fd() should forget the file descriptor"""
+    window = BindFd()
+    window.run()
+    assert window.received == b"message 0;message 1;message 2;"
+    assert window.read_fd not in window._fds
+
+
+def test_stream_process():
+    """Process output should be emitted as ProcessOutput events and ProcessExit should
+    be emitted with the exit code after all output"""
+    window = StreamProcess()
+    window.run()
+    assert window.output.splitlines() == ["line 0", "line 1", "line 2"]
+    assert window.exit_code == 0
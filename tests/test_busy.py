@@ -0,0 +1,58 @@
+"""Test holding a window busy with busy() and run_in_thread(busy=True)"""
+
+import time
+
+import guitk as ui
+
+
+class Busy(ui.Window):
+    def config(self):
+        self.title = "Busy"
+        with ui.VLayout():
+            ui.Label("Busy")
+
+    def setup(self):
+        with self.busy():
+            self.outer = self.is_busy()
+            with self.busy(cursor="clock"):
+                self.inner = self.is_busy()
+            self.after_inner = self.is_busy()
+        self.after_outer = self.is_busy()
+        self.decorated()
+        self.run_in_thread(time.sleep, 0.1, key="sleep", busy=True)
+        self.during_task = self.is_busy()
+
+    def is_busy(self):
+        return self._busy.busy
+
+    @ui.busy
+    def decorated(self):
+        self.in_decorated = self.is_busy()
+
+    @ui.on(key="sleep", event_type=ui.EventType.TaskDone)
+    def on_done(self):
+        self.after_task = self.is_busy()
+        self.bind_timer_event(10, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self.tk_busy = self.root.tk.getboolean(
+            self.root.tk.call("tk", "busy", "status", self._mainframe)
+        )
+        # leave a hold in place which must be released when the window is destroyed
+        self._busy.hold()
+        self.quit()
+
+
+def test_busy():
+    """The window should stay busy until the outermost hold is released, while a @busy
+    method runs, and until a run_in_thread(busy=True) task is done; Tk's busy window
+    should be removed once idle and holds left when the window is destroyed released"""
+    window = Busy()
+    window.run()
+    assert [window.outer, window.inner, window.after_inner] == [True, True, True]
+    assert not window.after_outer
+    assert window.in_decorated
+    assert window.during_task
+    assert not window.after_task
+    assert not window.tk_busy
+    assert not window.is_busy()
@@ -0,0 +1,59 @@
+"""Test scheduling UI updates from worker threads"""
+
+import threading
+
+import guitk as ui
+
+
+class CallSoonThreadsafe(ui.Window):
+    def config(self):
+        self.title = "call_soon_threadsafe"
+        with ui.VLayout():
+            ui.Label("", key="status")
+
+    def setup(self):
+        self.updates = 0
+        self.posted = []
+        self.latest = []
+        self.thread = threading.Thread(target=self.worker)
+        self.thread.start()
+
+    def worker(self):
+        for i in range(1000):
+            self.call_soon_threadsafe(self.set_status, f"step {i}", coalesce_key="status")
+        for i in range(10):
+            self.post_event("posted", i)
+            self.post_event("latest", i, coalesce=True)
+        # queued after every call above so it runs last
+        self.post_event("done")
+
+    def set_status(self, text):
+        self.updates += 1
+        self["status"].value = text
+
+    @ui.on(key="posted")
+    def on_posted(self, event):
+        self.posted.append(event.payload)
+
+    @ui.on(key="latest")
+    def on_latest(self, event):
+        self.latest.append(event.payload)
+
+    @ui.on(key="done")
+    def on_done(self):
+        self.thread.join()
+        self.status = self["status"].value
+        self.quit()
+
+
+def test_call_soon_threadsafe():
+    """Coalesced calls should run at least once, ending with the most recent call, and
+    events posted from a thread should be delivered in order, with coalesced events
+    delivering the most recent payload last"""
+    window = CallSoonThreadsafe()
+    window.run()
+    assert window.status == "step 999"
+    assert 1 <= window.updates <= 1000
+    assert window.posted == list(range(10))
+    assert window.latest[-1] == 9
+    assert len(window.latest) <= 10
@@ -0,0 +1,51 @@
+"""Test debounce and throttle options for event handlers"""
+
+import pytest
+
+import guitk as ui
+
+
+class DebounceThrottle(ui.Window):
+    def config(self):
+        self.title = "Debounce and throttle"
+        with ui.VLayout():
+            ui.Label("Debounce and throttle")
+
+    def setup(self):
+        self.debounced = []
+        self.throttled = []
+        self.trailing_only = []
+        self.bind_command(
+            key="burst",
+            command=lambda: self.trailing_only.append(True),
+            throttle=50,
+            leading=False,
+        )
+        with pytest.raises(ValueError):
+            self.bind_command(key="both", command=print, debounce=50, throttle=50)
+        self.bind_timer_event(10, "<<burst>>", command=self.on_burst)
+        # quit once the 50 ms debounce and throttle intervals after the burst have passed
+        self.bind_timer_event(120, "<<quit>>", command=self.quit)
+
+    def on_burst(self):
+        for i in range(100):
+            self._emit_event("burst", ui.EventType.VirtualEvent, i)
+
+    @ui.on(key="burst", debounce=50)
+    def on_debounced(self, event):
+        self.debounced.append(event.payload)
+
+    @ui.on(key="burst", throttle=50)
+    def on_throttled(self, event):
+        self.throttled.append(event.payload)
+
+
+def test_debounce_throttle():
+    """A debounced handler should be called once, for the last event of a burst, a
+    throttled handler for the first and last events, and a throttled handler with
+    leading=False once per burst"""
+    window = DebounceThrottle()
+    window.run()
+    assert window.debounced == [99]
+    assert window.throttled == [0, 99]
+    assert len(window.trailing_only) == 1
@@ -0,0 +1,40 @@
+"""Test filtering captured output in the DebugWindow"""
+
+import guitk as ui
+from guitk.redirect import StdOutRedirect
+
+
+class DebugWindowFilter(ui.DebugWindow):
+    def setup(self):
+        # doesn't call super().setup(); output should be captured anyway
+        for i in range(100):
+            level = "ERROR" if i % 10 == 0 else "INFO"
+            print(f"{level}: message {i}")
+        self.bind_timer_event(30, "<<filter>>", command=self.on_filter)
+        self.bind_timer_event(60, "<<quit>>", command=self.on_quit)
+
+    def on_filter(self):
+        self.set_filter(r"message [1-3]0$", regex=True, level="ERROR")
+        print("ERROR: message 30")
+        print("INFO: message 30")
+
+    def on_quit(self):
+        output = self["OUTPUT"]
+        output.flush()
+        self.shown = output.value.splitlines()
+        self.quit()
+
+
+def test_debug_window_filter():
+    """DebugWindow should capture every line, show only the lines matching the filter,
+    and stop capturing output once destroyed"""
+    window = DebugWindowFilter()
+    window.run()
+    assert len(window._lines) == 102
+    assert window.shown == [
+        "ERROR: message 10",
+        "ERROR: message 20",
+        "ERROR: message 30",
+        "ERROR: message 30",
+    ]
+    assert window._on_output not in StdOutRedirect()._listeners.values()
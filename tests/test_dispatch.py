@@ -0,0 +1,86 @@
+"""Test dispatch of events to commands bound with @on and bind_command"""
+
+import guitk as ui
+
+
+class Dispatch(ui.Window):
+    def config(self):
+        self.title = "Dispatch"
+        with ui.VLayout():
+            ui.Button(
+                "Button", key="button", command=lambda: self.calls.append("button")
+            )
+
+    def setup(self):
+        self.calls = []
+        self.bind_command(key="dispatch", command=lambda: self.calls.append("key"))
+        self.bind_command(
+            event_type=ui.EventType.VirtualEvent,
+            command=lambda: self.calls.append("event_type"),
+        )
+        self.bind_command(
+            key="dispatch",
+            event_type=ui.EventType.VirtualEvent,
+            command=lambda: self.calls.append("key and event_type"),
+        )
+        self.bind_command(key="other", command=lambda: self.calls.append("other key"))
+        self.bind_command(
+            key="dispatch",
+            event_type=ui.EventType.TaskDone,
+            command=lambda: self.calls.append("other event_type"),
+        )
+        self.bind_command(
+            event_type=ui.EventType.Any, command=lambda: self.calls.append("any")
+        )
+
+        self._emit_event("dispatch", ui.EventType.VirtualEvent, None)
+        self.dispatched = self.calls
+        self.calls = []
+
+        button = self["button"]
+        button.widget.invoke()
+        self.button_calls = self.calls
+        self.bound_to_button = button in self._widget_index_keys
+        self.remove(button)
+        self.button_index_keys = [
+            index_key for index_key in self._command_index if index_key[0] is button
+        ]
+        self.unbound = button not in self._widget_index_keys and all(
+            command.widget is not button for command in self._commands
+        )
+        self.bind_timer_event(10, "<<quit>>", command=self.quit)
+
+    @ui.on(key="dispatch")
+    def on_key(self):
+        self.calls.append("@on key")
+
+    @ui.on(event_type=ui.EventType.Any)
+    def on_any(self, event):
+        if event.key in ("dispatch", "button"):
+            self.calls.append("@on any")
+
+    @ui.on(key="dispatch", event_type=ui.EventType.VirtualEvent)
+    def on_key_and_event_type(self):
+        self.calls.append("@on key and event_type")
+
+
+def test_dispatch():
+    """Commands matching an event's key, event_type, both, or bound to EventType.Any
+    should be called in the order they were bound, @on handlers first, and commands
+    bound to a widget should be unbound when the widget is removed"""
+    window = Dispatch()
+    window.run()
+    assert window.dispatched == [
+        "@on key",
+        "@on any",
+        "@on key and event_type",
+        "key",
+        "event_type",
+        "key and event_type",
+        "any",
+    ]
+    # the command bound in Button() is bound when the widget is created, before @on
+    assert window.button_calls == ["button", "@on any", "any"]
+    assert window.bound_to_button
+    assert window.button_index_keys == []
+    assert window.unbound
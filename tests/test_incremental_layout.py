@@ -0,0 +1,43 @@
+"""Test that layout only touches widgets that changed and reuses spacers"""
+
+import guitk as ui
+
+
+class IncrementalLayout(ui.Window):
+    def config(self):
+        self.title = "Incremental layout"
+        with ui.VLayout():
+            ui.Label("Incremental layout")
+            with ui.HStack(key="stack", distribute=True) as self.stack:
+                for i in range(10):
+                    ui.Label(f"Label {i}")
+
+    def setup(self):
+        # count how many widgets get configured by the layout
+        self.configured = []
+        configure_widget = self.stack._configure_widget
+
+        def _counting_configure_widget(widget, *args, **kwargs):
+            self.configured.append(widget)
+            return configure_widget(widget, *args, **kwargs)
+
+        self.stack._configure_widget = _counting_configure_widget
+
+        self.spacers_before = self.spacer_count()
+        self.stack.append(ui.Label("Appended"))
+        self.spacers_after = self.spacer_count()
+        self.configured_count = len(self.configured)
+        self.bind_timer_event(10, "<<quit>>", command=self.quit)
+
+    def spacer_count(self):
+        return len([w for w in self.widgets if isinstance(w, ui.HSpacer)])
+
+
+def test_incremental_layout():
+    """Appending to a distributed stack should keep the existing spacers and only
+    configure the new label and trailing spacer"""
+    window = IncrementalLayout()
+    window.run()
+    assert window.spacers_before == 11
+    assert window.spacers_after == 12
+    assert window.configured_count == 2
@@ -0,0 +1,54 @@
+"""Test bulk row insertion with Treeview.insert_rows() and Listbox.extend()"""
+
+import guitk as ui
+
+
+class InsertRows(ui.Window):
+    def config(self):
+        self.title = "insert_rows()"
+        with ui.VLayout():
+            ui.Label("insert_rows()")
+            ui.Treeview(headings=["Name", "Size"], key="tree", vscrollbar=True)
+            ui.Listbox(text=["a", "b"], key="listbox", vscrollbar=True)
+
+    def setup(self):
+        self.done = []
+        tree = self["tree"]
+        self.ids = tree.insert_rows(
+            [(f"file{i}", i) for i in range(1000)],
+            tags=lambda row: ["odd"] if row[1] % 2 else [],
+        )
+        tree.insert_rows(
+            ((f"chunk{i}", i) for i in range(100_000)),
+            iids=(f"chunk{i}" for i in range(100_000)),
+            chunk_size=10_000,
+            callback=self.on_inserted,
+        )
+        self["listbox"].extend(
+            [f"line {i}" for i in range(1000)], chunk_size=100, callback=self.on_inserted
+        )
+
+    def on_inserted(self, ids):
+        # quit once both chunked insertions are done
+        self.done.append(len(ids))
+        if len(self.done) < 2:
+            return
+        tree = self["tree"].tree
+        self.tree_rows = len(tree.get_children())
+        self.odd_tags = tree.item(self.ids[1], "tags")
+        self.chunk_name = tree.set("chunk99999", "Name")
+        self.listbox_rows = len(self["listbox"].tree.get_children())
+        self.quit()
+
+
+def test_insert_rows():
+    """insert_rows() and extend() should insert all rows, in chunks if requested, with
+    the given IDs and tags, and call callback with all the IDs when done"""
+    window = InsertRows()
+    window.run()
+    assert len(window.ids) == 1000
+    assert window.tree_rows == 101_000
+    assert window.odd_tags == ("odd",)
+    assert window.chunk_name == "chunk99999"
+    assert sorted(window.done) == [1000, 100_000]
+    assert window.listbox_rows == 1002
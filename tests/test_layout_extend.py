@@ -0,0 +1,82 @@
+"""Test adding widgets to a running window with HLayout.extend() and VLayout.extend()"""
+
+import guitk as ui
+
+
+class HLayoutExtend(ui.Window):
+    def config(self):
+        self.title = "HLayout.extend()"
+        with ui.HLayout() as self.hlayout:
+            ui.Label("Label 0", key="label0")
+            ui.Label("Label 1", key="label1")
+
+    def setup(self):
+        # padding a widget already in the layout would be reset if it was reconfigured
+        self["label0"].widget.grid_configure(padx=17)
+        self.col_count_before = self.col_count
+        self.hlayout.extend([ui.Label("Label 2", key="label2"), ui.Label("Label 3", key="label3")])
+        self.hlayout.append(ui.Label("Label 4", key="label4"))
+        self.cells = {
+            key: (int(info["row"]), int(info["column"]))
+            for key in ("label0", "label1", "label2", "label3", "label4")
+            if (info := self[key].widget.grid_info())
+        }
+        self.col_count_after = self.col_count
+        self.label0_padx = int(self["label0"].widget.grid_info()["padx"])
+        self.bind_timer_event(10, "<<quit>>", command=self.quit)
+
+
+def test_hlayout_extend():
+    """extend() should add widgets in the next columns and update col_count without
+    reconfiguring the widgets already in the layout"""
+    window = HLayoutExtend()
+    window.run()
+    assert window.cells == {
+        "label0": (0, 0),
+        "label1": (0, 1),
+        "label2": (0, 2),
+        "label3": (0, 3),
+        "label4": (0, 4),
+    }
+    assert window.col_count_before == 1
+    assert window.col_count_after == 4
+    assert window.label0_padx == 17
+
+
+class VLayoutExtend(ui.Window):
+    def config(self):
+        self.title = "VLayout.extend()"
+        with ui.VLayout() as self.vlayout:
+            ui.Label("Label 0", key="label0")
+            ui.Label("Label 1", key="label1")
+
+    def setup(self):
+        self["label0"].widget.grid_configure(pady=17)
+        self.row_count_before = self.row_count
+        self.vlayout.extend([ui.Label("Label 2", key="label2"), ui.Label("Label 3", key="label3")])
+        self.vlayout.append(ui.Label("Label 4", key="label4"))
+        self.cells = {
+            key: (int(info["row"]), int(info["column"]))
+            for key in ("label0", "label1", "label2", "label3", "label4")
+            if (info := self[key].widget.grid_info())
+        }
+        self.row_count_after = self.row_count
+        self.label0_pady = int(self["label0"].widget.grid_info()["pady"])
+        self.bind_timer_event(10, "<<quit>>", command=self.quit)
+
+
+def test_vlayout_extend():
+    """extend() should add widgets in the next rows and update row_count without
+    reconfiguring the widgets already in the layout"""
+    window = VLayoutExtend()
+    window.run()
+    assert window.cells == {
+        "label0": (0, 0),
+        "label1": (1, 0),
+        "label2": (2, 0),
+        "label3": (3, 0),
+        "label4": (4, 0),
+    }
+    assert window.row_count_before == 1
+    assert window.row_count_after == 4
+    assert window.label0_pady == 17
@@ -0,0 +1,55 @@
+"""Test TextHandler which writes log records to a Text widget"""
+
+import logging
+import threading
+
+import guitk as ui
+
+
+class LogHandler(ui.Window):
+    def config(self):
+        self.title = "Log handler"
+        with ui.VLayout():
+            ui.Text(key="log", disabled=True)
+
+    def setup(self):
+        self.handler = ui.TextHandler(self["log"])
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.logger = logging.getLogger("test_log_handler")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+        self.threads = [
+            threading.Thread(target=self.worker, args=(n,)) for n in range(4)
+        ]
+        for thread in self.threads:
+            thread.start()
+        self.logger.error("something went wrong")
+        self.bind_timer_event(100, "<<quit>>", command=self.on_quit)
+
+    def worker(self, n):
+        for i in range(500):
+            self.logger.info("thread %s record %s", n, i)
+
+    def on_quit(self):
+        for thread in self.threads:
+            thread.join()
+        # nothing is scheduled once all the records have been written
+        self.idle = self.handler._after_id is None
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+        text = self["log"].text
+        self.lines = self["log"].value.splitlines()
+        self.errors = text.get(*text.tag_ranges("error")[:2])
+        self.quit()
+
+
+def test_log_handler():
+    """TextHandler should write the records logged from every thread, tagged with
+    their level, and stop scheduling writes when there are no records"""
+    window = LogHandler()
+    window.run()
+    assert len(window.lines) == 2001
+    assert window.errors == "ERROR something went wrong\n"
+    assert window.idle
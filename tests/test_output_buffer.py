@@ -0,0 +1,38 @@
+"""Test buffered writes to the Output widget"""
+
+import guitk as ui
+
+
+class OutputBuffer(ui.Window):
+    def config(self):
+        self.title = "Buffered Output"
+        with ui.VLayout():
+            ui.Output(key="output", stderr=False, events=True, flush_interval=50)
+
+    def setup(self):
+        self.write_events = 0
+        for i in range(10_000):
+            print(f"line {i}")
+
+    @ui.on(event_type=ui.EventType.OutputWrite)
+    def on_output_write(self):
+        self.write_events += 1
+        if self.write_events == 1:
+            # wait longer than flush_interval to check there are no more flushes
+            self.bind_timer_event(100, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        output = self["output"]
+        output.disable_redirect()
+        self.lines = output.value.splitlines()
+        self.quit()
+
+
+def test_output_buffer():
+    """All buffered writes should be inserted in order with one OutputWrite event per
+    flush, not one per write"""
+    window = OutputBuffer()
+    window.run()
+    assert len(window.lines) == 10_000
+    assert window.lines[-1] == "line 9999"
+    assert window.write_events == 1
@@ -0,0 +1,51 @@
+"""Test the ProcessOutput widget"""
+
+import sys
+
+import guitk as ui
+
+SCRIPT = """
+import sys
+for i in range(200_000):
+    print(f"line {i}")
+print("done", file=sys.stderr)
+sys.exit(3)
+"""
+
+
+class RunProcess(ui.Window):
+    def config(self):
+        self.title = "ProcessOutput"
+        with ui.VLayout():
+            ui.Label("Process output")
+            ui.ProcessOutput(key="output", max_lines=1000, read_budget=65536)
+
+    def setup(self):
+        self.progress = []
+        self["output"].run([sys.executable, "-c", SCRIPT])
+
+    @ui.on(key="output", event_type=ui.EventType.ProcessProgress)
+    def on_progress(self, event):
+        self.progress.append(event.payload)
+
+    @ui.on(key="output", event_type=ui.EventType.ProcessExit)
+    def on_exit(self, event):
+        output = self["output"]
+        self.returncode = event.payload
+        self.lines = output.value.splitlines()
+        self.stderr = output.text.get(*output.text.tag_ranges("stderr")[:2])
+        self.quit()
+
+
+def test_process_output():
+    """ProcessExit should have the process's return code as payload, ProcessOutput
+    should keep at most max_lines of the most recent output with stderr output tagged,
+    and ProcessProgress payloads should increase"""
+    window = RunProcess()
+    window.run()
+    assert window.returncode == 3
+    assert len(window.lines) <= 1000
+    assert "line 199999" in window.lines
+    assert window.stderr == "done\n"
+    assert window.progress
+    assert window.progress == sorted(window.progress)
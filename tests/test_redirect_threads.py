@@ -0,0 +1,50 @@
+"""Test that output printed from worker threads is delivered to Output on the Tk thread"""
+
+import threading
+
+import guitk as ui
+from guitk.redirect import StdOutRedirect
+
+
+class RedirectThreads(ui.Window):
+    def config(self):
+        self.title = "Redirect from threads"
+        with ui.VLayout():
+            ui.Output(key="output", stderr=False)
+
+    def setup(self):
+        # listeners taking a single argument are called with just the text
+        self.texts = []
+        self.listener_id = StdOutRedirect().register(self.texts.append)
+        self.threads = [
+            threading.Thread(target=self.worker, args=(n,)) for n in range(4)
+        ]
+        for thread in self.threads:
+            thread.start()
+        self.bind_timer_event(100, "<<quit>>", command=self.on_quit)
+
+    def worker(self, n):
+        for i in range(250):
+            print(f"thread {n} line {i}")
+
+    def on_quit(self):
+        for thread in self.threads:
+            thread.join()
+        output = self["output"]
+        output.flush()
+        StdOutRedirect().deregister(self.listener_id)
+        output.disable_redirect()
+        self.lines = output.value.splitlines()
+        self.tagged = output.text.get(*output.text.tag_ranges("stdout")[:2])
+        self.quit()
+
+
+def test_redirect_threads():
+    """Every line printed by worker threads should reach the Output exactly once,
+    tagged with the stream name, and listeners taking only the text should get it too"""
+    window = RedirectThreads()
+    window.run()
+    assert len(window.lines) == 1000
+    assert len(set(window.lines)) == 1000
+    assert window.tagged.startswith("thread ")
+    assert "".join(window.texts).splitlines() == window.lines
@@ -0,0 +1,56 @@
+"""Test running background tasks with results delivered as events"""
+
+import guitk as ui
+
+
+def count(n, progress):
+    """Report progress for each step and return the total"""
+    for i in range(n):
+        progress(i)
+    return n
+
+
+def fail():
+    raise ValueError("task failed")
+
+
+class BackgroundTasks(ui.Window):
+    def config(self):
+        self.title = "Background tasks"
+        with ui.VLayout():
+            ui.Label("Background tasks")
+
+    def setup(self):
+        self.progress = []
+        self.results = {}
+        self.run_in_thread(count, 5, key="count", progress=True)
+        self.run_in_thread(fail, key="fail")
+        self.run_in_process(pow, 2, 10, key="pow")
+
+    @ui.on(event_type=ui.EventType.TaskProgress)
+    def on_progress(self, event):
+        self.progress.append(event.payload)
+
+    @ui.on(event_type=ui.EventType.TaskDone)
+    def on_done(self, event):
+        self.results[event.key] = event.payload
+        self.check_done()
+
+    @ui.on(key="fail", event_type=ui.EventType.TaskError)
+    def on_error(self, event):
+        self.results[event.key] = str(event.payload)
+        self.check_done()
+
+    def check_done(self):
+        if len(self.results) == 3:
+            self.quit()
+
+
+def test_run_in_thread():
+    """A task's return value should be the TaskDone payload, an exception it raises the
+    TaskError payload, and progress it reports should be emitted as TaskProgress events
+    in order, whether it runs in a thread or a process"""
+    window = BackgroundTasks()
+    window.run()
+    assert window.results == {"count": 5, "fail": "task failed", "pow": 1024}
+    assert window.progress == [0, 1, 2, 3, 4]
@@ -0,0 +1,51 @@
+"""Test running generators in time-sliced steps with run_incremental"""
+
+import guitk as ui
+
+
+class RunIncremental(ui.Window):
+    def config(self):
+        self.title = "run_incremental"
+        with ui.VLayout():
+            ui.Listbox(key="list")
+
+    def setup(self):
+        self.finished = []
+        self.run_incremental(self.populate(5000), budget_ms=5, key="populate")
+        self.run_incremental(self.count(), priority=1, key="count")
+        self.forever = self.run_incremental(self.spin(), key="spin")
+        self.forever.cancel()
+
+    def populate(self, n):
+        for i in range(n):
+            self["list"].append(f"row {i}")
+            yield
+        return n
+
+    def count(self):
+        total = 0
+        for i in range(100):
+            total += i
+            yield
+        return total
+
+    def spin(self):
+        while True:
+            yield
+
+    @ui.on(event_type=ui.EventType.TaskDone)
+    def on_done(self, event):
+        self.finished.append((event.key, event.payload))
+        if len(self.finished) == 2:
+            self.rows = len(self["list"].tree.get_children())
+            self.quit()
+
+
+def test_run_incremental():
+    """Each generator should run to completion with its return value as payload, higher
+    priority tasks should finish first, and cancelled tasks should never emit TaskDone"""
+    window = RunIncremental()
+    window.run()
+    assert window.finished == [("count", 4950), ("populate", 5000)]
+    assert window.rows == 5000
+    assert window.forever.cancelled
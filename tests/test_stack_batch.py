@@ -0,0 +1,46 @@
+"""Test Stack.batch() which defers layout until the batch is done"""
+
+import guitk as ui
+
+
+class StackBatch(ui.Window):
+    def config(self):
+        self.title = "Stack.batch()"
+        with ui.VLayout():
+            ui.Label("Stack.batch()")
+            with ui.VStack(key="stack", vscrollbar=True, height=300) as self.stack:
+                ...
+
+    def setup(self):
+        # count the number of times the stack is laid out
+        self.layout_count = 0
+        layout = self.stack._layout
+
+        def _counting_layout(*args, **kwargs):
+            self.layout_count += 1
+            return layout(*args, **kwargs)
+
+        self.stack._layout = _counting_layout
+
+        with self.stack.batch():
+            for i in range(2000):
+                self.stack.append(ui.Label(f"Row {i}"))
+            self.stack.pop(0)
+        self.stack.extend([ui.Label("Extend 1"), ui.Label("Extend 2")])
+
+        self.bind_timer_event(10, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self.length = len(self.stack)
+        self.created = all(widget.widget is not None for widget in self.stack)
+        self.quit()
+
+
+def test_stack_batch():
+    """batch() and extend() should each lay out the stack exactly once and the
+    widgets added should all be created when the batch is done"""
+    window = StackBatch()
+    window.run()
+    assert window.layout_count == 2
+    assert window.length == 2001
+    assert window.created
@@ -0,0 +1,59 @@
+"""Test bulk clear() of stacks"""
+
+from tkinter import ttk
+
+import guitk as ui
+from guitk.tkroot import _TKRoot
+from guitk.utils import destroy_widgets
+
+
+class StackClear(ui.Window):
+    def config(self):
+        self.title = "Stack.clear()"
+        with ui.VLayout():
+            ui.Label("Stack.clear()")
+            with ui.VStack(key="stack") as self.stack:
+                for i in range(100):
+                    ui.Label(f"Row {i}", key=f"row_{i}")
+                with ui.HStack(key="nested"):
+                    ui.Label("Nested", key="nested_label")
+
+    def setup(self):
+        self.widget_count = len(self.widgets)
+        self.stack.clear()
+        self.bind_timer_event(10, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self.length = len(self.stack)
+        self.keys = {widget.key for widget in self.widgets}
+        self.frame_children = self.stack.frame.winfo_children()
+        self.quit()
+
+
+def test_stack_clear():
+    """clear() should destroy the stack's widgets and forget them, including nested
+    widgets, from the window"""
+    window = StackClear()
+    window.run()
+    assert window.length == 0
+    assert {"row_0", "row_99", "nested", "nested_label"}.isdisjoint(window.keys)
+    assert window.frame_children == []
+
+
+def test_destroy_widgets_calls_destroy_overrides():
+    """destroy_widgets should run destroy() of widget classes which override it"""
+    destroyed = []
+
+    class Custom(ttk.Frame):
+        def destroy(self):
+            destroyed.append(self)
+            super().destroy()
+
+    root = _TKRoot().root
+    frame = ttk.Frame(root)
+    custom = Custom(frame)
+    label = ttk.Label(custom)
+    destroy_widgets([frame])
+    assert destroyed == [custom]
+    assert not frame.children and not custom.children
+    assert not label.winfo_exists()
@@ -0,0 +1,69 @@
+"""Test bounded scrollback for the Text widget"""
+
+import guitk as ui
+
+
+class Scrollback(ui.Window):
+    def __init__(self, history_file, *args, **kwargs):
+        self.history_file = history_file
+        super().__init__(*args, **kwargs)
+
+    def config(self):
+        self.title = "Scrollback"
+        with ui.VLayout():
+            ui.Text(key="lines", max_lines=100)
+            ui.Text(key="bytes", max_bytes=1000, history_file=self.history_file)
+
+    def setup(self):
+        for i in range(1000):
+            self["lines"].write(f"line {i}\n")
+            self["bytes"].write(f"line {i:04}\n")
+        self.bind_timer_event(10, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self["lines"].flush()
+        self["bytes"].flush()
+        self.lines = self["lines"].value.splitlines()
+        self.text = self["bytes"].value + "\n"
+        self.quit()
+
+
+def test_text_scrollback(tmp_path):
+    """Text should trim the oldest lines to keep at most max_lines or max_bytes and
+    write the full history to history_file"""
+    history_file = tmp_path / "history.txt"
+    window = Scrollback(history_file)
+    window.run()
+    assert len(window.lines) <= 100
+    assert window.lines[-1] == "line 999"
+    assert len(window.text) <= 1000
+    assert window.text.endswith("line 0999\n")
+    assert len(history_file.read_text().splitlines()) == 1000
+
+
+class DestroyPendingFlush(ui.Window):
+    def __init__(self, history_file, *args, **kwargs):
+        self.history_file = history_file
+        super().__init__(*args, **kwargs)
+
+    def config(self):
+        self.title = "Destroy with pending flush"
+        with ui.VLayout():
+            self.text = ui.Text(history_file=self.history_file, flush_interval=50)
+
+    def setup(self):
+        self.text.write("never flushed\n")
+        self.text.destroy()
+        self.text.write("written after destroy\n")
+        # wait longer than flush_interval
+        self.bind_timer_event(100, "<<quit>>", command=self.quit)
+
+
+def test_text_destroy_cancels_flush(tmp_path):
+    """Destroying a Text should cancel its pending flush and not reopen history_file"""
+    history_file = tmp_path / "history.txt"
+    window = DestroyPendingFlush(history_file)
+    window.run()
+    assert window.text._flush_id is None
+    assert window.text._history is None
+    assert not history_file.exists()
@@ -0,0 +1,89 @@
+"""Test the per-window timer scheduler used by bind_timer_event"""
+
+import guitk as ui
+
+
+class TimerScheduler(ui.Window):
+    def config(self):
+        self.title = "Timers"
+        with ui.VLayout():
+            ui.Label("Timers")
+
+    def setup(self):
+        self.counts = [0] * 20
+        self.timer_ids = [
+            self.bind_timer_event(
+                10, f"<<tick{i}>>", repeat=True, command=lambda i=i: self.tick(i)
+            )
+            for i in range(20)
+        ]
+        self.once_id = self.bind_timer_event(20, "<<once>>")
+        self.bind_timer_event(55, "<<cancel>>", command=self.on_cancel)
+        self.bind_timer_event(150, "<<quit>>", command=self.on_quit)
+
+    def tick(self, i):
+        self.counts[i] += 1
+
+    @ui.on(key="<<once>>")
+    def on_once_event(self, event):
+        self.once_event = event
+
+    def on_cancel(self):
+        for timer_id in self.timer_ids[:10]:
+            self.cancel_timer_event(timer_id)
+        self.cancelled_counts = self.counts[:10]
+
+    def on_quit(self):
+        self.final_counts = list(self.counts)
+        self.active = [timer_id in self._timers for timer_id in self.timer_ids]
+        # cancelling a one-shot timer that already fired does nothing
+        self.cancel_timer_event(self.once_id)
+        self.cancel_errors = []
+        for timer_id in (self.timer_ids[0], "<<nonexistent>>_0"):
+            try:
+                self.cancel_timer_event(timer_id)
+            except ValueError:
+                self.cancel_errors.append(timer_id)
+        self.quit()
+
+
+def test_timer_scheduler():
+    """Timers should fire until cancelled and each get a unique id"""
+    window = TimerScheduler()
+    window.run()
+    assert len(set(window.timer_ids)) == 20
+    assert window.final_counts[:10] == window.cancelled_counts
+    assert min(window.final_counts[10:]) > max(window.cancelled_counts)
+    assert window.active == [False] * 10 + [True] * 10
+    assert window.once_event.key == "<<once>>"
+    assert window.once_event.event_type == ui.EventType.VirtualEvent
+    # cancelling again or cancelling an unknown timer is an error
+    assert window.cancel_errors == [window.timer_ids[0], "<<nonexistent>>_0"]
+
+
+class SharedEventName(ui.Window):
+    def config(self):
+        self.title = "Timers sharing an event name"
+        with ui.VLayout():
+            ui.Label("Timers")
+
+    def setup(self):
+        self.calls = []
+        self.shared_events = []
+        self.bind_timer_event(10, "<<shared>>", command=lambda: self.calls.append("a"))
+        self.bind_timer_event(30, "<<shared>>", command=lambda: self.calls.append("b"))
+        self.bind_timer_event(60, "<<quit>>", command=self.quit)
+
+    @ui.on(key="<<shared>>")
+    def on_shared(self):
+        self.shared_events.append(len(self.calls))
+
+
+def test_timer_shared_event_name():
+    """Each timer's command should only run when that timer fires"""
+    window = SharedEventName()
+    window.run()
+    assert window.calls == ["a", "b"]
+    # handlers bound to the event name run once per timer, before the timer's command
+    assert window.shared_events == [0, 1]
+
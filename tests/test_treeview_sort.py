@@ -0,0 +1,74 @@
+"""Test Treeview.sort_on_column()"""
+
+import time
+
+import guitk as ui
+
+
+class TreeviewSort(ui.Window):
+    def config(self):
+        self.title = "sort_on_column()"
+        with ui.VLayout():
+            ui.Label("sort_on_column()")
+            ui.Treeview(headings=["Name", "Size"], key="tree", vscrollbar=True)
+
+    def setup(self):
+        tree = self["tree"]
+        tree.insert_rows(
+            [(f"file{i}", (i * 7919) % 100_000) for i in range(100_000)],
+            iids=[f"file{i}" for i in range(100_000)],
+        )
+        tree.tree.insert("", "end", iid="extra", values=("file100000", "-1"))
+
+        start = time.perf_counter()
+        tree.sort_on_column("Size", key="numeric")
+        self.elapsed = time.perf_counter() - start
+        self.by_size = tree.tree.get_children("")[:2]
+
+        tree.sort_on_column("Name", key="natural", reverse=True)
+        self.by_name = tree.tree.get_children("")[:2]
+        self.bind_timer_event(10, "<<quit>>", command=self.quit)
+
+
+def test_treeview_sort():
+    """sort_on_column() should sort in Python using typed keys"""
+    window = TreeviewSort()
+    window.run()
+    assert window.by_size == ("extra", "file0")
+    assert window.by_name == ("extra", "file99999")
+    assert window.elapsed < 1.0
+
+
+class TreeviewChanged(ui.Window):
+    def config(self):
+        self.title = "sort_on_column() after changes"
+        with ui.VLayout():
+            ui.Treeview(headings=["Name", "Size"], key="tree")
+
+    def setup(self):
+        tree = self["tree"]
+        tree.insert_rows([("a", 2), ("b", 10), ("c", 3)], iids=["a", "b", "c"])
+        self.sort_values = []
+        tree.sort_on_column(
+            "Size", key=lambda v: self.sort_values.append(v[0]) or v[0]
+        )
+
+        # change the rows directly with the ttk.Treeview
+        tree.tree.item("a", values=("a", 5))
+        tree.tree.set("b", "Size", 0)
+        tree.tree.move("c", "a", 0)
+        tree.tree.insert("", "end", iid="d", values=("d", 1))
+        self.order_after_changes = tree.tree.get_children("")
+        tree.sort_on_column("Size", key="numeric")
+        self.sorted_after_changes = tree.tree.get_children("")
+        self.bind_timer_event(10, "<<quit>>", command=self.quit)
+
+
+def test_treeview_sort_after_changes():
+    """sort_on_column() should compare the strings stored in the tree and see rows
+    changed, moved, or inserted directly with the ttk.Treeview"""
+    window = TreeviewChanged()
+    window.run()
+    assert sorted(window.sort_values) == ["10", "2", "3"]
+    assert window.order_after_changes == ("b", "a", "d")
+    assert window.sorted_after_changes == ("b", "d", "a")
@@ -0,0 +1,78 @@
+"""Test VirtualTreeview"""
+
+import guitk as ui
+
+
+class VirtualTree(ui.Window):
+    def config(self):
+        self.title = "VirtualTreeview"
+        with ui.VLayout():
+            ui.Label("VirtualTreeview")
+            ui.VirtualTreeview(
+                headings=["Name", "Size"],
+                rows=[(f"file{i}", i % 1000) for i in range(500_000)],
+                height=10,
+                key="tree",
+            )
+
+    def setup(self):
+        tree = self["tree"]
+        tree.value = ["0", "499999"]
+        tree.sort_on_column("Size", reverse=True)
+
+    @ui.on(event_type=ui.EventType.WindowFinishedLoading)
+    def on_loaded(self):
+        tree = self["tree"]
+        self.materialized = len(tree.tree.get_children())
+        self.first_size = tree.get_row(tree.row_ids[0])[1]
+        self.model_selection = tree.value
+        tree.see("499999")
+        self.see_selected = "499999" in tree.tree.selection()
+        self.quit()
+
+
+def test_virtual_treeview():
+    """VirtualTreeview should only materialize the visible rows, sort the model, and
+    keep the selection in the model, in display order, for rows that aren't shown"""
+    window = VirtualTree()
+    window.run()
+    assert window.materialized <= 20
+    assert window.first_size == 999
+    assert window.model_selection == ("499999", "0")
+    # rows materialized by see() show their model selection
+    assert window.see_selected
+
+
+def _tree(rows):
+    with ui.VLayout():
+        return ui.VirtualTreeview(headings=["Name", "Size"], rows=rows)
+
+
+def test_virtual_treeview_tuple_model_not_modified():
+    """Appending and deleting rows should work with a tuple model and leave it unchanged"""
+    rows = tuple((f"file{i}", i) for i in range(3))
+    tree = _tree(rows)
+    tree.delete("1")
+    iid = tree.append(("new", 9))
+    assert rows == (("file0", 0), ("file1", 1), ("file2", 2))
+    assert tree.row_ids == ["0", "2", iid]
+    assert tree.get_row(iid) == ("new", 9)
+    assert len(tree) == 3
+
+
+def test_virtual_treeview_default_ids_after_delete():
+    """Default row IDs should not collide with existing rows after a delete"""
+    tree = _tree([("a", 1), ("b", 2), ("c", 3)])
+    tree.delete("0")
+    first = tree.append(("d", 4))
+    second = tree.append(("e", 5))
+    assert len({"1", "2", first, second}) == 4
+    assert tree.row_ids == ["1", "2", first, second]
+
+
+def test_virtual_treeview_sort_appended_rows():
+    """Rows from the model and appended rows should sort together"""
+    tree = _tree((("a", 3), ("b", 1)))
+    iid = tree.append(("c", 2))
+    tree.sort_on_column("Size")
+    assert tree.row_ids == ["1", iid, "0"]
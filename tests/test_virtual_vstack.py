@@ -0,0 +1,41 @@
+"""Test VirtualVStack"""
+
+import guitk as ui
+
+
+class VirtualList(ui.Window):
+    def config(self):
+        self.title = "VirtualVStack"
+        with ui.VLayout():
+            ui.Label("VirtualVStack")
+            self.items = ui.VirtualVStack(
+                data=[f"Line {i}" for i in range(50_000)],
+                row_height=20,
+                height=200,
+                overscan=2,
+                key="items",
+            )
+
+    @ui.on(event_type=ui.EventType.WindowFinishedLoading)
+    def on_scroll(self):
+        self.items.scroll_to(25_000)
+        self.bind_timer_event(50, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self.row_count = self.items._row_count
+        self.first_row = min(self.items._rows_by_index)
+        self.row_label = self.items._rows_by_index[25_000]
+        self.label_value = self.row_label.value
+        self.label_index = self.items.item_index(self.row_label)
+        self.quit()
+
+
+def test_virtual_vstack():
+    """VirtualVStack should create only the visible rows plus overscan and recycle
+    them to show the data at their new index when scrolled"""
+    window = VirtualList()
+    window.run()
+    assert window.row_count <= 11 + 2 * 2
+    assert window.first_row == 24_998
+    assert window.label_value == "Line 25000"
+    assert window.label_index == 25_000
@@ -0,0 +1,43 @@
+"""Test the Window's keyed widget registry"""
+
+import guitk as ui
+
+
+class WidgetRegistry(ui.Window):
+    def config(self):
+        self.title = "Widget registry"
+        with ui.VLayout():
+            ui.Label("Widget registry")
+            with ui.VStack(key="stack") as self.stack:
+                for i in range(500):
+                    ui.Label(f"Row {i}", key=f"row_{i}")
+                with ui.HStack(key="nested"):
+                    ui.Label("Nested", key="nested_label")
+                    ui.Button("Nested button", key="nested_button")
+
+    def setup(self):
+        self.remove("row_250")
+        self.stack.remove(self["row_10"])
+        self.remove("nested")
+        self.bind_timer_event(10, "<<quit>>", command=self.on_quit)
+
+    def on_quit(self):
+        self.length = len(self.stack)
+        self.keys = {widget.key for widget in self.widgets}
+        self.last_is_row_499 = self["row_499"] is self.stack[-1]
+        self.stack_children = self._widgets.children(self.stack)
+        self.labels = self._widgets.of_type(ui.Label)
+        self.quit()
+
+
+def test_widget_registry():
+    """remove() should find widgets by key or identity and forget nested widgets, and
+    the registry should return the remaining widgets by parent and type"""
+    window = WidgetRegistry()
+    window.run()
+    assert window.length == 498
+    assert window.last_is_row_499
+    assert {"row_10", "row_250", "nested", "nested_label", "nested_button"}.isdisjoint(window.keys)
+    assert len(window.stack_children) == 498
+    # 498 rows plus the title label
+    assert len(window.labels) == 499